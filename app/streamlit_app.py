@@ -19,6 +19,8 @@ sys.path.append(str(Path(__file__).parent.parent / "src"))
 
 from config import *
 from visualization import GTMVisualizer
+from regional_pricing import RegionalPricingEngine
+from feature_matrix import FeatureMatrix
 
 # Page configuration
 st.set_page_config(
@@ -85,6 +87,11 @@ def get_visualizer():
 viz = get_visualizer()
 
 
+@st.cache_resource
+def get_regional_pricing():
+    return RegionalPricingEngine()
+
+
 # Load data
 @st.cache_data
 def load_data():
@@ -93,7 +100,9 @@ def load_data():
         data["competitors"] = pd.read_csv(
             PROCESSED_DATA_DIR / "competitive_overview.csv"
         )
-        data["features"] = pd.read_csv(PROCESSED_DATA_DIR / "feature_matrix.csv")
+        data["features"] = FeatureMatrix.load_or_build(
+            PROCESSED_DATA_DIR / "feature_matrix.npz"
+        )
         data["positioning"] = pd.read_csv(PROCESSED_DATA_DIR / "positioning_data.csv")
         data["swot"] = pd.read_csv(PROCESSED_DATA_DIR / "swot_analysis.csv")
         data["financial"] = pd.read_csv(
@@ -547,7 +556,9 @@ elif selected_page == "Competitive Analysis":
     ].copy()
     comp_display.columns = ["Product", "Positioning", "Users", "Min Price", "Funding"]
     comp_display["Users"] = comp_display["Users"].apply(lambda x: f"{x:,}")
-    comp_display["Min Price"] = comp_display["Min Price"].apply(lambda x: f"${x}/mo")
+    comp_display["Min Price"] = comp_display["Min Price"].apply(
+        lambda x: f"${x:.2f}/mo" if pd.notna(x) else "Custom"
+    )
     comp_display["Funding"] = comp_display["Funding"].apply(
         lambda x: f"${x/1_000_000:.1f}M" if x > 0 else "Bootstrapped"
     )
@@ -751,19 +762,21 @@ elif selected_page == "Pricing Strategy":
 
     #    st.markdown("---")
 
-    st.markdown("")
-    st.markdown(
-        """
+    india = get_regional_pricing().lookup("IN", "pro")
+    if india is not None:
+        st.markdown("")
+        st.markdown(
+            f"""
     <div class="insight-box">
-        <h3>🌏 Regional Pricing Strategy (India)</h3>
+        <h3>🌏 Regional Pricing Strategy ({india['country']})</h3>
         <p><strong>Purchasing Power Parity (PPP) Adjustment:</strong></p>
         <p>To capture the large Indian academic market, we will offer a localized price of 
-        <strong>₹499/month</strong> (vs $15 global). This lowers the barrier to entry while 
+        <strong>{india['currency']} {india['local_price']:,.0f}/month</strong> (vs ${PRICING_TIERS['pro']['price_monthly']} global). This lowers the barrier to entry while 
         building a massive user base in our beachhead segment.</p>
     </div>
     """,
-        unsafe_allow_html=True,
-    )
+            unsafe_allow_html=True,
+        )
 
     # Unit Economics
     st.markdown("")
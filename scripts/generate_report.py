@@ -15,6 +15,7 @@ from market_sizer import MarketSizer
 from pricing_strategy import PricingStrategy
 from gtm_planner import GTMPlanner
 from financial_model import FinancialModel
+from feature_matrix import FeatureMatrix
 from config import *
 
 
@@ -50,7 +51,9 @@ def main():
     # Load data
     print("Loading data...")
     competitors_df = pd.read_csv(PROCESSED_DATA_DIR / "competitive_overview.csv")
-    features_matrix = pd.read_csv(PROCESSED_DATA_DIR / "feature_matrix.csv")
+    features_matrix = FeatureMatrix.load_or_build(
+        PROCESSED_DATA_DIR / "feature_matrix.npz"
+    )
     positioning = pd.read_csv(PROCESSED_DATA_DIR / "positioning_data.csv")
     financial = pd.read_csv(PROCESSED_DATA_DIR / "financial_projections_24m.csv")
 
@@ -14,6 +14,7 @@ from data_collector import CompetitiveDataCollector
 from competitive_analyzer import CompetitiveAnalyzer
 from market_sizer import MarketSizer
 from pricing_strategy import PricingStrategy
+from feature_matrix import FeatureMatrix
 from gtm_planner import GTMPlanner
 from financial_model import FinancialModel
 from visualization import GTMVisualizer
@@ -55,7 +56,7 @@ def main():
     print_banner("STEP 2: COMPETITIVE ANALYSIS")
 
     competitors_df = pd.read_csv(PROCESSED_DATA_DIR / "competitive_overview.csv")
-    features_matrix = pd.read_csv(PROCESSED_DATA_DIR / "feature_matrix.csv")
+    features_matrix = FeatureMatrix.load(PROCESSED_DATA_DIR / "feature_matrix.npz")
 
     analyzer = CompetitiveAnalyzer(competitors_df, features_matrix)
 
@@ -81,6 +82,9 @@ def main():
     ) as f:
         f.write(summary)
 
+    print("Recording landscape snapshot...")
+    analyzer.record_snapshot()
+
     print("\n✅ Competitive analysis complete!")
 
     # Step 3: Market Sizing
@@ -123,6 +127,10 @@ def main():
     print("Validating unit economics...")
     strategy.validate_unit_economics()
 
+    print("Localizing regional prices...")
+    strategy.localize_prices()
+    strategy.regional_pricing.save()
+
     print("Generating recommendation...")
     pricing_report = strategy.generate_pricing_recommendation()
     with open(
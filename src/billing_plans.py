@@ -0,0 +1,211 @@
+"""
+Billing Plan Cash-Flow Model
+Cash receipts, deferred revenue and effective ARPU for plan mixes
+"""
+
+import pandas as pd
+import numpy as np
+from typing import Dict, List, Optional, Sequence
+from config import *
+
+
+class BillingPlanModeler:
+    """
+    Simulates monthly, annual-prepay and promo plan mixes per cohort,
+    vectorized over configurations x months x cohorts
+    """
+
+    def __init__(self, billing_config: Dict = None, pricing_tiers: Dict = None):
+        self.config = billing_config or BILLING_PLANS
+        pricing_tiers = pricing_tiers or PRICING_TIERS
+
+        tier = pricing_tiers[self.config["tier"]]
+        self.monthly_price = tier["price_monthly"]
+        self.default_annual_discount = 1 - tier.get(
+            "price_annual", self.monthly_price * 12
+        ) / (self.monthly_price * 12)
+
+        plans = self.config["plans"]
+        self.plans = list(plans.keys())
+        self.term_months = np.array([plans[p]["term_months"] for p in self.plans])
+        self.free_months = np.array([plans[p]["free_months"] for p in self.plans])
+        self.churn_multiplier = np.array(
+            [plans[p]["churn_multiplier"] for p in self.plans], dtype=np.float64
+        )
+
+    def plan_grid(
+        self,
+        annual_discounts: Sequence[float],
+        annual_shares: Sequence[float],
+        promo_shares: Sequence[float] = (0.0,),
+    ) -> pd.DataFrame:
+        """
+        Every combination of annual discount and plan mix (monthly fills the rest)
+        """
+        discount, annual, promo = np.meshgrid(
+            annual_discounts, annual_shares, promo_shares, indexing="ij"
+        )
+        grid = pd.DataFrame(
+            {
+                "annual_discount": discount.ravel(),
+                "mix_annual": annual.ravel(),
+                "mix_promo": promo.ravel(),
+            }
+        )
+        grid["mix_monthly"] = 1 - grid["mix_annual"] - grid["mix_promo"]
+        return grid[grid["mix_monthly"] >= -1e-12].reset_index(drop=True)
+
+    def _default_configs(self) -> pd.DataFrame:
+        mix = self.config["default_mix"]
+        return pd.DataFrame(
+            [
+                {
+                    "annual_discount": self.default_annual_discount,
+                    **{f"mix_{p}": mix.get(p, 0.0) for p in self.plans},
+                }
+            ]
+        )
+
+    def _plan_curves(self, configs: pd.DataFrame, months: int) -> Dict:
+        """
+        Per-subscriber curves by configuration, plan and age in months
+
+        Subscribers on an n-month term can only leave at renewal, so
+        survival steps down once per term by (1 - churn) ** n. Charges fall
+        at the start of each term after any free months.
+        """
+        n_configs = len(configs)
+        age = np.arange(months)[None, None, :]
+        term = self.term_months[None, :, None]
+        free = self.free_months[None, :, None]
+
+        churn = np.clip(
+            self.config["base_monthly_churn"] * self.churn_multiplier, 0, 1
+        )[None, :, None]
+        churn = np.broadcast_to(churn, (n_configs, len(self.plans), 1))
+
+        # Term price per configuration and plan: (configs, plans, 1)
+        discount = configs["annual_discount"].to_numpy(np.float64)[:, None, None]
+        term_price = np.where(
+            term > 1, self.monthly_price * term * (1 - discount), self.monthly_price
+        )
+
+        # Churn monthly through free months, then only at term boundaries
+        billed_age = age - free
+        exposure = np.where(
+            billed_age < 0, age, free + term * (np.maximum(billed_age, 0) // term)
+        )
+        survival = (1 - churn) ** exposure
+
+        charge = (billed_age >= 0) & (billed_age % term == 0)
+        cash = np.where(charge, term_price, 0.0) * survival
+        revenue = np.where(billed_age >= 0, term_price / term, 0.0) * survival
+
+        return {"active": survival, "cash": cash, "revenue": revenue}
+
+    def simulate(
+        self,
+        new_subscribers,
+        configs: Optional[pd.DataFrame] = None,
+        months: int = None,
+        keep_cohorts: bool = False,
+    ) -> Dict:
+        """
+        Cash, recognized revenue and deferred revenue for each configuration
+
+        Args:
+            new_subscribers: New paying subscribers per cohort month, shape
+                (n_cohorts,) or (n_configs, n_cohorts)
+            configs: Rows with annual_discount and mix_<plan> columns (default:
+                the configured mix at the PRICING_TIERS annual discount)
+            months: Horizon (default: number of cohorts)
+            keep_cohorts: Also return the (configs, months, cohorts) cubes
+        """
+        configs = self._default_configs() if configs is None else configs
+        new_subscribers = np.atleast_2d(np.asarray(new_subscribers, dtype=np.float64))
+        n_cohorts = new_subscribers.shape[1]
+        months = months or n_cohorts
+
+        mix = np.stack(
+            [configs.get(f"mix_{p}", 0.0) * np.ones(len(configs)) for p in self.plans],
+            axis=1,
+        )
+        curves = self._plan_curves(configs, months)
+
+        # Age of cohort k in month t, masked before the cohort starts
+        age = np.arange(months)[:, None] - np.arange(n_cohorts)[None, :]
+        started = age >= 0
+        age = np.where(started, age, 0)
+
+        result = {"configs": configs.reset_index(drop=True), "plans": self.plans}
+        for metric, curve in curves.items():
+            # Blend plans by mix first: (configs, ages)
+            blended = np.einsum("cp,cpa->ca", mix, curve)
+            cube = blended[:, age] * started * new_subscribers[:, None, :]
+            result[metric] = cube.sum(axis=2)
+            if keep_cohorts:
+                result[f"{metric}_by_cohort"] = cube
+
+        result["deferred_revenue"] = np.cumsum(result["cash"], axis=1) - np.cumsum(
+            result["revenue"], axis=1
+        )
+        return result
+
+    def compare(
+        self,
+        new_subscribers,
+        configs: Optional[pd.DataFrame] = None,
+        months: int = None,
+    ) -> pd.DataFrame:
+        """
+        One summary row per configuration (totals over the horizon)
+        """
+        sim = self.simulate(new_subscribers, configs, months)
+        summary = sim["configs"].copy()
+
+        active_months = sim["active"].sum(axis=1)
+        summary["total_cash"] = sim["cash"].sum(axis=1)
+        summary["total_revenue"] = sim["revenue"].sum(axis=1)
+        summary["ending_deferred_revenue"] = sim["deferred_revenue"][:, -1]
+        summary["ending_subscribers"] = sim["active"][:, -1]
+        summary["effective_arpu"] = np.divide(
+            summary["total_revenue"],
+            active_months,
+            out=np.zeros(len(summary)),
+            where=active_months > 0,
+        )
+        summary["cash_to_revenue"] = summary["total_cash"] / summary["total_revenue"]
+
+        return summary
+
+    def monthly_frame(self, simulation: Dict, config_index: int = 0) -> pd.DataFrame:
+        """
+        Month-by-month cash view for one configuration
+        """
+        return pd.DataFrame(
+            {
+                "month": np.arange(1, simulation["cash"].shape[1] + 1),
+                "active_subscribers": simulation["active"][config_index],
+                "cash_receipts": simulation["cash"][config_index],
+                "recognized_revenue": simulation["revenue"][config_index],
+                "deferred_revenue": simulation["deferred_revenue"][config_index],
+            }
+        )
+
+
+if __name__ == "__main__":
+    print("=" * 80)
+    print(" BILLING PLAN CASH-FLOW MODEL")
+    print("=" * 80)
+    print()
+
+    modeler = BillingPlanModeler()
+    cohorts = np.full(24, 500)
+
+    grid = modeler.plan_grid(
+        annual_discounts=np.linspace(0.10, 0.35, 6),
+        annual_shares=np.linspace(0.0, 0.6, 7),
+        promo_shares=[0.0, 0.05],
+    )
+    comparison = modeler.compare(cohorts, grid)
+    print(comparison.sort_values("total_revenue", ascending=False).head(10).to_string())
@@ -0,0 +1,179 @@
+"""
+Chunked Table I/O
+Stream row batches to CSV (appended chunks) or Parquet (row groups) and
+read them back chunk by chunk
+"""
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, List, Optional, Union
+from config import *
+
+FORMATS = ("csv", "parquet")
+
+
+def _file_format(path: Path, file_format: Optional[str]) -> str:
+    file_format = file_format or path.suffix.lstrip(".")
+    if file_format not in FORMATS:
+        raise ValueError(f"Unknown file format: {file_format} (use one of {FORMATS})")
+    return file_format
+
+
+class ChunkedTableWriter:
+    """
+    Appends DataFrame chunks to one file without holding earlier chunks
+
+    Chunks go to a ".partial" sibling that replaces the target on close, so
+    readers never see a half-written file. Parquet chunks must share the
+    first chunk's schema; each becomes one row group.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        file_format: str = None,
+        progress: Callable[[int], None] = None,
+    ):
+        """
+        Args:
+            file_format: "csv" or "parquet" (default: from the file suffix)
+            progress: Called with the total rows written after every chunk
+        """
+        self.path = Path(path)
+        self.file_format = _file_format(self.path, file_format)
+        self.progress = progress
+        self.partial_path = self.path.with_name(self.path.name + ".partial")
+        self.rows = 0
+        self.chunks = 0
+        self._parquet = None
+        self._schema = None
+
+    def write(self, chunk: pd.DataFrame):
+        """
+        Append one chunk
+        """
+        if self.file_format == "csv":
+            chunk.to_csv(
+                self.partial_path,
+                mode="w" if self.chunks == 0 else "a",
+                header=self.chunks == 0,
+                index=False,
+            )
+        else:
+            table = pa.Table.from_pandas(
+                chunk, schema=self._schema, preserve_index=False
+            )
+            if self._parquet is None:
+                self._schema = table.schema
+                self._parquet = pq.ParquetWriter(self.partial_path, self._schema)
+            self._parquet.write_table(table)
+
+        self.rows += len(chunk)
+        self.chunks += 1
+        if self.progress is not None:
+            self.progress(self.rows)
+
+    def close(self):
+        """
+        Finish the file and move it into place (nothing is written for an
+        empty stream)
+        """
+        if self._parquet is not None:
+            self._parquet.close()
+            self._parquet = None
+        if self.chunks:
+            self.partial_path.replace(self.path)
+
+    def abort(self):
+        """
+        Drop a partially written file
+        """
+        if self._parquet is not None:
+            self._parquet.close()
+            self._parquet = None
+        self.partial_path.unlink(missing_ok=True)
+
+    def __enter__(self) -> "ChunkedTableWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def write_batches(
+    batches: Iterable[pd.DataFrame],
+    path: Union[str, Path],
+    progress: Callable[[int], None] = None,
+    file_format: str = None,
+) -> int:
+    """
+    Write a stream of batches to one file; returns the rows written
+
+    Only the current batch is held in memory.
+    """
+    with ChunkedTableWriter(path, file_format, progress) as writer:
+        for batch in batches:
+            writer.write(batch)
+    return writer.rows
+
+
+def read_chunks(
+    path: Union[str, Path],
+    chunksize: int = 500_000,
+    columns: List[str] = None,
+    file_format: str = None,
+    **read_csv_kwargs,
+) -> Iterator[pd.DataFrame]:
+    """
+    Read a CSV or Parquet file as DataFrames of at most chunksize rows
+
+    Args:
+        columns: Subset of columns to load
+        **read_csv_kwargs: Passed to pd.read_csv (e.g. parse_dates)
+    """
+    path = Path(path)
+    if _file_format(path, file_format) == "csv":
+        with pd.read_csv(
+            path, chunksize=chunksize, usecols=columns, **read_csv_kwargs
+        ) as reader:
+            yield from reader
+    else:
+        for batch in pq.ParquetFile(path).iter_batches(chunksize, columns=columns):
+            yield batch.to_pandas()
+
+
+if __name__ == "__main__":
+    import time
+    import tracemalloc
+    from data_collector import CompetitiveDataCollector
+
+    print("=" * 80)
+    print(" CHUNKED TABLE I/O")
+    print("=" * 80)
+    print()
+
+    # Scale check: 10M reviews to Parquet with one batch in memory at a time
+    collector = CompetitiveDataCollector()
+    path = SYNTHETIC_DATA_DIR / "user_reviews_10m.parquet"
+    tracemalloc.start()
+    start = time.perf_counter()
+    rows = write_batches(
+        collector.iter_review_batches(10_000, n_competitors=1000), path
+    )
+    _, peak = tracemalloc.get_traced_memory()
+    print(
+        f"Wrote {rows:,} reviews in {time.perf_counter() - start:.1f}s "
+        f"(peak {peak / 1e6:.0f} MB)"
+    )
+
+    counts = {}
+    for chunk in read_chunks(path, columns=["sentiment"]):
+        for sentiment, n in chunk["sentiment"].value_counts().items():
+            counts[sentiment] = counts.get(sentiment, 0) + n
+    print(f"Sentiment counts: {counts}")
+    path.unlink()
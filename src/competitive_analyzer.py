@@ -3,80 +3,292 @@ Competitive Analysis Engine
 Analyzes competitive landscape and identifies white space
 """
 
+import functools
+import hashlib
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 from config import *
+from feature_matrix import FeatureMatrix
+from positioning_engine import PositioningEngine
+from white_space import WhiteSpaceEngine
+from competitive_scoring import CompetitiveScorer
+from skyline import CompetitiveSkyline
+from price_index import PriceIndex
+from similarity import SimilarityIndex, build_vectors
+from clustering import StrategicGroups
+from snapshot_store import LandscapeSnapshotStore
+from positioning_robustness import PositioningRobustness
+from swot_knowledge_base import SwotKnowledgeBase, COLUMNS as SWOT_COLUMNS
+
+
+def input_fingerprint(data) -> str:
+    """
+    Content hash of a DataFrame or FeatureMatrix (values, labels, dtypes)
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    if isinstance(data, FeatureMatrix):
+        digest.update(data.values.tobytes())
+        digest.update("\x1f".join(data.competitors + data.features).encode())
+        digest.update(data.source_dtype.str.encode())
+    else:
+        digest.update(pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes())
+        digest.update(repr(list(data.columns)).encode())
+        digest.update(repr([str(t) for t in data.dtypes]).encode())
+    return digest.hexdigest()
+
+
+def _pins_inputs(method):
+    """
+    Hash the analyzer inputs once per public call; nested calls, property
+    reads and memo checks inside it reuse that fingerprint
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self._pinned_inputs is not None:
+            return method(self, *args, **kwargs)
+        self._pinned_inputs = self._input_key()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._pinned_inputs = None
+
+    return wrapper
+
+
+def _artifact(name: str, doc: str) -> property:
+    """
+    Attribute backed by the analyzer's memo table (None when stale)
+    """
+
+    @_pins_inputs
+    def get(self):
+        return self._memo_value(name)
+
+    @_pins_inputs
+    def set(self, value):
+        self._memo_put(name, value, "assigned")
+
+    return property(get, set, doc=doc)
 
 
 class CompetitiveAnalyzer:
     """
     Performs comprehensive competitive analysis
+
+    Computed artifacts live in a versioned memo table keyed by content
+    hashes of competitors_df and features_matrix. An entry is reused while
+    the inputs, its arguments and the versions of the artifacts it was
+    built from are unchanged, and is ignored (recomputed) otherwise.
     """
 
-    def __init__(self, competitors_df: pd.DataFrame, features_matrix: pd.DataFrame):
+    # Artifact -> artifacts it is derived from
+    DEPENDENCIES = {
+        "positioning": (),
+        "white_space": ("positioning",),
+        "feature_gaps": (),
+        "swot": (),
+        "rank_stability": (),
+        "dominance": (),
+        "similar_competitors": ("positioning",),
+        "strategic_groups": ("positioning",),
+        "robustness": ("positioning",),
+    }
+
+    positioning_data = _artifact("positioning", "Positioning coordinates")
+    swot_analysis = _artifact("swot", "SWOT factors")
+    rank_stability = _artifact("rank_stability", "Rank stability table")
+    dominance = _artifact("dominance", "Pareto dominance counts")
+    similar_competitors = _artifact("similar_competitors", "Nearest competitors")
+    strategic_groups = _artifact("strategic_groups", "Strategic group labels")
+    robustness = _artifact("robustness", "Positioning robustness draws")
+
+    def __init__(self, competitors_df: pd.DataFrame, features_matrix):
+        """
+        Args:
+            competitors_df: Competitive overview
+            features_matrix: FeatureMatrix, or the long-format feature frame
+        """
         self.competitors_df = competitors_df
         self.features_matrix = features_matrix
-        self.positioning_data = None
-        self.swot_analysis = None
+        self._memo = {}
+        self._memo_counter = 0
+        self._pinned_inputs = None
+        self.positioning_engine = None
+        self.white_space_engine = None
+        self.skyline = None
+        self.group_model = None
+        self._similarity_index = None
+        self._similarity_key = None
+        self._feature_store = None
+        self.swot_knowledge_base = SwotKnowledgeBase()
+        self._feature_store_key = None
+
+    def _input_key(self) -> Tuple[str, str]:
+        if self._pinned_inputs is not None:
+            return self._pinned_inputs
+        return (
+            input_fingerprint(self.competitors_df),
+            input_fingerprint(self.features_matrix),
+        )
+
+    def _memo_entry(self, name: str, inputs: Tuple = None) -> Optional[Dict]:
+        """
+        Memo entry if still valid: same inputs and same dependency versions
+        """
+        entry = self._memo.get(name)
+        if entry is None:
+            return None
+        inputs = inputs or self._input_key()
+        if entry["inputs"] != inputs:
+            return None
+        for dependency, version in entry["depends_on"].items():
+            current = self._memo_entry(dependency, inputs)
+            if current is None or current["version"] != version:
+                return None
+        return entry
+
+    def _memo_value(self, name: str, inputs: Tuple = None):
+        entry = self._memo_entry(name, inputs or self._input_key())
+        return None if entry is None else entry["value"]
+
+    def _memo_get(self, name: str, args: Tuple = (), inputs: Tuple = None):
+        """
+        Cached value for these arguments, or None
+        """
+        entry = self._memo_entry(name, inputs or self._input_key())
+        if entry is None or entry["args"] != args:
+            return None
+        return entry["value"]
+
+    def _memo_put(self, name: str, value, args: Tuple = (), inputs: Tuple = None):
+        """
+        Store an artifact under the current inputs with a new version
+        """
+        if value is None:
+            self._memo.pop(name, None)
+            return None
+
+        inputs = inputs or self._input_key()
+        depends_on = {}
+        for dependency in self.DEPENDENCIES[name]:
+            entry = self._memo_entry(dependency, inputs)
+            depends_on[dependency] = None if entry is None else entry["version"]
+
+        self._memo_counter += 1
+        self._memo[name] = {
+            "inputs": inputs,
+            "args": args,
+            "depends_on": depends_on,
+            "version": self._memo_counter,
+            "value": value,
+        }
+        return value
+
+    @_pins_inputs
+    def memo_status(self) -> pd.DataFrame:
+        """
+        Memo table overview: version and validity of each artifact
+        """
+        inputs = self._input_key()
+        return pd.DataFrame(
+            [
+                {
+                    "artifact": name,
+                    "version": entry["version"],
+                    "args": entry["args"],
+                    "valid": self._memo_entry(name, inputs) is not None,
+                }
+                for name, entry in self._memo.items()
+            ],
+            columns=["artifact", "version", "args", "valid"],
+        )
 
-    def calculate_positioning_coordinates(self) -> pd.DataFrame:
+    @_pins_inputs
+    def calculate_positioning_coordinates(
+        self, use_anchors: bool = True
+    ) -> pd.DataFrame:
         """
         Calculate positioning on specialization vs user type axes
+
+        Coordinates are projected from feature vectors by a PositioningEngine
+        fitted on POSITIONING_ANCHORS; products without an anchor (e.g. new
+        competitors in the feature store) get their projected position.
+
+        Args:
+            use_anchors: Keep the analyst coordinates for anchored products
+                (False = projected coordinates for every product)
         """
+        cached = self._memo_get("positioning", (use_anchors,))
+        if cached is not None:
+            return cached
+
         print("📍 Calculating positioning coordinates...")
 
-        positioning_scores = {
-            "notion_ai": {"x": 2.0, "y": 7.0, "label": "Horizontal Platform\n(Teams)"},
-            "mem_ai": {"x": 4.5, "y": 3.0, "label": "AI-first Notes\n(Individual)"},
-            "reflect": {"x": 3.0, "y": 2.0, "label": "Networked Notes\n(Individual)"},
-            "obsidian": {"x": 5.0, "y": 1.5, "label": "Local-first\n(Power Users)"},
-            "roam": {"x": 5.5, "y": 4.0, "label": "Networked Thought\n(Individual+)"},
-            "napkin_ai": {"x": 7.0, "y": 2.0, "label": "Visual AI\n(Visual Thinkers)"},
-            "recall": {"x": 6.5, "y": 2.5, "label": "Knowledge Graph\n(Learners)"},
-            "our_product": {
-                "x": OUR_POSITIONING["x"],
-                "y": OUR_POSITIONING["y"],
-                "label": "Research Synthesis\n(Academics)",
-            },
-        }
+        self.positioning_engine = PositioningEngine()
+        inputs = self.positioning_engine.build_inputs(
+            self.feature_store, self.competitors_df
+        )
+        projected = self.positioning_engine.fit(inputs).project(inputs)
 
-        positioning_list = []
-        for comp_id, coords in positioning_scores.items():
-            comp_data = self.competitors_df[
-                self.competitors_df["competitor_id"] == comp_id
-            ]
+        overview = self.competitors_df.set_index("competitor_id")
+        anchored = list(POSITIONING_ANCHORS)
+        others = [c for c in projected.index if c not in POSITIONING_ANCHORS]
 
-            if len(comp_data) > 0:
-                name = comp_data.iloc[0]["name"]
+        positioning_list = []
+        for comp_id in anchored + others:
+            anchor = POSITIONING_ANCHORS.get(comp_id)
+            if comp_id in overview.index:
+                name = overview.loc[comp_id, "name"]
+                label = overview.loc[comp_id, "positioning"]
             else:
                 name = "ResearchFlow AI"
+                label = name
+
+            if anchor is not None and (use_anchors or comp_id not in projected.index):
+                x, y, label = anchor["x"], anchor["y"], anchor["label"]
+            else:
+                x, y = projected.loc[comp_id]
+                label = anchor["label"] if anchor is not None else label
 
             positioning_list.append(
                 {
                     "competitor_id": comp_id,
                     "name": name,
-                    "x_specialization": coords["x"],
-                    "y_user_type": coords["y"],
-                    "label": coords["label"],
+                    "x_specialization": x,
+                    "y_user_type": y,
+                    "label": label,
                     "is_our_product": comp_id == "our_product",
                 }
             )
 
-        self.positioning_data = pd.DataFrame(positioning_list)
+        positioning = self._memo_put(
+            "positioning", pd.DataFrame(positioning_list), (use_anchors,)
+        )
 
-        print(f"✅ Calculated positioning for {len(self.positioning_data)} products")
-        return self.positioning_data
+        print(f"✅ Calculated positioning for {len(positioning)} products")
+        return positioning
 
-    def identify_white_space(self) -> Dict:
+    @_pins_inputs
+    def identify_white_space(self, resolution: Optional[int] = None) -> Dict:
         """
         Identify market white space opportunities
-        """
-        print("🔍 Identifying white space...")
 
+        Args:
+            resolution: Also bin the plane into resolution x resolution cells
+                and report empty rectangles, the largest empty circle and
+                ranked candidate positions under "grid"
+        """
         if self.positioning_data is None:
             self.calculate_positioning_coordinates()
 
+        cached = self._memo_get("white_space", (resolution,))
+        if cached is not None:
+            return cached
+
+        print("🔍 Identifying white space...")
+
         # Define market quadrants
         quadrants = {
             "generalist_individual": {
@@ -105,21 +317,14 @@ class CompetitiveAnalyzer:
             },
         }
 
-        # Count competitors in each quadrant
+        # Count competitors in each quadrant (2 x 2 grid of the engine)
+        self.white_space_engine = WhiteSpaceEngine()
+        counts = self.white_space_engine.quadrant_counts(self.positioning_data)
         for quadrant_id, quadrant in quadrants.items():
-            x_min, x_max = quadrant["x_range"]
-            y_min, y_max = quadrant["y_range"]
-
-            in_quadrant = self.positioning_data[
-                (self.positioning_data["x_specialization"] >= x_min)
-                & (self.positioning_data["x_specialization"] < x_max)
-                & (self.positioning_data["y_user_type"] >= y_min)
-                & (self.positioning_data["y_user_type"] < y_max)
-            ]
-
-            quadrant["competitor_count"] = len(in_quadrant)
-            quadrant["competitors"] = in_quadrant["name"].tolist()
+            quadrant.update(counts[quadrant_id])
 
+        x = self.positioning_data["x_specialization"].to_numpy()
+        y = self.positioning_data["y_user_type"].to_numpy()
         white_space_analysis = {
             "quadrants": quadrants,
             "recommended_position": {
@@ -129,23 +334,18 @@ class CompetitiveAnalyzer:
                 "y": OUR_POSITIONING["y"],
             },
             "competitive_density": {
-                "generalist": len(
-                    self.positioning_data[self.positioning_data["x_specialization"] < 5]
-                ),
-                "specialist": len(
-                    self.positioning_data[
-                        self.positioning_data["x_specialization"] >= 5
-                    ]
-                ),
-                "individual": len(
-                    self.positioning_data[self.positioning_data["y_user_type"] < 5]
-                ),
-                "team": len(
-                    self.positioning_data[self.positioning_data["y_user_type"] >= 5]
-                ),
+                "generalist": int((x < 5).sum()),
+                "specialist": int((x >= 5).sum()),
+                "individual": int((y < 5).sum()),
+                "team": int((y >= 5).sum()),
             },
         }
 
+        if resolution is not None:
+            white_space_analysis["grid"] = self.white_space_engine.analyze(
+                self.positioning_data, resolution
+            )
+
         print("✅ White space analysis complete")
         print(
             f"   Specialist Individual quadrant: {quadrants['specialist_individual']['competitor_count']} competitors"
@@ -154,274 +354,328 @@ class CompetitiveAnalyzer:
             f"   Generalist Individual quadrant: {quadrants['generalist_individual']['competitor_count']} competitors"
         )
 
-        return white_space_analysis
+        return self._memo_put("white_space", white_space_analysis, (resolution,))
 
-    def perform_swot_analysis(self) -> pd.DataFrame:
+    @_pins_inputs
+    def perform_swot_analysis(
+        self,
+        competitor_ids: List[str] = None,
+        knowledge_base: SwotKnowledgeBase = None,
+    ) -> pd.DataFrame:
         """
         SWOT analysis for each major competitor
+
+        Args:
+            competitor_ids: Products to include (default: all in the
+                knowledge base)
+            knowledge_base: SWOT factor store (default: SWOT_KNOWLEDGE_BASE)
         """
+        if knowledge_base is not None:
+            self.swot_knowledge_base = knowledge_base
+        knowledge_base = self.swot_knowledge_base
+        knowledge_base.table  # (re)loads when the file changed
+        args = (
+            knowledge_base.source_key,
+            None if competitor_ids is None else tuple(competitor_ids),
+        )
+        cached = self._memo_get("swot", args)
+        if cached is not None:
+            return cached
+
         print("📊 Performing SWOT analysis...")
 
-        swot_data = []
+        factors = knowledge_base.filter(competitor_id=competitor_ids)
+        swot_analysis = self._memo_put("swot", factors[SWOT_COLUMNS], args)
 
-        # Notion AI
-        swot_data.append(
-            {
-                "competitor_id": "notion_ai",
-                "name": "Notion AI",
-                "category": "Strengths",
-                "factor": "Massive distribution (30M users)",
-                "impact": "High",
-                "implications": "Can cross-sell AI to existing base",
-            }
-        )
-        swot_data.append(
-            {
-                "competitor_id": "notion_ai",
-                "name": "Notion AI",
-                "category": "Strengths",
-                "factor": "Strong collaboration features",
-                "impact": "High",
-                "implications": "Dominates team use cases",
-            }
-        )
-        swot_data.append(
-            {
-                "competitor_id": "notion_ai",
-                "name": "Notion AI",
-                "category": "Weaknesses",
-                "factor": "Generalist platform (not specialized)",
-                "impact": "Medium",
-                "implications": "Vulnerable to vertical specialists",
-            }
-        )
-        swot_data.append(
-            {
-                "competitor_id": "notion_ai",
-                "name": "Notion AI",
-                "category": "Weaknesses",
-                "factor": "AI feels bolted-on to existing UX",
-                "impact": "Medium",
-                "implications": "Not AI-native experience",
-            }
-        )
-        swot_data.append(
-            {
-                "competitor_id": "notion_ai",
-                "name": "Notion AI",
-                "category": "Opportunities",
-                "factor": "Expand to enterprise (Notion Enterprise)",
-                "impact": "High",
-                "implications": "Upmarket move opens space below",
-            }
-        )
-        swot_data.append(
-            {
-                "competitor_id": "notion_ai",
-                "name": "Notion AI",
-                "category": "Threats",
-                "factor": "Microsoft Loop (with Copilot)",
-                "impact": "High",
-                "implications": "Office 365 bundle threat",
-            }
+        print(f"✅ SWOT analysis complete: {len(swot_analysis)} factors analyzed")
+        return swot_analysis
+
+    @property
+    @_pins_inputs
+    def feature_store(self) -> FeatureMatrix:
+        """
+        Dense feature store (rebuilt when features_matrix content changes)
+        """
+        key = self._input_key()[1]
+        if self._feature_store_key != key:
+            features = self.features_matrix
+            if isinstance(features, FeatureMatrix):
+                features.invalidate()  # Values may have changed in place
+            else:
+                features = FeatureMatrix.from_long(features)
+            self._feature_store = features
+            self._feature_store_key = key
+        return self._feature_store
+
+    @_pins_inputs
+    def get_feature_pivot(self) -> pd.DataFrame:
+        """
+        Feature x competitor score frame from the shared store
+        """
+        return self.feature_store.pivot()
+
+    @_pins_inputs
+    def rank_competitors(
+        self,
+        weights=None,
+        n_samples: int = 1000,
+        spread: float = 0.5,
+        top_k: int = 3,
+    ) -> pd.DataFrame:
+        """
+        Rank stability of weighted feature scores across many weightings
+
+        Args:
+            weights: Batch of weightings for CompetitiveScorer (default:
+                n_samples log-normal perturbations of equal weights)
+            spread: Log-weight noise of the sampled ensemble
+        """
+        print("🏆 Ranking competitors across weightings...")
+
+        scorer = CompetitiveScorer(self.feature_store)
+        if weights is None:
+            weights = scorer.sample_weights(n_samples, spread=spread)
+        stability = scorer.rank_stability(weights, top_k)
+        stability.attrs["weightings"] = len(scorer.weight_matrix(weights))
+
+        print(
+            f"✅ Ranked {len(stability)} products under "
+            f"{stability.attrs['weightings']:,} weightings"
         )
+        return self._memo_put("rank_stability", stability)
 
-        # Mem.ai
-        swot_data.append(
-            {
-                "competitor_id": "mem_ai",
-                "name": "Mem.ai",
-                "category": "Strengths",
-                "factor": "AI-native from day one",
-                "impact": "High",
-                "implications": "UX designed around AI",
-            }
+    @_pins_inputs
+    def find_pareto_frontier(
+        self, include_price: bool = False, features: List[str] = None
+    ) -> pd.DataFrame:
+        """
+        Products not dominated on every feature (and optionally price)
+
+        Args:
+            include_price: Add lowest paid monthly price (lower is better)
+            features: Feature subset (default: all features in the store)
+        """
+        print("🧭 Computing Pareto frontier...")
+
+        points = CompetitiveSkyline.build_points(
+            self.feature_store, PriceIndex() if include_price else None, features
         )
-        swot_data.append(
-            {
-                "competitor_id": "mem_ai",
-                "name": "Mem.ai",
-                "category": "Strengths",
-                "factor": "Automatic linking is best-in-class",
-                "impact": "Medium",
-                "implications": "Low friction note-taking",
-            }
+        self.skyline = CompetitiveSkyline().fit(points)
+        dominance = self.skyline.dominance_counts()
+
+        print(
+            f"✅ {int(dominance['on_frontier'].sum())} of "
+            f"{len(dominance)} products on the Pareto frontier"
         )
-        swot_data.append(
-            {
-                "competitor_id": "mem_ai",
-                "name": "Mem.ai",
-                "category": "Weaknesses",
-                "factor": "Small user base (100K)",
-                "impact": "Medium",
-                "implications": "Limited network effects",
-            }
+        return self._memo_put("dominance", dominance)
+
+    @_pins_inputs
+    def similarity_index(
+        self, include_price: bool = True, weights: Dict[str, float] = None
+    ) -> SimilarityIndex:
+        """
+        Similarity index over features + positioning (+ price), rebuilt only
+        when its inputs change
+
+        Args:
+            weights: Group weights {"features", "positioning", "price"}
+        """
+        if self.positioning_data is None:
+            self.calculate_positioning_coordinates()
+
+        key = (
+            self._input_key(),
+            self._memo_entry("positioning")["version"],
+            include_price,
+            tuple(sorted((weights or {}).items())),
         )
-        swot_data.append(
-            {
-                "competitor_id": "mem_ai",
-                "name": "Mem.ai",
-                "category": "Weaknesses",
-                "factor": "Horizontal positioning (everyone)",
-                "impact": "Medium",
-                "implications": "No clear niche ownership",
-            }
+        if self._similarity_key != key:
+            vectors = build_vectors(
+                self.feature_store,
+                self.positioning_data,
+                PriceIndex() if include_price else None,
+                weights,
+            )
+            self._similarity_index = SimilarityIndex(vectors)
+            self._similarity_key = key
+        return self._similarity_index
+
+    @_pins_inputs
+    def find_similar_competitors(
+        self,
+        competitor_id: str = "our_product",
+        k: int = 3,
+        metric: str = "cosine",
+        include_price: bool = True,
+    ) -> pd.DataFrame:
+        """
+        Closest products to one product on features, positioning and price
+        """
+        print(f"🔗 Finding nearest competitors to {competitor_id}...")
+
+        neighbors = self.similarity_index(include_price).query(competitor_id, k, metric)
+        names = dict(
+            zip(self.competitors_df["competitor_id"], self.competitors_df["name"])
         )
-        swot_data.append(
-            {
-                "competitor_id": "mem_ai",
-                "name": "Mem.ai",
-                "category": "Opportunities",
-                "factor": "Add team features",
-                "impact": "High",
-                "implications": "Expand TAM significantly",
-            }
+        neighbors.insert(
+            1,
+            "name",
+            [names.get(c, PRODUCT_NAME) for c in neighbors["competitor_id"]],
         )
-        swot_data.append(
-            {
-                "competitor_id": "mem_ai",
-                "name": "Mem.ai",
-                "category": "Threats",
-                "factor": "High API costs ($3-5 per user)",
-                "impact": "High",
-                "implications": "Unit economics challenge",
-            }
+        groups = "features + positioning" + (" + price" if include_price else "")
+        neighbors.attrs.update(
+            {"target": competitor_id, "metric": metric, "groups": groups}
         )
+        print(f"✅ Nearest: {', '.join(neighbors['name'])}")
+        return self._memo_put("similar_competitors", neighbors)
 
-        # Obsidian
-        swot_data.append(
-            {
-                "competitor_id": "obsidian",
-                "name": "Obsidian",
-                "category": "Strengths",
-                "factor": "Local-first (privacy)",
-                "impact": "High",
-                "implications": "Trusted by privacy-conscious users",
-            }
-        )
-        swot_data.append(
-            {
-                "competitor_id": "obsidian",
-                "name": "Obsidian",
-                "category": "Strengths",
-                "factor": "Plugin ecosystem",
-                "impact": "High",
-                "implications": "Extensible for power users",
-            }
-        )
-        swot_data.append(
-            {
-                "competitor_id": "obsidian",
-                "name": "Obsidian",
-                "category": "Weaknesses",
-                "factor": "Steep learning curve",
-                "impact": "High",
-                "implications": "Limited to power users",
-            }
+    @_pins_inputs
+    def discover_strategic_groups(
+        self, k_range: List[int] = (2, 3, 4, 5)
+    ) -> pd.DataFrame:
+        """
+        Cluster products into strategic groups on features, positioning,
+        price and overview scale (users, funding)
+
+        Args:
+            k_range: Candidate group counts; the best silhouette wins
+        """
+        print("🧩 Discovering strategic groups...")
+
+        if self.positioning_data is None:
+            self.calculate_positioning_coordinates()
+
+        vectors = build_vectors(
+            self.feature_store,
+            self.positioning_data,
+            PriceIndex(),
+            overview=self.competitors_df,
         )
-        swot_data.append(
-            {
-                "competitor_id": "obsidian",
-                "name": "Obsidian",
-                "category": "Weaknesses",
-                "factor": "AI via plugins (fragmented)",
-                "impact": "Medium",
-                "implications": "Not cohesive AI experience",
-            }
+        self.group_model = StrategicGroups(k_range)
+        groups = self.group_model.fit(vectors)
+
+        names = dict(
+            zip(self.competitors_df["competitor_id"], self.competitors_df["name"])
         )
-        swot_data.append(
-            {
-                "competitor_id": "obsidian",
-                "name": "Obsidian",
-                "category": "Opportunities",
-                "factor": "First-party AI integration",
-                "impact": "High",
-                "implications": "Could compete better on AI",
-            }
+        groups.insert(
+            1, "name", [names.get(c, PRODUCT_NAME) for c in groups["competitor_id"]]
         )
-        swot_data.append(
-            {
-                "competitor_id": "obsidian",
-                "name": "Obsidian",
-                "category": "Threats",
-                "factor": "Cloud-first competitors easier to use",
-                "impact": "Medium",
-                "implications": "Local-first trades off convenience",
-            }
+        print(
+            f"✅ {groups['group'].nunique()} strategic groups "
+            f"across {len(groups)} products"
         )
+        return self._memo_put("strategic_groups", groups)
+
+    @_pins_inputs
+    def assess_positioning_robustness(
+        self,
+        n_draws: int = None,
+        coord_noise: float = None,
+        feature_noise: float = None,
+        recommended: str = None,
+    ) -> Dict:
+        """
+        Monte Carlo check that the recommended quadrant stays least crowded
+        when coordinates and feature scores are perturbed
+
+        Args:
+            n_draws: Perturbed landscapes (default: POSITIONING_ROBUSTNESS)
+            coord_noise: Std of direct coordinate noise (0-10 scale)
+            feature_noise: Std of feature score noise, mapped to coordinates
+                through the positioning engine
+            recommended: Quadrant under test
+        """
+        args = (n_draws, coord_noise, feature_noise, recommended)
+        cached = self._memo_get("robustness", args)
+        if cached is not None:
+            return cached
 
-        # Add our product SWOT (from config)
-        for category, factors in OUR_SWOT.items():
-            for factor in factors:
-                swot_data.append(
-                    {
-                        "competitor_id": "our_product",
-                        "name": "ResearchFlow AI",
-                        "category": category.capitalize(),
-                        "factor": factor,
-                        "impact": (
-                            "High"
-                            if "unique" in factor.lower()
-                            or "switching costs" in factor.lower()
-                            else "Medium"
-                        ),
-                        "implications": (
-                            "Key differentiator"
-                            if category == "strengths"
-                            else "Risk to address"
-                        ),
-                    }
-                )
+        print("🎲 Assessing positioning robustness...")
+
+        if self.positioning_data is None:
+            self.calculate_positioning_coordinates()
+        engine = self.positioning_engine
+        if engine is None:
+            engine = PositioningEngine()
+            engine.fit(engine.build_inputs(self.feature_store, self.competitors_df))
 
-        self.swot_analysis = pd.DataFrame(swot_data)
+        result = PositioningRobustness(
+            self.positioning_data, self.feature_store, engine
+        ).simulate(n_draws, coord_noise, feature_noise, recommended)
 
-        print(f"✅ SWOT analysis complete: {len(self.swot_analysis)} factors analyzed")
-        return self.swot_analysis
+        print(
+            f"✅ {result['recommended']} least crowded in "
+            f"{result['p_recommended_least']:.1%} of {result['draws']:,} draws"
+        )
+        return self._memo_put("robustness", result, args)
+
+    @_pins_inputs
+    def record_snapshot(
+        self, store: LandscapeSnapshotStore = None, snapshot_date=None
+    ) -> Dict:
+        """
+        Append this run's outputs to the landscape snapshot history
+
+        Args:
+            store: Snapshot store (default: PROCESSED_DATA_DIR / "snapshots")
+            snapshot_date: Date of the run (default: today)
+        """
+        store = store or LandscapeSnapshotStore()
+        if self.positioning_data is None:
+            self.calculate_positioning_coordinates()
+        entry = store.record(
+            snapshot_date,
+            overview=self.competitors_df,
+            positioning=self.positioning_data,
+            features=self.feature_store.to_long(),
+            feature_gaps=self.calculate_feature_gaps(),
+            swot=self.perform_swot_analysis(),
+        )
+        print(
+            f"🗂️ Recorded landscape snapshot {entry['snapshot_id']}: {entry['changes']}"
+        )
+        return entry
 
+    @_pins_inputs
     def calculate_feature_gaps(self) -> pd.DataFrame:
         """
         Identify feature gaps vs competitors
         """
-        print("🔍 Analyzing feature gaps...")
+        cached = self._memo_get("feature_gaps")
+        if cached is not None:
+            return cached
 
-        # Pivot feature matrix to wide format
-        feature_pivot = self.features_matrix.pivot(
-            index="feature", columns="competitor_id", values="score"
-        )
+        print("🔍 Analyzing feature gaps...")
 
-        # Calculate statistics
-        feature_gaps = []
+        store = self.feature_store
+        scores = store.values.astype(np.float64)
 
-        for feature in feature_pivot.index:
-            our_score = feature_pivot.loc[feature, "our_product"]
-            competitor_max = (
-                feature_pivot.drop("our_product", axis=1).loc[feature].max()
-            )
-            competitor_avg = (
-                feature_pivot.drop("our_product", axis=1).loc[feature].mean()
-            )
+        # Whole-matrix statistics: competitors as rows, one column per feature
+        ours_idx = store.competitor_index["our_product"]
+        competitor_rows = np.arange(scores.shape[0]) != ours_idx
+        our_score = store.as_source_dtype(scores[ours_idx])
+        competitor_scores = scores[competitor_rows]
 
-            gap_vs_max = our_score - competitor_max
-            gap_vs_avg = our_score - competitor_avg
+        competitor_max = store.as_source_dtype(np.nanmax(competitor_scores, axis=0))
+        competitor_avg = np.nanmean(competitor_scores, axis=0)
 
-            feature_gaps.append(
-                {
-                    "feature": feature,
-                    "our_score": our_score,
-                    "competitor_max": competitor_max,
-                    "competitor_avg": competitor_avg,
-                    "gap_vs_max": gap_vs_max,
-                    "gap_vs_avg": gap_vs_avg,
-                    "competitive_advantage": gap_vs_max > 0,
-                    "differentiation": (
-                        "Strong"
-                        if gap_vs_max > 2
-                        else ("Moderate" if gap_vs_max > 0 else "Weak")
-                    ),
-                }
-            )
+        gap_vs_max = our_score - competitor_max
+        gap_vs_avg = our_score - competitor_avg
 
-        feature_gaps_df = pd.DataFrame(feature_gaps)
+        feature_gaps_df = pd.DataFrame(
+            {
+                "feature": store.features,
+                "our_score": our_score,
+                "competitor_max": competitor_max,
+                "competitor_avg": competitor_avg,
+                "gap_vs_max": gap_vs_max,
+                "gap_vs_avg": gap_vs_avg,
+                "competitive_advantage": gap_vs_max > 0,
+                "differentiation": np.select(
+                    [gap_vs_max > 2, gap_vs_max > 0], ["Strong", "Moderate"], "Weak"
+                ),
+            }
+        )
         feature_gaps_df = feature_gaps_df.sort_values("gap_vs_max", ascending=False)
 
         print(f"✅ Feature gap analysis complete")
@@ -432,8 +686,9 @@ class CompetitiveAnalyzer:
             f"   Areas to improve: {len(feature_gaps_df[feature_gaps_df['gap_vs_max'] < 0])}"
         )
 
-        return feature_gaps_df
+        return self._memo_put("feature_gaps", feature_gaps_df)
 
+    @_pins_inputs
     def generate_competitive_summary(self) -> str:
         """
         Generate executive summary of competitive analysis
@@ -473,6 +728,87 @@ class CompetitiveAnalyzer:
         summary += f"Individual-focused: {white_space['competitive_density']['individual']} competitors\n"
         summary += f"Team-focused: {white_space['competitive_density']['team']} competitors\n\n"
 
+        strategic_groups = self.strategic_groups
+        if strategic_groups is not None:
+            selection = self.group_model.selection
+            best = selection.loc[selection["silhouette"].idxmax()]
+            summary += "🧩 STRATEGIC GROUPS\n"
+            summary += "-" * 80 + "\n"
+            summary += (
+                f"Groups: {int(best['k'])} (silhouette {best['silhouette']:.2f})\n"
+            )
+            for group, members in strategic_groups.groupby("group")["name"]:
+                summary += f"   Group {group + 1}: {', '.join(members)}\n"
+            summary += "\n"
+
+        neighbors = self.similar_competitors
+        if neighbors is not None:
+            score = "similarity" if "similarity" in neighbors else "distance"
+            summary += "🔗 NEAREST COMPETITORS\n"
+            summary += "-" * 80 + "\n"
+            summary += f"Closest to {neighbors.attrs['target']} ({neighbors.attrs['metric']}, {neighbors.attrs['groups']}):\n"
+            for _, row in neighbors.iterrows():
+                summary += (
+                    f"   {row['rank']}. {row['name']} ({score} {row[score]:.2f})\n"
+                )
+            summary += "\n"
+
+        dominance = self.dominance
+        if dominance is not None:
+            names = dict(
+                zip(self.competitors_df["competitor_id"], self.competitors_df["name"])
+            )
+            frontier = dominance[dominance["on_frontier"]]
+            dominated = dominance[~dominance["on_frontier"]]
+            summary += "🧭 PARETO FRONTIER\n"
+            summary += "-" * 80 + "\n"
+            summary += f"Dimensions: {', '.join(self.skyline.dimensions)}\n"
+            summary += f"Undominated: {len(frontier)} of {len(dominance)} products\n"
+            for _, row in dominated.iterrows():
+                name = names.get(row["competitor_id"], PRODUCT_NAME)
+                summary += (
+                    f"   • {name}: dominated by {row['dominated_by']} product(s)\n"
+                )
+            summary += "\n"
+
+        rank_stability = self.rank_stability
+        if rank_stability is not None:
+            summary += "🏆 RANK STABILITY (Weighted Feature Scores)\n"
+            summary += "-" * 80 + "\n"
+            summary += f"Weightings evaluated: {rank_stability.attrs['weightings']:,}\n"
+            names = dict(
+                zip(self.competitors_df["competitor_id"], self.competitors_df["name"])
+            )
+            for _, row in rank_stability.head(5).iterrows():
+                name = names.get(row["competitor_id"], PRODUCT_NAME)
+                summary += (
+                    f"   • {name}: mean rank {row['mean_rank']:.2f} "
+                    f"(best {row['best_rank']}, worst {row['worst_rank']}, "
+                    f"#1 in {row['p_first']:.0%})\n"
+                )
+            summary += "\n"
+
+        robustness = self.robustness
+        if robustness is not None:
+            summary += "🎲 POSITIONING ROBUSTNESS\n"
+            summary += "-" * 80 + "\n"
+            summary += (
+                f"Draws: {robustness['draws']:,} (coordinate noise "
+                f"{robustness['coord_noise']}, feature noise {robustness['feature_noise']})\n"
+            )
+            summary += (
+                f"P({robustness['recommended']} least crowded): "
+                f"{robustness['p_recommended_least']:.1%} "
+                f"(strictly: {robustness['p_recommended_strictly_least']:.1%})\n"
+            )
+            for _, row in robustness["quadrants"].iterrows():
+                summary += (
+                    f"   • {row['quadrant']}: {row['base_count']} now, "
+                    f"{row['p05_count']:.0f}-{row['p95_count']:.0f} (90% range), "
+                    f"least crowded in {row['p_least_crowded']:.0%}\n"
+                )
+            summary += "\n"
+
         summary += "✅ STRATEGIC RECOMMENDATION\n"
         summary += "-" * 80 + "\n"
         summary += "Position as SPECIALIST INDIVIDUAL tool (research synthesis for academics)\n"
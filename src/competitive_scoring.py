@@ -0,0 +1,158 @@
+"""
+Competitive Scoring
+Weighted feature scores and rankings for batches of weight vectors
+"""
+
+import pandas as pd
+import numpy as np
+from typing import Dict, List, Optional, Sequence, Union
+from config import *
+from feature_matrix import FeatureMatrix
+
+
+class CompetitiveScorer:
+    """
+    Scores every competitor under many feature weightings at once
+
+    Weights are a (n_weightings, n_features) matrix, so all scores come
+    from a single product with the (n_competitors, n_features) store.
+    """
+
+    def __init__(self, store: FeatureMatrix):
+        """
+        Args:
+            store: Shared feature matrix (missing scores count as 0)
+        """
+        self.store = store
+        self.values = np.nan_to_num(store.values.astype(np.float64), nan=0.0)
+
+    def weight_matrix(self, weights) -> np.ndarray:
+        """
+        Normalize weight input to shape (n_weightings, n_features)
+
+        Args:
+            weights: Dict {feature: weight} (unlisted features weigh 1.0),
+                list of such dicts, DataFrame with feature columns, or array
+                aligned with store.features
+        """
+        if isinstance(weights, dict):
+            weights = [weights]
+        if isinstance(weights, list) and weights and isinstance(weights[0], dict):
+            weights = pd.DataFrame(weights)
+        if isinstance(weights, pd.DataFrame):
+            unknown = sorted(set(weights.columns) - set(self.store.features))
+            if unknown:
+                raise ValueError(f"Unknown features in weights: {unknown}")
+            weights = weights.reindex(columns=self.store.features).fillna(1.0)
+
+        matrix = np.atleast_2d(np.asarray(weights, dtype=np.float64))
+        if matrix.shape[1] != len(self.store.features):
+            raise ValueError(
+                f"Expected {len(self.store.features)} weights per vector, got {matrix.shape[1]}"
+            )
+        if (matrix < 0).any():
+            raise ValueError("Feature weights must be non-negative")
+        return matrix
+
+    def sample_weights(
+        self,
+        n: int = 1000,
+        base: Optional[Dict] = None,
+        spread: float = 0.5,
+        seed: int = 42,
+    ) -> np.ndarray:
+        """
+        Log-normal perturbations of a base weighting
+
+        Args:
+            base: Base weights (default: all features 1.0)
+            spread: Std of the log-weight noise (0.5 ~ weights vary 0.4x-2.7x)
+        """
+        rng = np.random.default_rng(seed)
+        base = self.weight_matrix(base or {})
+        return base * rng.lognormal(0.0, spread, size=(n, base.shape[1]))
+
+    def score(self, weights, normalize: bool = True) -> np.ndarray:
+        """
+        Weighted scores, shape (n_weightings, n_competitors)
+
+        Args:
+            normalize: Divide by total weight so scores stay on the 0-10 scale
+        """
+        matrix = self.weight_matrix(weights)
+        scores = matrix @ self.values.T
+        if normalize:
+            totals = matrix.sum(axis=1, keepdims=True)
+            scores = np.divide(
+                scores, totals, out=np.zeros_like(scores), where=totals > 0
+            )
+        return scores
+
+    @staticmethod
+    def rank_scores(scores: np.ndarray) -> np.ndarray:
+        """
+        Competition ranks per row (1 = best, ties share the better rank)
+        """
+        scores = np.atleast_2d(scores)
+        order = np.argsort(-scores, axis=1, kind="stable")
+        ordered = np.take_along_axis(scores, order, axis=1)
+
+        # Position where each run of equal scores starts
+        positions = np.broadcast_to(np.arange(scores.shape[1]), scores.shape)
+        new_run = np.ones(scores.shape, dtype=bool)
+        new_run[:, 1:] = ordered[:, 1:] != ordered[:, :-1]
+        run_start = np.maximum.accumulate(np.where(new_run, positions, 0), axis=1)
+
+        ranks = np.empty(scores.shape, dtype=np.int64)
+        np.put_along_axis(ranks, order, run_start + 1, axis=1)
+        return ranks
+
+    def rank(self, weights) -> pd.DataFrame:
+        """
+        Rank table: one row per weighting, one column per competitor
+        """
+        return pd.DataFrame(
+            self.rank_scores(self.score(weights)),
+            columns=pd.Index(self.store.competitors, name="competitor_id"),
+        )
+
+    def rank_stability(self, weights, top_k: int = 3) -> pd.DataFrame:
+        """
+        How each competitor's rank varies across a weight ensemble
+
+        Returns mean/std/best/worst rank, the share of weightings where the
+        competitor ranks first and in the top k, and its mean score.
+        """
+        scores = self.score(weights)
+        ranks = self.rank_scores(scores)
+
+        stability = pd.DataFrame(
+            {
+                "competitor_id": self.store.competitors,
+                "mean_score": scores.mean(axis=0),
+                "mean_rank": ranks.mean(axis=0),
+                "std_rank": ranks.std(axis=0),
+                "best_rank": ranks.min(axis=0),
+                "worst_rank": ranks.max(axis=0),
+                "p_first": (ranks == 1).mean(axis=0),
+                f"p_top{top_k}": (ranks <= top_k).mean(axis=0),
+            }
+        )
+        return stability.sort_values("mean_rank", kind="stable").reset_index(drop=True)
+
+
+if __name__ == "__main__":
+    from data_collector import CompetitiveDataCollector
+
+    print("=" * 80)
+    print(" COMPETITIVE SCORING")
+    print("=" * 80)
+    print()
+
+    collector = CompetitiveDataCollector()
+    collector.generate_feature_matrix()
+    scorer = CompetitiveScorer(collector.feature_store)
+
+    print(scorer.rank({"Cross-source Synthesis": 3, "Collaboration": 0.5}).to_string())
+    print()
+    print(scorer.rank_stability(scorer.sample_weights(10_000)).round(3).to_string())
@@ -84,6 +84,27 @@ MARKET_SIZE = {
     },
 }
 
+# Relative standard error of each sizing input; reconciliation moves the
+# least certain inputs most (variance = (uncertainty * value)^2)
+MARKET_UNCERTAINTY = {
+    "tam_segments": {
+        "academics": 0.10,  # UNESCO / World Bank headcounts
+        "corporate_researchers": 0.20,  # OECD R&D headcounts
+        "consultants": 0.30,
+        "journalists_writers": 0.35,
+        "students": 0.40,  # Rests on the 20% "serious research" share
+        "analysts": 0.25,
+        "other_knowledge_workers": 0.50,  # Loosely defined segment
+    },
+    "som_assumptions": {
+        "potential_users": 0.15,
+        "awareness_rate": 0.50,  # No GTM data before launch
+        "signup_rate": 0.35,
+        "activation_rate": 0.25,  # Benchmarked on comparable tools
+        "our_share_percentage": 0.40,
+    },
+}
+
 # ===== COMPETITORS =====
 COMPETITORS = {
     "notion_ai": {
@@ -178,6 +199,22 @@ COMPETITORS = {
     },
 }
 
+# ===== COMPETITOR PRICE INDEX =====
+# Billing metadata for tiers not listed as per-seat monthly prices.
+# period: unit of the listed price ("month", "year", "one_time")
+# commitment_months: prepaid term; seats: seats included in the price
+PRICE_INDEX = {
+    "one_time_amortization_months": 24,  # Spread one-time licences over 2 years
+    "billing": {
+        "reflect": {"annual": {"commitment_months": 12}},  # $8/mo billed yearly
+        "obsidian": {
+            "catalyst": {"period": "one_time"},
+            "commercial": {"period": "year"},
+        },
+        "roam": {"believer": {"commitment_months": 60}},  # $500 for 5 years
+    },
+}
+
 # ===== FEATURE COMPARISON DIMENSIONS =====
 FEATURE_DIMENSIONS = [
     "AI Summarization",
@@ -221,6 +258,32 @@ OUR_POSITIONING = {
     "rationale": "Deep vertical focus on research synthesis workflow for individual academics",
 }
 
+# Analyst-placed coordinates (0-10) used as anchors by the positioning engine;
+# products without an anchor are projected from their feature vectors
+POSITIONING_ANCHORS = {
+    "notion_ai": {"x": 2.0, "y": 7.0, "label": "Horizontal Platform\n(Teams)"},
+    "mem_ai": {"x": 4.5, "y": 3.0, "label": "AI-first Notes\n(Individual)"},
+    "reflect": {"x": 3.0, "y": 2.0, "label": "Networked Notes\n(Individual)"},
+    "obsidian": {"x": 5.0, "y": 1.5, "label": "Local-first\n(Power Users)"},
+    "roam": {"x": 5.5, "y": 4.0, "label": "Networked Thought\n(Individual+)"},
+    "napkin_ai": {"x": 7.0, "y": 2.0, "label": "Visual AI\n(Visual Thinkers)"},
+    "recall": {"x": 6.5, "y": 2.5, "label": "Knowledge Graph\n(Learners)"},
+    "our_product": {
+        "x": OUR_POSITIONING["x"],
+        "y": OUR_POSITIONING["y"],
+        "label": "Research Synthesis\n(Academics)",
+    },
+}
+
+# Noise model for the positioning robustness Monte Carlo
+POSITIONING_ROBUSTNESS = {
+    "n_draws": 5000,
+    "coord_noise": 0.75,  # Std of direct x/y perturbation (axis units)
+    "feature_noise": 1.0,  # Std of feature score perturbation (0-10 scale)
+    "recommended_quadrant": "specialist_individual",
+    "seed": 42,
+}
+
 # ===== PRICING STRATEGY =====
 PRICING_TIERS = {
     "free": {
@@ -270,6 +333,184 @@ PRICING_TIERS = {
     },
 }
 
+# ===== DEMAND MODEL (PRICE ELASTICITY) =====
+DEMAND_MODEL = {
+    # Elasticity = point price elasticity of conversion at the tier's list price
+    "segments": {
+        "academics": {
+            "active_users": 4000,  # Activated free users (90-day target mix)
+            "elasticity": 1.2,  # Price-sensitive (student budgets)
+        },
+        "consultants": {
+            "active_users": 700,
+            "elasticity": 0.6,  # Expensed, value-driven
+        },
+        "journalists": {
+            "active_users": 300,
+            "elasticity": 0.9,
+        },
+    },
+    "tiers": {
+        "pro": {
+            "reference_conversion": 0.08,  # Free-to-paid at reference price
+            "cost_per_user": 4.00,  # API + infrastructure per month
+        },
+        "team": {
+            "reference_conversion": 0.02,
+            "cost_per_user": 6.00,  # Heavier shared usage
+        },
+    },
+    "monthly_churn": 0.05,
+    "price_grid": {"min": 5, "max": 60, "step": 0.25},  # USD/month
+}
+
+# ===== REGIONAL PRICING (PPP) =====
+# Full ~190-country inputs can be dropped into RAW_DATA_DIR / "country_pricing_inputs.csv"
+# (columns: country_code, country, currency, fx_rate, ppp_ratio, researchers, tax_rate)
+REGIONAL_PRICING = {
+    "base_country": "US",
+    "pass_through": 0.6,  # Price follows PPP ratio ^ 0.6 (partial adjustment)
+    "min_factor": 0.25,  # Never below 25% of the US price
+    "elasticity": 1.2,  # Conversion sensitivity to price vs local purchasing power
+    "leakage_rate": 0.15,  # Max share of buyers arbitraging to the cheapest region
+    "countries": {
+        # Approximate 2024 inputs: FX per USD, PPP price-level ratio, researchers, VAT/GST
+        "US": {
+            "country": "United States",
+            "currency": "USD",
+            "fx_rate": 1.0,
+            "ppp_ratio": 1.00,
+            "researchers": 1_600_000,
+            "tax_rate": 0.00,
+        },
+        "GB": {
+            "country": "United Kingdom",
+            "currency": "GBP",
+            "fx_rate": 0.79,
+            "ppp_ratio": 0.87,
+            "researchers": 320_000,
+            "tax_rate": 0.20,
+        },
+        "DE": {
+            "country": "Germany",
+            "currency": "EUR",
+            "fx_rate": 0.92,
+            "ppp_ratio": 0.80,
+            "researchers": 450_000,
+            "tax_rate": 0.19,
+        },
+        "FR": {
+            "country": "France",
+            "currency": "EUR",
+            "fx_rate": 0.92,
+            "ppp_ratio": 0.78,
+            "researchers": 330_000,
+            "tax_rate": 0.20,
+        },
+        "CA": {
+            "country": "Canada",
+            "currency": "CAD",
+            "fx_rate": 1.36,
+            "ppp_ratio": 0.85,
+            "researchers": 170_000,
+            "tax_rate": 0.05,
+        },
+        "AU": {
+            "country": "Australia",
+            "currency": "AUD",
+            "fx_rate": 1.52,
+            "ppp_ratio": 0.95,
+            "researchers": 120_000,
+            "tax_rate": 0.10,
+        },
+        "JP": {
+            "country": "Japan",
+            "currency": "JPY",
+            "fx_rate": 150.0,
+            "ppp_ratio": 0.65,
+            "researchers": 690_000,
+            "tax_rate": 0.10,
+        },
+        "KR": {
+            "country": "South Korea",
+            "currency": "KRW",
+            "fx_rate": 1330.0,
+            "ppp_ratio": 0.62,
+            "researchers": 470_000,
+            "tax_rate": 0.10,
+        },
+        "CN": {
+            "country": "China",
+            "currency": "CNY",
+            "fx_rate": 7.2,
+            "ppp_ratio": 0.55,
+            "researchers": 2_400_000,
+            "tax_rate": 0.06,
+        },
+        "IN": {
+            "country": "India",
+            "currency": "INR",
+            "fx_rate": 83.0,
+            "ppp_ratio": 0.24,
+            "researchers": 340_000,
+            "tax_rate": 0.18,
+        },
+        "BR": {
+            "country": "Brazil",
+            "currency": "BRL",
+            "fx_rate": 5.0,
+            "ppp_ratio": 0.50,
+            "researchers": 180_000,
+            "tax_rate": 0.10,
+        },
+        "MX": {
+            "country": "Mexico",
+            "currency": "MXN",
+            "fx_rate": 17.0,
+            "ppp_ratio": 0.55,
+            "researchers": 45_000,
+            "tax_rate": 0.16,
+        },
+        "ID": {
+            "country": "Indonesia",
+            "currency": "IDR",
+            "fx_rate": 15_700.0,
+            "ppp_ratio": 0.33,
+            "researchers": 60_000,
+            "tax_rate": 0.11,
+        },
+        "NG": {
+            "country": "Nigeria",
+            "currency": "NGN",
+            "fx_rate": 1500.0,
+            "ppp_ratio": 0.25,
+            "researchers": 30_000,
+            "tax_rate": 0.075,
+        },
+        "ZA": {
+            "country": "South Africa",
+            "currency": "ZAR",
+            "fx_rate": 18.5,
+            "ppp_ratio": 0.45,
+            "researchers": 30_000,
+            "tax_rate": 0.15,
+        },
+    },
+}
+
+# ===== BILLING PLANS (CASH FLOW) =====
+BILLING_PLANS = {
+    "tier": "pro",
+    "base_monthly_churn": 0.05,
+    "plans": {
+        # term_months: billing term; free_months: free period before first charge
+        "monthly": {"term_months": 1, "free_months": 0, "churn_multiplier": 1.0},
+        "annual": {"term_months": 12, "free_months": 0, "churn_multiplier": 0.6},
+        "promo": {"term_months": 1, "free_months": 1, "churn_multiplier": 1.3},
+    },
+    "default_mix": {"monthly": 0.55, "annual": 0.40, "promo": 0.05},
+}
+
 # ===== UNIT ECONOMICS =====
 UNIT_ECONOMICS = {
     "cac": {
@@ -417,37 +658,13 @@ FINANCIAL_PROJECTIONS = {
     "month_12": {"users": 50000, "paying": 6000, "mrr": 90000, "costs": 80000},
 }
 
-# ===== SWOT ANALYSIS (Our Product) =====
-OUR_SWOT = {
-    "strengths": [
-        "Vertical focus on research synthesis (unique positioning)",
-        "Deep academic database integration",
-        "Knowledge graph compounds switching costs",
-        "Premium pricing justified by specialist value",
-        "Founder has PhD background (domain expertise)",
-    ],
-    "weaknesses": [
-        "New entrant (no brand recognition)",
-        "Smaller team vs Notion (30 vs 200+)",
-        "Limited funding compared to competitors",
-        "No existing user base to cross-sell",
-        "Research workflow requires education (long sales cycle)",
-    ],
-    "opportunities": [
-        "AI productivity market growing 150% YoY",
-        "Academic researchers underserved (no specialist tool)",
-        "API costs declining (improving margins)",
-        "Remote work increasing research collaboration needs",
-        "Expand to consultants/journalists after PMF",
-    ],
-    "threats": [
-        "Notion AI could add research features (large distribution)",
-        "ChatGPT $20/month bundles many use cases",
-        "University budget cuts reduce tool spending",
-        "Privacy concerns (researchers need data security)",
-        "Switching costs work both ways (hard to migrate users from competitors)",
-    ],
-}
+# ===== SWOT ANALYSIS =====
+# Factors for our product and competitors (category, impact, implications, tags)
+SWOT_KNOWLEDGE_BASE = RAW_DATA_DIR / "swot_factors.yaml"
+
+# ===== SYNTHETIC DATA =====
+# Root seed; each generator x competitor pair gets its own spawned stream
+SYNTHETIC_DATA_SEED = 42
 
 # ===== VISUALIZATION SETTINGS =====
 COLOR_SCHEME = {
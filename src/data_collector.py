@@ -3,13 +3,53 @@ Data Collector for Competitive Analysis
 Generates synthetic competitive intelligence data
 """
 
+import hashlib
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-from typing import Dict, List
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List
 from config import *
+from price_index import PriceIndex
+from feature_matrix import FeatureMatrix
+from chunked_io import write_batches
 
-np.random.seed(42)
+# Values per random stream (per generator and column): variants of one
+# competitor share a stream in blocks of STREAM_VALUES // n_per, because one
+# Generator per variant is too slow at millions of competitors
+STREAM_VALUES = 16384
+
+
+def _key_word(name: str) -> int:
+    """
+    Stable 128-bit integer for a stream key (Python's hash() is salted per
+    process); wide enough that distinct names never share a stream in practice
+    """
+    return int.from_bytes(
+        hashlib.blake2b(name.encode(), digest_size=16).digest(), "little"
+    )
+
+
+def _take_strings(values, codes: np.ndarray) -> pd.Index:
+    """
+    String column from a few distinct values and per-row codes (builds the
+    str array directly instead of converting millions of Python objects)
+    """
+    return pd.Index(np.asarray(values, dtype=object), dtype="str").take(codes)
+
+
+def generator_stream(seed: int, generator: str, key: str):
+    """
+    Independent np.random.Generator for one generator x key pair
+
+    The stream is a SeedSequence spawned from the root seed with the pair as
+    spawn key, so it depends only on (seed, generator, key): not on call
+    order, roster size or which process draws it.
+    """
+    sequence = np.random.SeedSequence(
+        seed, spawn_key=(_key_word(generator), _key_word(key))
+    )
+    return np.random.default_rng(sequence)
 
 
 class CompetitiveDataCollector:
@@ -17,11 +57,18 @@ class CompetitiveDataCollector:
     Collects and generates competitive intelligence data
     """
 
-    def __init__(self):
+    def __init__(self, seed: int = None):
+        """
+        Args:
+            seed: Root seed for all generator streams (default: SYNTHETIC_DATA_SEED)
+        """
+        self.seed = SYNTHETIC_DATA_SEED if seed is None else seed
         self.competitors_df = None
         self.features_matrix = None
+        self.feature_store = None
         self.traffic_data = None
         self.reviews_data = None
+        self.price_index = None
 
     def generate_competitive_overview(self) -> pd.DataFrame:
         """
@@ -30,6 +77,7 @@ class CompetitiveDataCollector:
         print("📊 Generating competitive overview...")
 
         competitors_list = []
+        self.price_index = PriceIndex()
 
         for key, comp in COMPETITORS.items():
             competitors_list.append(
@@ -41,13 +89,7 @@ class CompetitiveDataCollector:
                     "ai_added_year": comp["ai_added"],
                     "positioning": comp["positioning"],
                     "pricing_free": comp["pricing"].get("free", False),
-                    "pricing_lowest": min(
-                        [
-                            v
-                            for v in comp["pricing"].values()
-                            if isinstance(v, (int, float))
-                        ]
-                    ),
+                    "pricing_lowest": self.price_index.lowest_price(key),
                     "estimated_users": comp["users_estimate"],
                     "total_funding_usd": comp["funding_total"],
                     "latest_valuation_usd": comp.get("latest_valuation", 0),
@@ -218,143 +260,331 @@ class CompetitiveDataCollector:
                 )
 
         self.features_matrix = pd.DataFrame(matrix_data)
+        self.feature_store = FeatureMatrix.from_long(self.features_matrix)
 
         print(
             f"✅ Generated feature matrix: {len(FEATURE_DIMENSIONS)} features × {len(feature_scores)} products"
         )
         return self.features_matrix
 
-    def generate_traffic_estimates(self) -> pd.DataFrame:
-        """
-        Generate traffic estimates (SimilarWeb-style data)
+    def _competitor_roster(self, n_competitors: int = None) -> pd.DataFrame:
         """
-        print("📈 Generating traffic estimates...")
+        Competitors to simulate: COMPETITORS, extended with synthetic variants
+        (cycling through the real ones) when n_competitors is larger
 
-        traffic_data = []
+        Variants keep their base competitor's user base and growth/rating
+        profile, with ids like "notion_ai_2".
+        """
+        keys = list(COMPETITORS)
+        n_competitors = n_competitors or len(keys)
+        rows = np.arange(n_competitors)
+        base = np.asarray(keys, dtype=object)[rows % len(keys)]
+        copy = rows // len(keys)
+        names = np.asarray([COMPETITORS[k]["name"] for k in keys], dtype=object)
+        return pd.DataFrame(
+            {
+                "competitor_id": np.where(
+                    copy == 0, base, base + "_" + copy.astype(str).astype(object)
+                ),
+                "competitor_name": np.where(
+                    copy == 0,
+                    names[rows % len(keys)],
+                    names[rows % len(keys)] + " " + copy.astype(str).astype(object),
+                ),
+                "base_id": base,
+                "variant": copy,
+                "users_estimate": np.array(
+                    [COMPETITORS[k]["users_estimate"] for k in keys]
+                )[rows % len(keys)],
+            }
+        )
 
-        for key, comp in COMPETITORS.items():
-            # Estimate monthly visits based on user base
-            # Assumption: Active users visit 10x per month
-            estimated_visits = comp["users_estimate"] * 10
+    def rng(self, generator: str, key: str) -> np.random.Generator:
+        """
+        Fresh random stream for one generator and key
+        """
+        return generator_stream(self.seed, generator, key)
 
-            # Add some realistic variation
-            for month in range(12):
-                date = datetime(2025, month + 1, 1)
+    def _draw_per_competitor(
+        self, generator: str, roster: pd.DataFrame, n_per: int, draws: Dict
+    ) -> Dict[str, np.ndarray]:
+        """
+        Draw arrays for roster rows, n_per values each, in roster order
+
+        Streams are keyed by generator, column, base competitor and variant
+        block; each variant reads its own row of its block. Only rows up to
+        the last one needed are drawn (a longer draw would only append
+        rows), so a batch draws its own values plus at most one partial
+        block per base competitor. A competitor's values depend only on the
+        seed, generator, its id and n_per, not on the roster, batching or the
+        order of COMPETITORS.
+
+        Args:
+            generator: Stream name (e.g. "traffic", "reviews")
+            roster: Rows of _competitor_roster()
+            draws: Column name -> draw(rng, shape) returning one array
+        """
+        base_codes, base_ids = pd.factorize(roster["base_id"])
+        variant = roster["variant"].to_numpy()
+        block_size = max(1, STREAM_VALUES // n_per)
+        n_blocks = variant.max() // block_size + 1 if len(variant) else 1
+        stream = base_codes * n_blocks + variant // block_size
+
+        # Rows grouped by stream without a pass over the roster per stream
+        order = np.argsort(stream, kind="stable")
+        codes, starts = np.unique(stream[order], return_index=True)
+
+        out = {}
+        for code, positions in zip(codes, np.split(order, starts[1:])):
+            key = f"{base_ids[code // n_blocks]}:{code % n_blocks}"
+            rows = variant[positions] % block_size
+            for column, draw in draws.items():
+                values = draw(
+                    self.rng(generator, f"{key}:{column}"), (rows.max() + 1, n_per)
+                )
+                if column not in out:
+                    out[column] = np.empty((len(roster), n_per), dtype=values.dtype)
+                out[column][positions] = values[rows]
+        return {column: values.ravel() for column, values in out.items()}
 
-                # Growth trend (companies growing at different rates)
-                if key == "notion_ai":
-                    growth_rate = 1.05  # 5% monthly
-                elif key in ["mem_ai", "recall"]:
-                    growth_rate = 1.15  # 15% monthly (rapid growth)
-                else:
-                    growth_rate = 1.08  # 8% monthly
+    def _traffic_frame(self, roster: pd.DataFrame, n_months: int) -> pd.DataFrame:
+        """
+        Traffic rows for a slice of the competitor roster
+        """
+        # Estimate monthly visits based on user base
+        # Assumption: Active users visit 10x per month
+        estimated_visits = roster["users_estimate"].to_numpy(np.float64) * 10
+
+        # Growth trend (companies growing at different rates)
+        base = roster["base_id"]
+        growth_rate = np.select(
+            [base.eq("notion_ai"), base.isin(["mem_ai", "recall"])],
+            [1.05, 1.15],  # 5% monthly; 15% monthly (rapid growth)
+            1.08,  # 8% monthly
+        )
 
-                monthly_visits = int(estimated_visits * (growth_rate**month))
+        month = np.tile(np.arange(n_months), len(roster))
+        monthly_visits = np.repeat(estimated_visits, n_months) * (
+            np.repeat(growth_rate, n_months) ** month
+        )
 
-                traffic_data.append(
+        return pd.DataFrame(
+            {
+                "competitor_id": _take_strings(
+                    roster["competitor_id"], np.repeat(np.arange(len(roster)), n_months)
+                ),
+                "competitor_name": _take_strings(
+                    roster["competitor_name"],
+                    np.repeat(np.arange(len(roster)), n_months),
+                ),
+                "month": np.tile(
+                    pd.date_range("2025-01-01", periods=n_months, freq="MS").to_numpy(),
+                    len(roster),
+                ),
+                "estimated_visits": monthly_visits.astype(np.int64),
+                # Add some realistic variation
+                **self._draw_per_competitor(
+                    "traffic",
+                    roster,
+                    n_months,
                     {
-                        "competitor_id": key,
-                        "competitor_name": comp["name"],
-                        "month": date,
-                        "estimated_visits": monthly_visits,
-                        "bounce_rate": np.random.uniform(0.35, 0.55),
-                        "pages_per_visit": np.random.uniform(3.5, 6.5),
-                        "avg_visit_duration_sec": np.random.uniform(180, 420),
-                    }
-                )
+                        "bounce_rate": lambda rng, shape: rng.uniform(
+                            0.35, 0.55, shape
+                        ),
+                        "pages_per_visit": lambda rng, shape: rng.uniform(
+                            3.5, 6.5, shape
+                        ),
+                        "avg_visit_duration_sec": lambda rng, shape: rng.uniform(
+                            180, 420, shape
+                        ),
+                    },
+                ),
+            }
+        )
+
+    def generate_traffic_estimates(
+        self, n_months: int = 12, n_competitors: int = None
+    ) -> pd.DataFrame:
+        """
+        Generate traffic estimates (SimilarWeb-style data)
+
+        Args:
+            n_months: Months per competitor, starting January 2025
+            n_competitors: Competitors to simulate (default: COMPETITORS;
+                more adds synthetic variants)
+        """
+        print("📈 Generating traffic estimates...")
 
-        self.traffic_data = pd.DataFrame(traffic_data)
+        roster = self._competitor_roster(n_competitors)
+        self.traffic_data = self._traffic_frame(roster, n_months)
 
-        print(f"✅ Generated traffic data: 12 months × {len(COMPETITORS)} competitors")
+        print(
+            f"✅ Generated traffic data: {n_months} months × {len(roster)} competitors"
+        )
         return self.traffic_data
 
-    def generate_user_reviews(self) -> pd.DataFrame:
-        """
-        Generate synthetic user reviews (G2/Product Hunt style)
+    def iter_traffic_batches(
+        self, n_months: int = 12, n_competitors: int = None, batch_rows: int = 500_000
+    ) -> Iterator[pd.DataFrame]:
         """
-        print("⭐ Generating user reviews...")
+        Traffic estimates as a stream of batches of whole competitors
 
-        reviews_data = []
-
-        # Review templates by sentiment
-        positive_reviews = [
-            "Game-changer for my research workflow",
-            "Finally found a tool that works the way I think",
-            "Saves me hours every week organizing notes",
-            "The AI summarization is incredibly accurate",
-            "Love how it automatically links related concepts",
-        ]
-
-        neutral_reviews = [
-            "Good tool but has a learning curve",
-            "Works well for basic needs, missing some advanced features",
-            "Solid option but expensive for what it offers",
-            "Does what it says, nothing more",
-            "Decent but not significantly better than alternatives",
-        ]
-
-        negative_reviews = [
-            "Too complicated for my needs",
-            "Buggy and crashes frequently",
-            "Not worth the price",
-            "Missing key features I need",
-            "Customer support is slow to respond",
-        ]
+        Draws depend only on each competitor's id (see
+        _draw_per_competitor), so the concatenated batches equal
+        generate_traffic_estimates() with the same arguments.
 
-        for key, comp in COMPETITORS.items():
-            # Generate 20 reviews per competitor
-            n_reviews = 20
-
-            # Rating distribution (most tools have 4.0-4.5 avg)
-            # Notion AI: 4.5, Mem.ai: 4.3, Obsidian: 4.7, etc.
-            rating_distributions = {
-                "notion_ai": (4.5, 0.5),
-                "mem_ai": (4.3, 0.6),
-                "reflect": (4.4, 0.5),
-                "obsidian": (4.7, 0.4),
-                "roam": (4.0, 0.7),
-                "napkin_ai": (4.2, 0.6),
-                "recall": (4.4, 0.5),
-            }
+        Args:
+            batch_rows: Approximate rows per batch
+        """
+        roster = self._competitor_roster(n_competitors)
+        step = max(1, batch_rows // n_months)
+        for start in range(0, len(roster), step):
+            batch = roster.iloc[start : start + step]
+            yield self._traffic_frame(batch, n_months)
+
+    def _reviews_frame(
+        self, roster: pd.DataFrame, reviews_per_competitor: int, now: np.datetime64
+    ) -> pd.DataFrame:
+        """
+        Review rows for a slice of the competitor roster
 
-            mean_rating, std_rating = rating_distributions.get(key, (4.3, 0.5))
+        Args:
+            now: Reference time review dates count back from
+        """
+        # Review templates by sentiment (rows: positive, neutral, negative)
+        review_templates = np.array(
+            [
+                [
+                    "Game-changer for my research workflow",
+                    "Finally found a tool that works the way I think",
+                    "Saves me hours every week organizing notes",
+                    "The AI summarization is incredibly accurate",
+                    "Love how it automatically links related concepts",
+                ],
+                [
+                    "Good tool but has a learning curve",
+                    "Works well for basic needs, missing some advanced features",
+                    "Solid option but expensive for what it offers",
+                    "Does what it says, nothing more",
+                    "Decent but not significantly better than alternatives",
+                ],
+                [
+                    "Too complicated for my needs",
+                    "Buggy and crashes frequently",
+                    "Not worth the price",
+                    "Missing key features I need",
+                    "Customer support is slow to respond",
+                ],
+            ],
+            dtype=object,
+        )
+        sentiments = np.array(["positive", "neutral", "negative"], dtype=object)
+
+        # Rating distribution (most tools have 4.0-4.5 avg)
+        # Notion AI: 4.5, Mem.ai: 4.3, Obsidian: 4.7, etc.
+        rating_distributions = {
+            "notion_ai": (4.5, 0.5),
+            "mem_ai": (4.3, 0.6),
+            "reflect": (4.4, 0.5),
+            "obsidian": (4.7, 0.4),
+            "roam": (4.0, 0.7),
+            "napkin_ai": (4.2, 0.6),
+            "recall": (4.4, 0.5),
+        }
 
-            for i in range(n_reviews):
-                rating = np.clip(np.random.normal(mean_rating, std_rating), 1, 5)
-                rating = round(rating * 2) / 2  # Round to 0.5
+        base_ids = roster["base_id"].unique()
+        mean_rating, std_rating = (
+            np.array([rating_distributions.get(k, (4.3, 0.5)) for k in base_ids])[
+                pd.Index(base_ids).get_indexer(roster["base_id"])
+            ]
+        ).T
+
+        n_templates = review_templates.shape[1]
+        draws = self._draw_per_competitor(
+            "reviews",
+            roster,
+            reviews_per_competitor,
+            {
+                "z": lambda rng, shape: rng.standard_normal(shape),
+                "template": lambda rng, shape: rng.integers(0, n_templates, shape),
+                "days_ago": lambda rng, shape: rng.integers(0, 365, shape),
+                "verified_purchase": lambda rng, shape: rng.random(shape) < 0.7,
+                "helpful_count": lambda rng, shape: rng.poisson(5, shape),
+            },
+        )
+        rating = np.repeat(mean_rating, reviews_per_competitor) + draws[
+            "z"
+        ] * np.repeat(std_rating, reviews_per_competitor)
+        rating = np.clip(rating, 1, 5)
+        rating = np.round(rating * 2) / 2  # Round to 0.5
+
+        # Select review text based on rating
+        sentiment = np.select([rating >= 4.5, rating >= 3.5], [0, 1], 2)
+
+        return pd.DataFrame(
+            {
+                "competitor_id": _take_strings(
+                    roster["competitor_id"],
+                    np.repeat(np.arange(len(roster)), reviews_per_competitor),
+                ),
+                "competitor_name": _take_strings(
+                    roster["competitor_name"],
+                    np.repeat(np.arange(len(roster)), reviews_per_competitor),
+                ),
+                "rating": rating,
+                "review_text": _take_strings(
+                    review_templates.ravel(),
+                    sentiment * review_templates.shape[1] + draws["template"],
+                ),
+                "sentiment": _take_strings(sentiments, sentiment),
+                "date": now - draws["days_ago"].astype("timedelta64[D]"),
+                "verified_purchase": draws["verified_purchase"],
+                "helpful_count": draws["helpful_count"],
+            }
+        )
 
-                # Select review text based on rating
-                if rating >= 4.5:
-                    review_text = np.random.choice(positive_reviews)
-                    sentiment = "positive"
-                elif rating >= 3.5:
-                    review_text = np.random.choice(neutral_reviews)
-                    sentiment = "neutral"
-                else:
-                    review_text = np.random.choice(negative_reviews)
-                    sentiment = "negative"
+    def generate_user_reviews(
+        self, reviews_per_competitor: int = 20, n_competitors: int = None
+    ) -> pd.DataFrame:
+        """
+        Generate synthetic user reviews (G2/Product Hunt style)
 
-                reviews_data.append(
-                    {
-                        "competitor_id": key,
-                        "competitor_name": comp["name"],
-                        "rating": rating,
-                        "review_text": review_text,
-                        "sentiment": sentiment,
-                        "date": datetime.now()
-                        - timedelta(days=np.random.randint(0, 365)),
-                        "verified_purchase": np.random.choice(
-                            [True, False], p=[0.7, 0.3]
-                        ),
-                        "helpful_count": np.random.poisson(5),
-                    }
-                )
+        Args:
+            reviews_per_competitor: Reviews drawn for each competitor
+            n_competitors: Competitors to simulate (default: COMPETITORS;
+                more adds synthetic variants)
+        """
+        print("⭐ Generating user reviews...")
 
-        self.reviews_data = pd.DataFrame(reviews_data)
+        # One reference time for the whole batch
+        now = np.datetime64(datetime.now(), "us")
+        self.reviews_data = self._reviews_frame(
+            self._competitor_roster(n_competitors), reviews_per_competitor, now
+        )
 
         print(f"✅ Generated {len(self.reviews_data)} user reviews")
         return self.reviews_data
 
+    def iter_review_batches(
+        self,
+        reviews_per_competitor: int = 20,
+        n_competitors: int = None,
+        batch_rows: int = 500_000,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        User reviews as a stream of batches of whole competitors, all dated
+        against one reference time
+
+        Args:
+            batch_rows: Approximate rows per batch
+        """
+        now = np.datetime64(datetime.now(), "us")
+        roster = self._competitor_roster(n_competitors)
+        step = max(1, batch_rows // reviews_per_competitor)
+        for start in range(0, len(roster), step):
+            batch = roster.iloc[start : start + step]
+            yield self._reviews_frame(batch, reviews_per_competitor, now)
+
     def save_all_data(self):
         """
         Save all generated data to CSV files
@@ -371,6 +601,10 @@ class CompetitiveDataCollector:
             )
             print(f"💾 Saved: feature_matrix.csv")
 
+        if self.feature_store is not None:
+            self.feature_store.save(PROCESSED_DATA_DIR / "feature_matrix.npz")
+            print(f"💾 Saved: feature_matrix.npz")
+
         if self.traffic_data is not None:
             self.traffic_data.to_csv(
                 SYNTHETIC_DATA_DIR / "traffic_estimates.csv", index=False
@@ -383,6 +617,56 @@ class CompetitiveDataCollector:
             )
             print(f"💾 Saved: user_reviews.csv")
 
+    def stream_synthetic_data(
+        self,
+        n_competitors: int = None,
+        n_months: int = 12,
+        reviews_per_competitor: int = 20,
+        file_format: str = "csv",
+        batch_rows: int = 500_000,
+        progress: Callable[[str, int, int], None] = None,
+        output_dir: Path = None,
+    ) -> Dict[str, Path]:
+        """
+        Generate traffic and reviews batch by batch straight to disk
+
+        Memory stays at about one batch regardless of scale. Files replace
+        traffic_estimates / user_reviews in output_dir (default:
+        SYNTHETIC_DATA_DIR); read them back with chunked_io.read_chunks.
+
+        Args:
+            file_format: "csv" (appended chunks) or "parquet" (one row group
+                per batch)
+            progress: Called as progress(table, rows_written, total_rows)
+                after every batch
+        """
+        roster_size = n_competitors or len(COMPETITORS)
+        tables = {
+            "traffic_estimates": (
+                self.iter_traffic_batches(n_months, n_competitors, batch_rows),
+                roster_size * n_months,
+            ),
+            "user_reviews": (
+                self.iter_review_batches(
+                    reviews_per_competitor, n_competitors, batch_rows
+                ),
+                roster_size * reviews_per_competitor,
+            ),
+        }
+
+        paths = {}
+        for table, (batches, total_rows) in tables.items():
+            path = Path(output_dir or SYNTHETIC_DATA_DIR) / f"{table}.{file_format}"
+            callback = None
+            if progress is not None:
+                callback = lambda rows, table=table, total=total_rows: progress(
+                    table, rows, total
+                )
+            rows = write_batches(batches, path, callback)
+            paths[table] = path
+            print(f"💾 Saved: {path.name} ({rows:,} rows)")
+        return paths
+
 
 if __name__ == "__main__":
     print("=" * 80)
@@ -402,3 +686,14 @@ if __name__ == "__main__":
     collector.save_all_data()
 
     print("\n✅ All competitive data generated successfully!")
+
+    # Scale check: 10M reviews and 100k competitor-months in memory
+    import time
+
+    start = time.perf_counter()
+    reviews = collector.generate_user_reviews(20, n_competitors=500_000)
+    traffic = collector.generate_traffic_estimates(12, n_competitors=8_334)
+    print(
+        f"Generated {len(reviews):,} reviews and {len(traffic):,} competitor-months "
+        f"in {time.perf_counter() - start:.1f}s"
+    )
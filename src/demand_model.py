@@ -0,0 +1,272 @@
+"""
+Demand Curve & Price Optimization
+Price-elasticity model evaluated over price x segment x tier cubes
+"""
+
+import pandas as pd
+import numpy as np
+from typing import Dict, List, Optional, Sequence
+from config import *
+
+
+class DemandCurveModel:
+    """
+    Exponential demand curves per segment and tier
+
+    Conversion at price p is
+    reference_conversion * exp(-elasticity * (p / reference_price - 1)),
+    capped at 100%, so `elasticity` is the point elasticity at the reference
+    price and revenue peaks at reference_price / elasticity. Every metric is
+    computed for the full price x segment x tier cube in one vectorized pass.
+    """
+
+    def __init__(self, demand_config: Dict = None, pricing_tiers: Dict = None):
+        demand_config = demand_config or DEMAND_MODEL
+        pricing_tiers = pricing_tiers or PRICING_TIERS
+
+        self.segments = list(demand_config["segments"].keys())
+        self.tiers = list(demand_config["tiers"].keys())
+        self.monthly_churn = demand_config["monthly_churn"]
+        self.grid_config = demand_config["price_grid"]
+
+        seg = demand_config["segments"]
+        tier = demand_config["tiers"]
+
+        # (segments, tiers) parameter matrices
+        self.active_users = np.array(
+            [[seg[s]["active_users"]] * len(self.tiers) for s in self.segments],
+            dtype=np.float64,
+        )
+        self.elasticity = np.array(
+            [[seg[s]["elasticity"]] * len(self.tiers) for s in self.segments],
+            dtype=np.float64,
+        )
+        self.reference_conversion = np.array(
+            [[tier[t]["reference_conversion"] for t in self.tiers]]
+            * len(self.segments),
+            dtype=np.float64,
+        )
+        self.reference_price = np.array(
+            [[pricing_tiers[t]["price_monthly"] for t in self.tiers]]
+            * len(self.segments),
+            dtype=np.float64,
+        )
+        self.cost_per_user = np.array(
+            [tier[t]["cost_per_user"] for t in self.tiers], dtype=np.float64
+        )
+
+    def price_grid(self) -> np.ndarray:
+        """
+        Default dense price grid (USD/month)
+        """
+        cfg = self.grid_config
+        return np.arange(cfg["min"], cfg["max"] + cfg["step"] / 2, cfg["step"])
+
+    def set_elasticity(self, segment: str, elasticity: float, tier: str = None):
+        """
+        Override elasticity for a segment (optionally a single tier)
+        """
+        s = self.segments.index(segment)
+        if tier is None:
+            self.elasticity[s, :] = elasticity
+        else:
+            self.elasticity[s, self.tiers.index(tier)] = elasticity
+
+    def fit_from_survey(
+        self, survey_df: pd.DataFrame, update_conversion: bool = True
+    ) -> pd.DataFrame:
+        """
+        Fit elasticity and reference conversion from survey take rates
+
+        Runs a log-linear least-squares fit (log take rate on price) per
+        (segment, tier) group using grouped sums, so the cost is one pass
+        over the survey rows.
+
+        Args:
+            survey_df: Columns segment, tier, price, take_rate (0-1)
+            update_conversion: Also take the conversion level from the survey;
+                False keeps configured levels and only fits the curve shape
+        """
+        df = survey_df[(survey_df["take_rate"] > 0) & (survey_df["price"] > 0)].copy()
+        df["log_q"] = np.log(df["take_rate"])
+        df["p2"] = df["price"] ** 2
+        df["pq"] = df["price"] * df["log_q"]
+
+        sums = df.groupby(["segment", "tier"])[["price", "log_q", "p2", "pq"]].agg(
+            ["sum", "count"]
+        )
+        n = sums[("price", "count")]
+        sp, sq = sums[("price", "sum")], sums[("log_q", "sum")]
+        spp, spq = sums[("p2", "sum")], sums[("pq", "sum")]
+
+        slope = (n * spq - sp * sq) / (n * spp - sp**2)
+        intercept = (sq - slope * sp) / n
+
+        fitted = pd.DataFrame(
+            {"slope": slope, "intercept": intercept, "observations": n}
+        ).reset_index()
+        fitted["elasticity"] = np.nan
+
+        for idx, row in fitted.iterrows():
+            if row["segment"] not in self.segments or row["tier"] not in self.tiers:
+                continue
+            s = self.segments.index(row["segment"])
+            t = self.tiers.index(row["tier"])
+            ref_price = self.reference_price[s, t]
+            fitted.loc[idx, "elasticity"] = -row["slope"] * ref_price
+            self.elasticity[s, t] = -row["slope"] * ref_price
+            if not update_conversion:
+                continue
+            self.reference_conversion[s, t] = min(
+                1.0, np.exp(row["intercept"] + row["slope"] * ref_price)
+            )
+
+        return fitted
+
+    def evaluate(self, prices: Optional[Sequence[float]] = None) -> Dict:
+        """
+        Evaluate demand and unit economics over the price x segment x tier cube
+
+        Returns arrays shaped (n_prices, n_segments, n_tiers).
+        """
+        prices = self.price_grid() if prices is None else np.asarray(prices, float)
+        p = prices[:, None, None]
+
+        conversion = np.minimum(
+            1.0,
+            self.reference_conversion
+            * np.exp(-self.elasticity * (p / self.reference_price - 1)),
+        )
+        paying_users = self.active_users * conversion
+        revenue = paying_users * p
+
+        cost = self.cost_per_user[None, None, :]
+        gross_margin = 1 - cost / p
+        gross_profit = paying_users * (p - cost)
+
+        lifetime_months = 1 / self.monthly_churn
+        ltv = p * gross_margin * lifetime_months
+        ltv_cac = ltv / UNIT_ECONOMICS["cac"]["blended"]
+
+        return {
+            "prices": prices,
+            "segments": self.segments,
+            "tiers": self.tiers,
+            "conversion": conversion,
+            "paying_users": paying_users,
+            "revenue": revenue,
+            "gross_margin": np.broadcast_to(gross_margin, revenue.shape),
+            "gross_profit": gross_profit,
+            "ltv": np.broadcast_to(ltv, revenue.shape),
+            "ltv_cac": np.broadcast_to(ltv_cac, revenue.shape),
+        }
+
+    def optimize(
+        self,
+        prices: Optional[Sequence[float]] = None,
+        objective: str = "revenue",
+        min_gross_margin: float = 0.70,
+        min_ltv_cac: float = 3.0,
+    ) -> pd.DataFrame:
+        """
+        Best price per (segment, tier) under margin and LTV/CAC constraints
+
+        Args:
+            objective: Cube metric to maximise ("revenue" or "gross_profit")
+        """
+        cube = self.evaluate(prices)
+
+        feasible = (cube["gross_margin"] >= min_gross_margin) & (
+            cube["ltv_cac"] >= min_ltv_cac
+        )
+        score = np.where(feasible, cube[objective], -np.inf)
+        best = np.argmax(score, axis=0)  # (segments, tiers)
+        has_feasible = feasible.any(axis=0)
+
+        s_idx, t_idx = np.meshgrid(
+            np.arange(len(self.segments)), np.arange(len(self.tiers)), indexing="ij"
+        )
+        s_idx, t_idx, best = s_idx.ravel(), t_idx.ravel(), best.ravel()
+
+        def pick(metric):
+            return cube[metric][best, s_idx, t_idx]
+
+        result = pd.DataFrame(
+            {
+                "segment": [self.segments[i] for i in s_idx],
+                "tier": [self.tiers[i] for i in t_idx],
+                "optimal_price": cube["prices"][best],
+                "reference_price": self.reference_price[s_idx, t_idx],
+                "elasticity": self.elasticity[s_idx, t_idx],
+                "conversion": pick("conversion"),
+                "paying_users": pick("paying_users"),
+                "revenue": pick("revenue"),
+                "gross_margin": pick("gross_margin"),
+                "ltv": pick("ltv"),
+                "ltv_cac": pick("ltv_cac"),
+                "feasible": has_feasible.ravel(),
+            }
+        )
+        # No feasible price: argmax fell back to the first grid point
+        chosen = [
+            "optimal_price",
+            "conversion",
+            "paying_users",
+            "revenue",
+            "gross_margin",
+            "ltv",
+            "ltv_cac",
+        ]
+        result.loc[~result["feasible"], chosen] = np.nan
+
+        return result
+
+    def optimize_uniform(
+        self,
+        prices: Optional[Sequence[float]] = None,
+        objective: str = "revenue",
+        min_gross_margin: float = 0.70,
+        min_ltv_cac: float = 3.0,
+    ) -> pd.DataFrame:
+        """
+        Best single list price per tier (same price for every segment)
+        """
+        cube = self.evaluate(prices)
+
+        feasible = (cube["gross_margin"] >= min_gross_margin) & (
+            cube["ltv_cac"] >= min_ltv_cac
+        )
+        totals = cube[objective].sum(axis=1)  # (prices, tiers)
+        tier_feasible = feasible.all(axis=1)
+        best = np.argmax(np.where(tier_feasible, totals, -np.inf), axis=0)
+        tier_idx = np.arange(len(self.tiers))
+
+        result = pd.DataFrame(
+            {
+                "tier": self.tiers,
+                "optimal_price": cube["prices"][best],
+                "reference_price": self.reference_price[0],
+                "paying_users": cube["paying_users"].sum(axis=1)[best, tier_idx],
+                "revenue": cube["revenue"].sum(axis=1)[best, tier_idx],
+                "gross_margin": cube["gross_margin"][best, 0, tier_idx],
+                "ltv_cac": cube["ltv_cac"][best, 0, tier_idx],
+                "feasible": tier_feasible.any(axis=0),
+            }
+        )
+        # No feasible price: argmax fell back to the first grid point
+        chosen = ["optimal_price", "paying_users", "revenue", "gross_margin", "ltv_cac"]
+        result.loc[~result["feasible"], chosen] = np.nan
+
+        return result
+
+
+if __name__ == "__main__":
+    print("=" * 80)
+    print(" DEMAND CURVE & PRICE OPTIMIZATION")
+    print("=" * 80)
+    print()
+
+    model = DemandCurveModel()
+    print(model.optimize().to_string())
+    print()
+    print(model.optimize_uniform().to_string())
@@ -0,0 +1,175 @@
+"""
+Feature Matrix Store
+Dense competitor x feature score matrix with index maps
+"""
+
+import pandas as pd
+import numpy as np
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+from config import *
+
+
+class FeatureMatrix:
+    """
+    Contiguous float32 competitor x feature scores with O(1) row, column
+    and cell access by competitor id or feature name
+
+    Competitors and features are kept in sorted order, matching
+    DataFrame.pivot on the long-format matrix.
+    """
+
+    def __init__(
+        self,
+        values,
+        competitors: Sequence[str],
+        features: Sequence[str],
+        source_dtype: str = "float32",
+    ):
+        """
+        Args:
+            values: Scores, shape (n_competitors, n_features); NaN = missing
+            source_dtype: dtype of the original scores, restored on export
+                so integer scores keep formatting as e.g. "9/10"
+        """
+        self.values = np.ascontiguousarray(values, dtype=np.float32)
+        self.competitors = list(competitors)
+        self.features = list(features)
+        self.source_dtype = np.dtype(source_dtype)
+
+        if self.values.shape != (len(self.competitors), len(self.features)):
+            raise ValueError("values shape must be (n_competitors, n_features)")
+
+        self.competitor_index = {c: i for i, c in enumerate(self.competitors)}
+        self.feature_index = {f: j for j, f in enumerate(self.features)}
+        self._pivot = None
+
+    @classmethod
+    def from_long(
+        cls,
+        frame: pd.DataFrame,
+        competitor_col: str = "competitor_id",
+        feature_col: str = "feature",
+        value_col: str = "score",
+    ) -> "FeatureMatrix":
+        """
+        Build from the long format used by feature_matrix.csv
+        """
+        comp_codes, competitors = pd.factorize(frame[competitor_col], sort=True)
+        feat_codes, features = pd.factorize(frame[feature_col], sort=True)
+
+        size = len(competitors) * len(features)
+        flat = comp_codes.astype(np.int64) * len(features) + feat_codes
+        if len(flat) and np.bincount(flat, minlength=size).max() > 1:
+            raise ValueError("Duplicate competitor/feature pairs in feature matrix")
+
+        values = np.full((len(competitors), len(features)), np.nan, dtype=np.float32)
+        values.reshape(-1)[flat] = frame[value_col].to_numpy(dtype=np.float32)
+
+        source_dtype = frame[value_col].dtype
+        if len(flat) < size:
+            source_dtype = np.float64  # Missing cells need NaN
+        return cls(values, competitors, features, source_dtype)
+
+    @property
+    def shape(self):
+        return self.values.shape
+
+    def __contains__(self, competitor_id: str) -> bool:
+        return competitor_id in self.competitor_index
+
+    def row(self, competitor_id: str) -> np.ndarray:
+        """
+        All feature scores for one competitor (view, O(1) lookup)
+        """
+        return self.values[self.competitor_index[competitor_id]]
+
+    def column(self, feature: str) -> np.ndarray:
+        """
+        One feature's scores across competitors (O(1) lookup)
+        """
+        return self.values[:, self.feature_index[feature]]
+
+    def score(self, competitor_id: str, feature: str) -> float:
+        return float(
+            self.values[
+                self.competitor_index[competitor_id], self.feature_index[feature]
+            ]
+        )
+
+    def as_source_dtype(self, values) -> np.ndarray:
+        """
+        Cast scores back to the dtype they were loaded with
+        """
+        return np.asarray(values).astype(self.source_dtype)
+
+    def pivot(self) -> pd.DataFrame:
+        """
+        Feature x competitor frame, equal to the long matrix pivoted (cached)
+        """
+        if self._pivot is None:
+            self._pivot = pd.DataFrame(
+                self.as_source_dtype(self.values.T),
+                index=pd.Index(self.features, name="feature"),
+                columns=pd.Index(self.competitors, name="competitor_id"),
+            )
+        return self._pivot
+
+    def invalidate(self):
+        """
+        Drop cached views after values were edited in place
+        """
+        self._pivot = None
+
+    def to_long(self) -> pd.DataFrame:
+        """
+        Long format (competitor_id, feature, score), skipping missing cells
+        """
+        comp_idx, feat_idx = np.nonzero(~np.isnan(self.values))
+        return pd.DataFrame(
+            {
+                "competitor_id": np.asarray(self.competitors, dtype=object)[comp_idx],
+                "feature": np.asarray(self.features, dtype=object)[feat_idx],
+                "score": self.as_source_dtype(self.values[comp_idx, feat_idx]),
+            }
+        )
+
+    def save(self, path: Path = None) -> Path:
+        """
+        Persist as an .npz archive (values + index labels)
+        """
+        path = Path(path or PROCESSED_DATA_DIR / "feature_matrix.npz")
+        np.savez(
+            path,
+            values=self.values,
+            competitors=np.asarray(self.competitors, dtype=str),
+            features=np.asarray(self.features, dtype=str),
+            source_dtype=np.asarray(self.source_dtype.str),
+        )
+        return path
+
+    @classmethod
+    def load(cls, path: Path = None) -> "FeatureMatrix":
+        """
+        Load a matrix written by save()
+        """
+        path = Path(path or PROCESSED_DATA_DIR / "feature_matrix.npz")
+        with np.load(path, allow_pickle=False) as data:
+            return cls(
+                data["values"],
+                data["competitors"].tolist(),
+                data["features"].tolist(),
+                str(data["source_dtype"]),
+            )
+
+    @classmethod
+    def load_or_build(cls, path: Path = None, csv_path: Path = None) -> "FeatureMatrix":
+        """
+        Load the collector's saved store, or build it from the long CSV when
+        no .npz has been written yet
+        """
+        path = Path(path or PROCESSED_DATA_DIR / "feature_matrix.npz")
+        if path.exists():
+            return cls.load(path)
+        csv_path = Path(csv_path or PROCESSED_DATA_DIR / "feature_matrix.csv")
+        return cls.from_long(pd.read_csv(csv_path))
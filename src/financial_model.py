@@ -8,6 +8,7 @@ import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple
 from config import *
+from billing_plans import BillingPlanModeler
 
 
 class FinancialModel:
@@ -19,6 +20,7 @@ class FinancialModel:
         self.monthly_projections = None
         self.revenue_model = None
         self.profitability_analysis = None
+        self.billing_projection = None
 
     def project_user_growth(self, months: int = 24) -> pd.DataFrame:
         """
@@ -213,6 +215,43 @@ class FinancialModel:
 
         return breakeven_analysis
 
+    def project_billing_cash_flow(self, configs: pd.DataFrame = None) -> pd.DataFrame:
+        """
+        Split projected MRR into cash receipts and deferred revenue by plan mix
+
+        Uses each month's new paying users as a billing cohort. The monthly
+        view is for the mix that collects the most cash.
+
+        Args:
+            configs: Plan mixes / annual discounts to compare (default:
+                BILLING_PLANS default mix)
+        """
+        print("🧾 Modeling billing plan cash flow...")
+
+        if self.monthly_projections is None:
+            self.project_user_growth()
+
+        modeler = BillingPlanModeler()
+        cohorts = self.monthly_projections["new_paying"].to_numpy()
+        simulation = modeler.simulate(cohorts, configs)
+        comparison = modeler.compare(cohorts, configs)
+        best = int(comparison["total_cash"].to_numpy().argmax())
+
+        self.billing_projection = {
+            "monthly": modeler.monthly_frame(simulation, best),
+            "comparison": comparison,
+            "best": best,
+        }
+
+        monthly = self.billing_projection["monthly"]
+        print(f"✅ Billing cash flow modeled for {len(monthly)} months")
+        print(f"   Cash collected: ${monthly['cash_receipts'].sum():,.0f}")
+        print(
+            f"   Ending deferred revenue: ${monthly['deferred_revenue'].iloc[-1]:,.0f}"
+        )
+
+        return self.billing_projection["comparison"]
+
     def generate_financial_report(self) -> str:
         """
         Generate comprehensive financial report
@@ -318,6 +357,24 @@ class FinancialModel:
         report += f"   Users: {user_growth_rate*100:.1f}%\n"
         report += f"   Revenue: {revenue_growth_rate*100:.1f}%\n"
 
+        if self.billing_projection is not None:
+            monthly = self.billing_projection["monthly"]
+            comparison = self.billing_projection["comparison"]
+            best = comparison.iloc[self.billing_projection["best"]]
+            report += "\n\n"
+            report += "🧾 BILLING PLAN CASH FLOW\n"
+            report += "-" * 80 + "\n"
+            if len(comparison) > 1:
+                report += f"Best of {len(comparison)} plan mixes by cash collected\n"
+            report += f"Plan Mix: {best['mix_monthly']*100:.0f}% monthly, {best['mix_annual']*100:.0f}% annual ({best['annual_discount']*100:.0f}% off), {best['mix_promo']*100:.0f}% promo\n"
+            report += f"   Cash Collected: ${best['total_cash']:,.0f}\n"
+            report += f"   Recognized Revenue: ${best['total_revenue']:,.0f}\n"
+            report += (
+                f"   Ending Deferred Revenue: ${best['ending_deferred_revenue']:,.0f}\n"
+            )
+            report += f"   Effective ARPU: ${best['effective_arpu']:.2f}/month\n"
+            report += f"   Month 12 Cash Receipts: ${monthly['cash_receipts'].iloc[11]:,.0f}\n"
+
         report += "\n\n"
         report += "🎯 FUNDRAISING READINESS (Month 12)\n"
         report += "-" * 80 + "\n"
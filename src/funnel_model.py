@@ -0,0 +1,219 @@
+"""
+Funnel Evaluation Engine
+Batch evaluation of multi-stage market-capture funnels
+"""
+
+import pandas as pd
+import numpy as np
+from typing import Dict, List, Optional, Sequence
+from config import *
+
+
+class FunnelEvaluator:
+    """
+    Evaluates thousands of conversion funnels (channels, segments, scenarios)
+    in a single array pass
+    """
+
+    DEFAULT_STAGES = ["aware", "signups", "activated", "captured"]
+
+    def __init__(self, stage_names: Optional[Sequence[str]] = None):
+        self.stage_names = list(stage_names or self.DEFAULT_STAGES)
+
+    def _prepare(self, entrants, stage_rates) -> tuple:
+        """
+        Broadcast entrants and stage rates to (n_funnels,) and (n_funnels, n_stages)
+        """
+        rates = np.atleast_2d(np.asarray(stage_rates, dtype=np.float64))
+        if rates.shape[1] != len(self.stage_names):
+            raise ValueError(
+                f"Expected {len(self.stage_names)} stage rates, got {rates.shape[1]}"
+            )
+        if np.any((rates < 0) | (rates > 1)):
+            raise ValueError("Stage rates must be between 0 and 1")
+
+        entrants = np.asarray(entrants, dtype=np.float64)
+        n_funnels = max(rates.shape[0], entrants.size)
+        rates = np.broadcast_to(rates, (n_funnels, rates.shape[1]))
+        entrants = np.broadcast_to(entrants.reshape(-1), (n_funnels,))
+
+        return entrants, rates
+
+    def evaluate(self, entrants, stage_rates, integer_exact: bool = False) -> Dict:
+        """
+        Evaluate a batch of funnels
+
+        Args:
+            entrants: Top-of-funnel population, scalar or shape (n_funnels,)
+            stage_rates: Stage conversion rates, shape (n_stages,) or (n_funnels, n_stages)
+            integer_exact: Truncate to whole users after every stage, matching
+                the sequential int() arithmetic of MarketSizer.calculate_som
+        """
+        entrants, rates = self._prepare(entrants, stage_rates)
+
+        if integer_exact:
+            counts = np.empty((rates.shape[0], rates.shape[1] + 1), dtype=np.int64)
+            counts[:, 0] = np.trunc(entrants)
+            for stage in range(rates.shape[1]):
+                counts[:, stage + 1] = np.trunc(counts[:, stage] * rates[:, stage])
+        else:
+            counts = np.empty((rates.shape[0], rates.shape[1] + 1), dtype=np.float64)
+            counts[:, 0] = entrants
+            counts[:, 1:] = entrants[:, None] * np.cumprod(rates, axis=1)
+
+        # Realised conversions (differ from the inputs in integer-exact mode)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            conversions = np.where(
+                counts[:, :-1] > 0, counts[:, 1:] / counts[:, :-1], 0.0
+            )
+            overall = np.where(counts[:, 0] > 0, counts[:, -1] / counts[:, 0], 0.0)
+
+        return {
+            "stages": ["entrants"] + self.stage_names,
+            "counts": counts,
+            "conversions": conversions,
+            "overall_conversion": overall,
+        }
+
+    def evaluate_frame(
+        self, entrants, stage_rates, integer_exact: bool = False
+    ) -> pd.DataFrame:
+        """
+        Evaluate a batch of funnels and return one row per funnel
+        """
+        result = self.evaluate(entrants, stage_rates, integer_exact=integer_exact)
+
+        frame = pd.DataFrame(result["counts"], columns=result["stages"])
+        for idx, stage in enumerate(self.stage_names):
+            frame[f"{stage}_rate"] = result["conversions"][:, idx]
+        frame["overall_conversion"] = result["overall_conversion"]
+
+        return frame
+
+    def sweep(
+        self, entrants, rate_grids: Dict[str, Sequence[float]], integer_exact=False
+    ) -> pd.DataFrame:
+        """
+        Evaluate every combination of candidate stage rates
+
+        Args:
+            entrants: Top-of-funnel population shared by all scenarios
+            rate_grids: Candidate rates per stage name (one list per stage)
+        """
+        missing = [s for s in self.stage_names if s not in rate_grids]
+        if missing:
+            raise ValueError(f"Missing rate grid for stages: {missing}")
+
+        mesh = np.meshgrid(
+            *[np.asarray(rate_grids[s], dtype=np.float64) for s in self.stage_names],
+            indexing="ij",
+        )
+        rates = np.stack([axis.reshape(-1) for axis in mesh], axis=1)
+
+        frame = self.evaluate_frame(entrants, rates, integer_exact=integer_exact)
+        for idx, stage in enumerate(self.stage_names):
+            frame[f"{stage}_target"] = rates[:, idx]
+
+        return frame
+
+    def required_entrants(self, targets, stage_rates, stage: str) -> np.ndarray:
+        """
+        Back-solve the top-of-funnel population needed to hit a target
+        at a given stage (continuous mode)
+        """
+        _, rates = self._prepare(0, stage_rates)
+        stage_idx = self.stage_names.index(stage)
+        throughput = np.prod(rates[:, : stage_idx + 1], axis=1)
+
+        targets = np.broadcast_to(
+            np.asarray(targets, dtype=np.float64), throughput.shape
+        )
+        with np.errstate(divide="ignore"):
+            return np.where(throughput > 0, targets / throughput, np.inf)
+
+    def reconcile_with_channels(
+        self,
+        channel_strategy: Dict,
+        stage_rates,
+        target_stage: str = None,
+        cost_stages: Sequence[str] = None,
+    ) -> pd.DataFrame:
+        """
+        Reconcile funnel rates with GTMPlanner channel expectations
+
+        Each channel's expected_users is treated as the target for
+        target_stage; the funnel is back-solved for the reach it implies
+        and run forward to show downstream activation and capture.
+
+        Args:
+            channel_strategy: Output of GTMPlanner.define_channel_strategy()
+            stage_rates: Rates shared by all channels, or one row per channel
+            target_stage: Stage the channels' expected_users count (default:
+                the second stage, i.e. sign-ups)
+            cost_stages: Stages to report budget per user for (default: the
+                last two stages, i.e. activated and captured)
+        """
+        target_stage = (
+            target_stage or self.stage_names[min(1, len(self.stage_names) - 1)]
+        )
+        cost_stages = list(cost_stages or self.stage_names[-2:])
+        unknown = [s for s in cost_stages if s not in self.stage_names]
+        if unknown:
+            raise ValueError(f"Unknown funnel stages: {unknown}")
+
+        channels = channel_strategy["channels"]
+        channel_ids = list(channels.keys())
+        expected = np.array(
+            [channels[ch]["expected_users"] for ch in channel_ids], dtype=np.float64
+        )
+        budgets = np.array(
+            [channels[ch]["budget"] for ch in channel_ids], dtype=np.float64
+        )
+
+        rates = np.atleast_2d(np.asarray(stage_rates, dtype=np.float64))
+        rates = np.broadcast_to(rates, (len(channel_ids), rates.shape[1]))
+
+        reach = self.required_entrants(expected, rates, target_stage)
+        result = self.evaluate(reach, rates)
+        counts = result["counts"]
+
+        frame = pd.DataFrame(
+            {
+                "channel": channel_ids,
+                "name": [channels[ch]["name"] for ch in channel_ids],
+                "expected_users": expected,
+                "required_reach": reach,
+            }
+        )
+        for idx, stage in enumerate(self.stage_names):
+            frame[stage] = counts[:, idx + 1]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for stage in cost_stages:
+                frame[f"cost_per_{stage}"] = np.where(
+                    frame[stage] > 0, budgets / frame[stage], np.nan
+                )
+
+        return frame
+
+
+if __name__ == "__main__":
+    print("=" * 80)
+    print(" FUNNEL EVALUATOR")
+    print("=" * 80)
+    print()
+
+    evaluator = FunnelEvaluator()
+
+    # Awareness x signup sweep around the SOM defaults
+    sweep = evaluator.sweep(
+        int(13_000_000 * 0.30 * 0.80),
+        {
+            "aware": np.linspace(0.02, 0.10, 9),
+            "signups": np.linspace(0.10, 0.30, 5),
+            "activated": [0.40],
+            "captured": [0.10],
+        },
+        integer_exact=True,
+    )
+    print(sweep[["aware_target", "signups_target", "captured"]].to_string())
@@ -0,0 +1,124 @@
+"""
+Conjugate Posteriors for Market-Sizing Assumptions
+Beta and Gamma updates from observed post-launch counts
+"""
+
+import numpy as np
+from typing import Dict, Optional
+
+# z-score for the 90% credible interval (normal approximation)
+Z_90 = 1.6448536269514722
+
+
+class BetaPosterior:
+    """
+    Beta posterior for a conversion rate or penetration percentage
+    """
+
+    def __init__(self, prior_mean: float, prior_strength: float = 100.0):
+        """
+        Args:
+            prior_mean: Prior expected rate (e.g. the config assumption)
+            prior_strength: Pseudo-observations backing the prior
+        """
+        self.alpha = prior_mean * prior_strength
+        self.beta = (1 - prior_mean) * prior_strength
+        self.observations = 0
+        self._summary = None
+
+    def update(self, successes: int, trials: int) -> "BetaPosterior":
+        """
+        Add observed successes out of trials (O(1))
+        """
+        if successes < 0 or trials < successes:
+            raise ValueError("Need 0 <= successes <= trials")
+
+        self.alpha += successes
+        self.beta += trials - successes
+        self.observations += trials
+        self._summary = None
+        return self
+
+    @property
+    def mean(self) -> float:
+        return self.alpha / (self.alpha + self.beta)
+
+    def summary(self) -> Dict:
+        """
+        Posterior summary (cached until the next update)
+        """
+        if self._summary is None:
+            total = self.alpha + self.beta
+            mean = self.alpha / total
+            std = np.sqrt(self.alpha * self.beta / (total**2 * (total + 1)))
+            self._summary = {
+                "mean": mean,
+                "std": std,
+                "ci_90": (max(0.0, mean - Z_90 * std), min(1.0, mean + Z_90 * std)),
+                "alpha": self.alpha,
+                "beta": self.beta,
+                "observations": self.observations,
+            }
+        return self._summary
+
+
+class GammaPosterior:
+    """
+    Gamma posterior for a Poisson rate (e.g. weekly sign-ups)
+    """
+
+    def __init__(self, prior_mean: float, prior_periods: float = 1.0):
+        """
+        Args:
+            prior_mean: Prior expected count per period
+            prior_periods: Pseudo-periods backing the prior
+        """
+        self.shape = prior_mean * prior_periods
+        self.rate = prior_periods
+        self.prior_periods = prior_periods
+        self.count = 0
+        self.periods = 0
+        self._summary = None
+
+    def update(self, count: int, periods: float = 1.0) -> "GammaPosterior":
+        """
+        Add an observed count over a number of periods (O(1))
+        """
+        if count < 0 or periods <= 0:
+            raise ValueError("Need count >= 0 and periods > 0")
+
+        self.shape += count
+        self.rate += periods
+        self.count += count
+        self.periods += periods
+        self._summary = None
+        return self
+
+    def set_prior_mean(self, prior_mean: float) -> "GammaPosterior":
+        """
+        Move the prior expectation while keeping the observed counts (O(1))
+        """
+        self.shape = prior_mean * self.prior_periods + self.count
+        self._summary = None
+        return self
+
+    @property
+    def mean(self) -> float:
+        return self.shape / self.rate
+
+    def summary(self) -> Dict:
+        """
+        Posterior summary (cached until the next update)
+        """
+        if self._summary is None:
+            mean = self.shape / self.rate
+            std = np.sqrt(self.shape) / self.rate
+            self._summary = {
+                "mean": mean,
+                "std": std,
+                "ci_90": (max(0.0, mean - Z_90 * std), mean + Z_90 * std),
+                "shape": self.shape,
+                "rate": self.rate,
+                "periods": self.periods,
+            }
+        return self._summary
@@ -0,0 +1,265 @@
+"""
+Market Sizing Reconciliation
+Reconciles bottom-up and top-down market estimates
+"""
+
+import pandas as pd
+import numpy as np
+from typing import Dict, List, Optional, Sequence
+from config import *
+
+
+class MarketReconciler:
+    """
+    Solves for consistent adjustments between competing market estimates
+    using weighted least squares
+    """
+
+    def solve_wls(
+        self,
+        prior,
+        constraint_matrix,
+        targets,
+        cell_weights=None,
+        constraint_weights=None,
+        lower=None,
+        upper=None,
+    ) -> np.ndarray:
+        """
+        Weighted least-squares adjustment of prior cell estimates
+
+        Minimises sum(w_i * (x_i - prior_i)^2) + sum(v_j * (A_j x - t_j)^2).
+        Constraints with infinite weight are enforced exactly. The solve only
+        factorises the (n_constraints x n_constraints) system, so it stays
+        fast for thousands of cells.
+
+        Args:
+            prior: Flattened prior cell estimates, shape (n_cells,)
+            constraint_matrix: Linear constraint rows, shape (n_constraints, n_cells)
+            targets: Constraint targets, shape (n_constraints,)
+            cell_weights: Inverse variance of each prior (default 1 / prior^2,
+                i.e. the same relative uncertainty for every cell)
+            constraint_weights: Confidence in each target (default: exact)
+            lower, upper: Optional bounds; cells hitting a bound are pinned
+                and the remaining cells re-solved
+        """
+        prior = np.asarray(prior, dtype=np.float64).reshape(-1)
+        A = np.atleast_2d(np.asarray(constraint_matrix, dtype=np.float64))
+        targets = np.asarray(targets, dtype=np.float64).reshape(-1)
+
+        if cell_weights is None:
+            cell_weights = 1.0 / np.maximum(prior**2, 1e-24)
+        cell_var = 1.0 / np.broadcast_to(
+            np.asarray(cell_weights, dtype=np.float64), prior.shape
+        )
+
+        if constraint_weights is None:
+            constraint_var = np.zeros(len(targets))
+        else:
+            constraint_var = 1.0 / np.broadcast_to(
+                np.asarray(constraint_weights, dtype=np.float64), targets.shape
+            )
+
+        lower = np.full(prior.shape, -np.inf) if lower is None else lower
+        upper = np.full(prior.shape, np.inf) if upper is None else upper
+        lower = np.broadcast_to(np.asarray(lower, dtype=np.float64), prior.shape)
+        upper = np.broadcast_to(np.asarray(upper, dtype=np.float64), prior.shape)
+
+        free = np.ones(prior.shape, dtype=bool)
+        adjusted = prior.copy()
+
+        # Active-set loop: pin violated cells to their bound and re-solve
+        for _ in range(len(prior) + 1):
+            var = np.where(free, cell_var, 0.0)
+            pinned = np.where(free, prior, adjusted)
+            residual = targets - A @ pinned
+
+            system = (A * var) @ A.T + np.diag(constraint_var)
+            multipliers = np.linalg.lstsq(system, residual, rcond=None)[0]
+            adjusted = pinned + var * (A.T @ multipliers)
+
+            violated = free & ((adjusted < lower) | (adjusted > upper))
+            if not violated.any():
+                break
+            adjusted = np.clip(adjusted, lower, upper)
+            free &= ~violated
+
+        return adjusted
+
+    def movement_report(
+        self, labels: Sequence[str], prior, adjusted, log_scale: bool = False
+    ) -> pd.DataFrame:
+        """
+        Rank assumptions by how far the reconciliation moved them
+
+        Args:
+            log_scale: Values are log-transformed (multiplicative assumptions)
+        """
+        prior = np.asarray(prior, dtype=np.float64).reshape(-1)
+        adjusted = np.asarray(adjusted, dtype=np.float64).reshape(-1)
+
+        if log_scale:
+            prior, adjusted = np.exp(prior), np.exp(adjusted)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pct_change = np.where(prior != 0, adjusted / prior - 1, np.nan)
+
+        report = pd.DataFrame(
+            {
+                "assumption": list(labels),
+                "original": prior,
+                "reconciled": adjusted,
+                "change": adjusted - prior,
+                "pct_change": pct_change,
+            }
+        )
+        report["abs_pct_change"] = report["pct_change"].abs()
+
+        return report.sort_values(
+            "abs_pct_change", ascending=False, kind="stable"
+        ).reset_index(drop=True)
+
+    @staticmethod
+    def largest_movement(report: pd.DataFrame) -> Optional[str]:
+        """
+        Assumption that moved most, or None when the top moves are tied
+        (e.g. every assumption moved by the same percentage)
+        """
+        moves = report["abs_pct_change"].to_numpy()
+        if len(moves) == 0 or (len(moves) > 1 and np.isclose(moves[0], moves[1])):
+            return None
+        return report["assumption"].iloc[0]
+
+    def reconcile_tam(
+        self,
+        tam_data: Dict,
+        topdown_weight: float = None,
+        segment_uncertainty: Optional[Dict[str, float]] = None,
+    ) -> Dict:
+        """
+        Reconcile bottom-up TAM segments with the top-down total
+
+        Args:
+            tam_data: Output of MarketSizer.calculate_tam()
+            topdown_weight: Confidence in the top-down total relative to the
+                segments combined (None = treat top-down total as exact)
+            segment_uncertainty: Relative standard error per segment
+                (default: MARKET_UNCERTAINTY["tam_segments"])
+        """
+        segments = tam_data["bottomup"]["segments"]
+        labels = list(segments.keys())
+        prior = np.array([segments[s]["total"] for s in labels], dtype=np.float64)
+        topdown_total = tam_data["topdown"]["total"]
+
+        uncertainty = {
+            **MARKET_UNCERTAINTY["tam_segments"],
+            **(segment_uncertainty or {}),
+        }
+        fallback = max(uncertainty.values())
+        cell_var = (
+            np.array([uncertainty.get(s, fallback) for s in labels]) * prior
+        ) ** 2
+
+        constraint_weights = None
+        if topdown_weight is not None:
+            constraint_weights = topdown_weight / cell_var.sum()
+
+        adjusted = self.solve_wls(
+            prior,
+            np.ones((1, len(prior))),
+            [topdown_total],
+            cell_weights=1.0 / cell_var,
+            constraint_weights=constraint_weights,
+            lower=0,
+        )
+
+        return {
+            "segments": dict(zip(labels, adjusted)),
+            "bottomup_total": float(prior.sum()),
+            "topdown_total": float(topdown_total),
+            "reconciled_total": float(adjusted.sum()),
+            "movements": self.movement_report(labels, prior, adjusted),
+        }
+
+    def reconcile_som(
+        self,
+        som_data: Dict,
+        assumption_confidence: Optional[Dict[str, float]] = None,
+        alternative_weight: Optional[float] = 1.0,
+    ) -> Dict:
+        """
+        Reconcile the funnel SOM with the top-down alternative estimate
+
+        The funnel is multiplicative, so the solve runs in log space: each
+        assumption absorbs a share of the log-gap in proportion to its
+        variance (relative standard error squared). Rates are capped at 100%.
+
+        Args:
+            som_data: Output of MarketSizer.calculate_som()
+            assumption_confidence: Inverse log-variance per funnel assumption
+                (higher = moves less; default from MARKET_UNCERTAINTY)
+            alternative_weight: Confidence in the alternative estimate relative
+                to the funnel combined (None = treat it as exact)
+        """
+        calc = som_data["calculation"]
+        assumptions = {
+            "potential_users": calc["beachhead_segment"]["potential_users"],
+            "awareness_rate": calc["market_capture"]["awareness_rate"],
+            "signup_rate": calc["market_capture"]["signup_rate"],
+            "activation_rate": calc["market_capture"]["activation_rate"],
+            "our_share_percentage": calc["competitive_share"]["our_share_percentage"],
+        }
+        confidence = {
+            name: 1.0 / uncertainty**2
+            for name, uncertainty in MARKET_UNCERTAINTY["som_assumptions"].items()
+        }
+        confidence.update(assumption_confidence or {})
+
+        labels = list(assumptions.keys())
+        log_prior = np.log([assumptions[k] for k in labels])
+        weights = np.array([confidence[k] for k in labels], dtype=np.float64)
+        upper = np.array([np.inf] + [0.0] * (len(labels) - 1))
+
+        constraint_weights = None
+        if alternative_weight is not None:
+            constraint_weights = alternative_weight / (1.0 / weights).sum()
+
+        adjusted = self.solve_wls(
+            log_prior,
+            np.ones((1, len(labels))),
+            [np.log(som_data["alternative_estimate"])],
+            cell_weights=weights,
+            constraint_weights=constraint_weights,
+            upper=upper,
+        )
+
+        return {
+            "assumptions": dict(zip(labels, np.exp(adjusted))),
+            "funnel_estimate": som_data["final"],
+            "alternative_estimate": som_data["alternative_estimate"],
+            "reconciled_som": float(np.exp(adjusted.sum())),
+            "movements": self.movement_report(
+                labels, log_prior, adjusted, log_scale=True
+            ),
+        }
+
+
+if __name__ == "__main__":
+    from market_sizer import MarketSizer
+
+    print("=" * 80)
+    print(" MARKET RECONCILIATION")
+    print("=" * 80)
+    print()
+
+    sizer = MarketSizer()
+    sizer.calculate_som()
+
+    reconciler = MarketReconciler()
+    tam = reconciler.reconcile_tam(sizer.tam_data, topdown_weight=1.0)
+    som = reconciler.reconcile_som(sizer.som_data)
+
+    print(f"\nReconciled TAM: {tam['reconciled_total']:,.0f}")
+    print(tam["movements"].to_string())
+    print(f"\nReconciled SOM: {som['reconciled_som']:,.0f}")
+    print(som["movements"].to_string())
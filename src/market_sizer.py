@@ -7,6 +7,9 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple
 from config import *
+from funnel_model import FunnelEvaluator
+from market_reconciler import MarketReconciler
+from market_posteriors import BetaPosterior, GammaPosterior
 
 
 class MarketSizer:
@@ -19,6 +22,10 @@ class MarketSizer:
         self.tam_data = None
         self.sam_data = None
         self.som_data = None
+        self.reconciliation = None
+        self.posteriors = None
+        self.posterior_estimates = None
+        self._posterior_drivers = None
         self.assumptions = []
 
     def calculate_tam(self) -> Dict:
@@ -231,19 +238,27 @@ class MarketSizer:
             },
         }
 
-        # Calculate step by step
+        # Calculate step by step (integer-exact funnel)
         potential = som_calculation["beachhead_segment"]["potential_users"]
-        aware = int(potential * som_calculation["market_capture"]["awareness_rate"])
-        signups = int(aware * som_calculation["market_capture"]["signup_rate"])
-        activated = int(signups * som_calculation["market_capture"]["activation_rate"])
+        funnel = FunnelEvaluator().evaluate(
+            potential,
+            [
+                som_calculation["market_capture"]["awareness_rate"],
+                som_calculation["market_capture"]["signup_rate"],
+                som_calculation["market_capture"]["activation_rate"],
+                som_calculation["competitive_share"]["our_share_percentage"],
+            ],
+            integer_exact=True,
+        )
+        _, aware, signups, activated, som_final = (
+            int(count) for count in funnel["counts"][0]
+        )
 
+        som_calculation["market_capture"]["users_aware"] = aware
+        som_calculation["market_capture"]["users_signed_up"] = signups
         som_calculation["market_capture"]["users_activated"] = activated
         som_calculation["competitive_share"]["total_market"] = potential
 
-        som_final = int(
-            activated * som_calculation["competitive_share"]["our_share_percentage"]
-        )
-
         # Alternative SOM (top-down from SAM)
         som_alternative = int(sam * 0.04)  # 4% of SAM (conservative)
 
@@ -283,6 +298,259 @@ class MarketSizer:
 
         return self.som_data
 
+    def reconcile_estimates(
+        self, topdown_weight: float = 1.0, alternative_weight: float = 1.0
+    ) -> Dict:
+        """
+        Reconcile bottom-up vs top-down TAM and funnel vs alternative SOM
+
+        Args:
+            topdown_weight: Confidence in the top-down TAM total (None = exact)
+            alternative_weight: Confidence in the 4%-of-SAM SOM (None = exact)
+        """
+        print("⚖️  Reconciling top-down and bottom-up estimates...")
+
+        if self.som_data is None:
+            self.calculate_som()
+
+        reconciler = MarketReconciler()
+        self.reconciliation = {
+            "tam": reconciler.reconcile_tam(
+                self.tam_data, topdown_weight=topdown_weight
+            ),
+            "som": reconciler.reconcile_som(
+                self.som_data, alternative_weight=alternative_weight
+            ),
+        }
+
+        tam_moves = self.reconciliation["tam"]["movements"]
+        som_moves = self.reconciliation["som"]["movements"]
+        print(
+            f"✅ Reconciled TAM: {self.reconciliation['tam']['reconciled_total']:,.0f} users"
+        )
+        print(
+            f"✅ Reconciled SOM: {self.reconciliation['som']['reconciled_som']:,.0f} users"
+        )
+        for label, moves in (("SOM", som_moves), ("TAM", tam_moves)):
+            largest = reconciler.largest_movement(moves)
+            print(
+                f"   Largest {label} adjustment: {largest or 'none (all moved by the same %)'}"
+            )
+
+        return self.reconciliation
+
+    # Awareness and sign-up rates set the expected weekly sign-ups; sign-ups
+    # and the remaining funnel rates drive SOM, SAM filters drive SAM and
+    # conversion drives revenue
+    SIGNUP_DRIVERS = ["awareness_rate", "signup_rate"]
+    SOM_DRIVERS = ["activation_rate", "share"]
+    SAM_DRIVERS = [
+        "english_language",
+        "digital_tool_adoption",
+        "ai_tool_willingness",
+        "paid_tool_willingness",
+    ]
+
+    def initialize_posteriors(self, prior_strength: float = 100.0) -> Dict:
+        """
+        Set Beta/Gamma priors from the current sizing assumptions
+
+        Args:
+            prior_strength: Pseudo-observations behind each prior rate; lower
+                values let real launch data dominate sooner
+        """
+        print("🎲 Initializing Bayesian posteriors from sizing assumptions...")
+
+        if self.som_data is None:
+            self.calculate_som()
+
+        capture = self.som_data["calculation"]["market_capture"]
+        share = self.som_data["calculation"]["competitive_share"]
+        revenue = self.som_data["revenue_potential"]
+
+        prior_rates = {
+            "awareness_rate": capture["awareness_rate"],
+            "signup_rate": capture["signup_rate"],
+            "activation_rate": capture["activation_rate"],
+            "share": share["our_share_percentage"],
+            "conversion_rate": revenue["conversion_rate"],
+        }
+        for name in self.SAM_DRIVERS:
+            prior_rates[name] = self.sam_data["filters"][name]["percentage"]
+
+        weeks = self.som_data["timeframe_months"] * 52 / 12
+        self.posteriors = {
+            name: BetaPosterior(rate, prior_strength)
+            for name, rate in prior_rates.items()
+        }
+        potential = self.som_data["calculation"]["beachhead_segment"]["potential_users"]
+        signup_product = float(
+            np.prod([self.posteriors[n].mean for n in self.SIGNUP_DRIVERS])
+        )
+        self.posteriors["weekly_signups"] = GammaPosterior(
+            potential * signup_product / weeks
+        )
+
+        # Cached products so each observation refreshes estimates in O(1)
+        self._posterior_drivers = {
+            "means": {name: post.mean for name, post in self.posteriors.items()},
+            "weeks": weeks,
+            "potential_per_week": potential / weeks,
+            "signup_product": signup_product,
+            "som_product": float(
+                np.prod([self.posteriors[n].mean for n in self.SOM_DRIVERS])
+            ),
+            "sam_product": float(
+                np.prod([self.posteriors[n].mean for n in self.SAM_DRIVERS])
+            ),
+        }
+        self._refresh_posterior_estimates()
+
+        print(f"✅ {len(self.posteriors)} posteriors initialized")
+        return self.posterior_summary()
+
+    def _refresh_driver(self, name: str):
+        """
+        Fold one updated posterior mean into the cached products
+        """
+        drivers = self._posterior_drivers
+        old_mean = drivers["means"][name]
+        new_mean = self.posteriors[name].mean
+        drivers["means"][name] = new_mean
+
+        for group, product_key in (
+            (self.SIGNUP_DRIVERS, "signup_product"),
+            (self.SOM_DRIVERS, "som_product"),
+            (self.SAM_DRIVERS, "sam_product"),
+        ):
+            if name in group:
+                if old_mean > 0:
+                    drivers[product_key] *= new_mean / old_mean
+                else:
+                    drivers[product_key] = float(
+                        np.prod([drivers["means"][n] for n in group])
+                    )
+
+        # Top-of-funnel rates move the sign-up prior, keeping observed weeks
+        if name in self.SIGNUP_DRIVERS:
+            signups = self.posteriors["weekly_signups"].set_prior_mean(
+                drivers["potential_per_week"] * drivers["signup_product"]
+            )
+            drivers["means"]["weekly_signups"] = signups.mean
+
+    def _refresh_posterior_estimates(self):
+        """
+        Recompute downstream SAM/SOM/revenue from cached products (O(1))
+        """
+        drivers = self._posterior_drivers
+        arpu = self.som_data["revenue_potential"]["arpu_monthly"]
+
+        sam = self.tam_data["final"] * drivers["sam_product"]
+        signups = drivers["means"]["weekly_signups"] * drivers["weeks"]
+        som = signups * drivers["som_product"]
+        paying = som * drivers["means"]["conversion_rate"]
+
+        self.posterior_estimates = {
+            "sam": sam,
+            "som": som,
+            "penetration_of_sam": som / sam if sam > 0 else 0.0,
+            "weekly_signups": drivers["means"]["weekly_signups"],
+            "paying_customers": paying,
+            "mrr": paying * arpu,
+            "arr": paying * arpu * 12,
+        }
+
+    def observe_week(
+        self,
+        signups: int,
+        activated: int = None,
+        paying: int = None,
+        aware: int = None,
+    ) -> Dict:
+        """
+        Update posteriors with one week of observed launch data
+
+        Sign-ups alone move SOM through the weekly sign-up rate; paying users
+        are only counted against the activated users they converted from.
+
+        Args:
+            signups: New sign-ups this week
+            activated: Sign-ups that activated (created a knowledge graph)
+            paying: Activated users that converted to paid (needs activated)
+            aware: Users reached by GTM campaigns (if tracked)
+        """
+        if paying is not None and activated is None:
+            raise ValueError(
+                "paying needs activated (conversion is paying / activated)"
+            )
+
+        updates = [("weekly_signups", (signups,))]
+        if aware is not None:
+            updates.append(("signup_rate", (signups, aware)))
+        if activated is not None:
+            updates.append(("activation_rate", (activated, signups)))
+        if paying is not None:
+            updates.append(("conversion_rate", (paying, activated)))
+
+        # Validate the whole week before any posterior changes
+        if signups < 0:
+            raise ValueError("signups must be >= 0")
+        for name, args in updates[1:]:
+            successes, trials = args
+            if not 0 <= successes <= trials:
+                raise ValueError(
+                    f"{name}: need 0 <= {successes} <= {trials} (successes <= trials)"
+                )
+
+        if self.posteriors is None:
+            self.initialize_posteriors()
+
+        for name, args in updates:
+            self.posteriors[name].update(*args)
+            self._refresh_driver(name)
+
+        self._refresh_posterior_estimates()
+        return self.posterior_estimates
+
+    def observe_penetration(self, name: str, successes: int, trials: int) -> Dict:
+        """
+        Update a penetration percentage (SAM filter, awareness or market
+        share) from survey or panel data
+
+        Args:
+            name: Posterior name, e.g. "paid_tool_willingness" or "share"
+        """
+        if self.posteriors is None:
+            self.initialize_posteriors()
+        if name not in self.posteriors or name == "weekly_signups":
+            raise KeyError(f"Unknown penetration assumption: {name}")
+
+        self.posteriors[name].update(successes, trials)
+        self._refresh_driver(name)
+        self._refresh_posterior_estimates()
+        return self.posterior_estimates
+
+    def posterior_summary(self) -> pd.DataFrame:
+        """
+        Cached posterior summaries as a table
+        """
+        if self.posteriors is None:
+            self.initialize_posteriors()
+
+        rows = []
+        for name, posterior in self.posteriors.items():
+            summary = posterior.summary()
+            rows.append(
+                {
+                    "assumption": name,
+                    "mean": summary["mean"],
+                    "std": summary["std"],
+                    "ci_90_low": summary["ci_90"][0],
+                    "ci_90_high": summary["ci_90"][1],
+                }
+            )
+        return pd.DataFrame(rows)
+
     def generate_market_sizing_report(self) -> str:
         """
         Generate comprehensive market sizing report
@@ -351,23 +619,23 @@ class MarketSizer:
         )
 
         aware_pct = self.som_data["calculation"]["market_capture"]["awareness_rate"]
-        aware = int(potential * aware_pct)
+        aware = self.som_data["calculation"]["market_capture"]["users_aware"]
         report += f"   2. Awareness (GTM campaigns):           {aware:>10,} ({aware_pct*100:>5.1f}%)\n"
 
         signup_pct = self.som_data["calculation"]["market_capture"]["signup_rate"]
-        signups = int(aware * signup_pct)
+        signups = self.som_data["calculation"]["market_capture"]["users_signed_up"]
         report += f"   3. Sign-ups:                            {signups:>10,} ({signup_pct*100:>5.1f}% of aware)\n"
 
         activation_pct = self.som_data["calculation"]["market_capture"][
             "activation_rate"
         ]
-        activated = int(signups * activation_pct)
+        activated = self.som_data["calculation"]["market_capture"]["users_activated"]
         report += f"   4. Activated Users:                     {activated:>10,} ({activation_pct*100:>5.1f}% of signups)\n"
 
         share_pct = self.som_data["calculation"]["competitive_share"][
             "our_share_percentage"
         ]
-        final = int(activated * share_pct)
+        final = self.som_data["final"]
         report += f"   5. Our Market Share (10%):              {final:>10,} ({share_pct*100:>5.1f}% of activated)\n"
         report += f"\n\n"
 
@@ -379,6 +647,20 @@ class MarketSizer:
             report += f"   Sensitivity: {assumption['sensitivity']}\n"
             report += f"   Impact if wrong: {assumption['impact_if_wrong']}\n\n"
 
+        if self.reconciliation is not None:
+            report += "⚖️ RECONCILIATION (Top-down vs Bottom-up)\n"
+            report += "-" * 80 + "\n"
+            tam_rec = self.reconciliation["tam"]
+            som_rec = self.reconciliation["som"]
+            report += f"TAM: bottom-up {tam_rec['bottomup_total']:,.0f} vs top-down {tam_rec['topdown_total']:,.0f}"
+            report += f" -> reconciled {tam_rec['reconciled_total']:,.0f}\n"
+            report += f"SOM: funnel {som_rec['funnel_estimate']:,} vs alternative {som_rec['alternative_estimate']:,}"
+            report += f" -> reconciled {som_rec['reconciled_som']:,.0f}\n"
+            report += "Assumptions moved the most:\n"
+            for _, row in som_rec["movements"].head(3).iterrows():
+                report += f"   • {row['assumption']}: {row['original']:,.3f} -> {row['reconciled']:,.3f} ({row['pct_change']*100:+.0f}%)\n"
+            report += "\n"
+
         report += "✅ CONFIDENCE LEVELS\n"
         report += "-" * 80 + "\n"
         report += f"TAM Confidence: {self.tam_data['confidence']}\n"
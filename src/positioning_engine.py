@@ -0,0 +1,201 @@
+"""
+Positioning Engine
+Derives specialization / user-type coordinates from feature vectors
+"""
+
+import pandas as pd
+import numpy as np
+from typing import Dict, List, Optional, Sequence
+from config import *
+from feature_matrix import FeatureMatrix
+
+
+class PositioningEngine:
+    """
+    Projects products onto the POSITIONING_AXES plane
+
+    A ridge regression fitted on analyst anchors (POSITIONING_ANCHORS) maps
+    standardized feature vectors to (x, y). Without anchors, the first two
+    principal components are used instead. Once fitted, the basis is fixed:
+    new products are projected with one matrix product, no refit.
+    """
+
+    RIDGE_GRID = (0.01, 0.03, 0.1, 0.3, 1.0, 3.0, 10.0)
+
+    def __init__(self, ridge: Optional[float] = None, scale: tuple = (0.0, 10.0)):
+        """
+        Args:
+            ridge: L2 penalty of the supervised projection (None = pick from
+                RIDGE_GRID by leave-one-out error)
+            scale: Coordinate range of the positioning axes
+        """
+        self.ridge = ridge
+        self.scale = scale
+        self.columns = None
+        self.mean = None
+        self.std = None
+        self.basis = None
+        self.offset = None
+        self.method = None
+        self.fit_report = None
+
+    def build_inputs(
+        self,
+        store: FeatureMatrix,
+        competitors_df: Optional[pd.DataFrame] = None,
+        attribute_columns: Sequence[str] = ("estimated_users",),
+    ) -> pd.DataFrame:
+        """
+        One row per product: feature scores plus log-scaled overview attributes
+
+        Args:
+            store: Shared feature matrix
+            competitors_df: Competitive overview (attributes joined on competitor_id)
+            attribute_columns: Overview columns to add (log10(1 + value))
+        """
+        inputs = pd.DataFrame(
+            store.values.astype(np.float64),
+            index=pd.Index(store.competitors, name="competitor_id"),
+            columns=store.features,
+        )
+
+        if competitors_df is not None:
+            overview = competitors_df.set_index("competitor_id")
+            for column in attribute_columns:
+                if column in overview:
+                    values = pd.to_numeric(overview[column], errors="coerce")
+                    inputs[f"log_{column}"] = np.log10(1 + values).reindex(inputs.index)
+
+        return inputs
+
+    def _standardize(self, inputs: pd.DataFrame) -> np.ndarray:
+        """
+        Align columns to the fitted basis, impute missing with the fit mean
+        """
+        values = inputs.reindex(columns=self.columns).to_numpy(np.float64)
+        values = np.where(np.isnan(values), self.mean, values)
+        return (values - self.mean) / self.std
+
+    def _fit_scaling(self, inputs: pd.DataFrame):
+        self.columns = list(inputs.columns)
+        values = inputs.to_numpy(np.float64)
+        self.mean = np.nanmean(values, axis=0)
+        self.mean = np.where(np.isnan(self.mean), 0.0, self.mean)
+        std = np.nanstd(values, axis=0)
+        self.std = np.where((std > 0) & ~np.isnan(std), std, 1.0)
+
+    def fit(self, inputs: pd.DataFrame, anchors: Dict = None) -> "PositioningEngine":
+        """
+        Fit the projection basis
+
+        Args:
+            inputs: Output of build_inputs()
+            anchors: {competitor_id: {"x", "y"}} (default POSITIONING_ANCHORS);
+                fewer than 3 usable anchors falls back to PCA
+        """
+        anchors = POSITIONING_ANCHORS if anchors is None else anchors
+        self._fit_scaling(inputs)
+        z = self._standardize(inputs)
+
+        anchored = [cid for cid in inputs.index if cid in anchors]
+        if len(anchored) < 3:
+            return self._fit_pca(z)
+
+        rows = inputs.index.get_indexer(anchored)
+        z_a = z[rows]
+        targets = np.array([[anchors[c]["x"], anchors[c]["y"]] for c in anchored])
+        self.offset = targets.mean(axis=0)
+        centered = targets - self.offset
+
+        # Dual form: only the (n_anchors x n_anchors) system is solved
+        gram = z_a @ z_a.T
+        candidates = self.RIDGE_GRID if self.ridge is None else (self.ridge,)
+        best = None
+        for ridge in candidates:
+            inverse = np.linalg.inv(gram + ridge * np.eye(len(anchored)))
+            hat = gram @ inverse
+            residual = centered - hat @ centered
+            # Leave-one-out residuals from the hat matrix (no refits)
+            loo = residual / (1 - np.diag(hat))[:, None]
+            report = {
+                "anchors": len(anchored),
+                "ridge": ridge,
+                "rmse": float(np.sqrt((residual**2).mean())),
+                "loo_rmse": float(np.sqrt((loo**2).mean())),
+            }
+            if best is None or report["loo_rmse"] < best[0]["loo_rmse"]:
+                best = (report, inverse)
+
+        self.fit_report, inverse = best
+        self.basis = z_a.T @ (inverse @ centered)
+        self.method = "ridge"
+        return self
+
+    def _fit_pca(self, z: np.ndarray) -> "PositioningEngine":
+        """
+        Unsupervised fallback: top two principal components scaled to the axes
+        """
+        _, _, vt = np.linalg.svd(z, full_matrices=False)
+        components = vt[:2].T
+        scores = z @ components
+
+        low, high = self.scale
+        span = np.ptp(scores, axis=0)
+        span = np.where(span > 0, span, 1.0)
+        self.basis = components * (high - low) / span
+        self.offset = low - scores.min(axis=0) * (high - low) / span
+        self.method = "pca"
+        self.fit_report = {"anchors": 0}
+        return self
+
+    def project(self, inputs: pd.DataFrame) -> pd.DataFrame:
+        """
+        Coordinates for any number of products with the fitted basis
+        """
+        if self.basis is None:
+            raise ValueError("Fit the engine before projecting")
+
+        coords = np.clip(
+            self._standardize(inputs) @ self.basis + self.offset, *self.scale
+        )
+        return pd.DataFrame(
+            {"x_specialization": coords[:, 0], "y_user_type": coords[:, 1]},
+            index=inputs.index,
+        )
+
+    def add(self, competitor_id: str, features: Dict[str, float]) -> Dict:
+        """
+        Project one new product without refitting
+
+        Args:
+            features: Feature scores and attributes keyed like build_inputs()
+                columns (e.g. log_estimated_users); missing values use the
+                fitted means
+        """
+        row = pd.DataFrame([features], index=pd.Index([competitor_id]))
+        coords = self.project(row).iloc[0]
+        return {
+            "competitor_id": competitor_id,
+            "x_specialization": float(coords["x_specialization"]),
+            "y_user_type": float(coords["y_user_type"]),
+        }
+
+
+if __name__ == "__main__":
+    from data_collector import CompetitiveDataCollector
+
+    print("=" * 80)
+    print(" POSITIONING ENGINE")
+    print("=" * 80)
+    print()
+
+    collector = CompetitiveDataCollector()
+    competitors_df = collector.generate_competitive_overview()
+    collector.generate_feature_matrix()
+
+    engine = PositioningEngine()
+    inputs = engine.build_inputs(collector.feature_store, competitors_df)
+    engine.fit(inputs)
+
+    print(engine.project(inputs).round(2).to_string())
+    print(f"\nFit: {engine.fit_report}")
@@ -0,0 +1,210 @@
+"""
+Positioning Robustness
+Monte Carlo check of white-space conclusions under coordinate noise
+"""
+
+import pandas as pd
+import numpy as np
+from typing import Dict, List, Optional
+from config import *
+from feature_matrix import FeatureMatrix
+
+# Quadrant cells of the 2 x 2 grid, indexed row * 2 + col (row = team axis)
+QUADRANTS = [
+    "generalist_individual",
+    "specialist_individual",
+    "generalist_team",
+    "specialist_team",
+]
+
+
+class PositioningRobustness:
+    """
+    Perturbs coordinates (directly and through noisy feature scores) for
+    thousands of draws at once and recomputes quadrant crowding per draw
+
+    Cells are half-open like WhiteSpaceEngine: points on the upper edge of
+    the plane fall outside every quadrant.
+    """
+
+    def __init__(
+        self,
+        positioning: pd.DataFrame,
+        store: Optional[FeatureMatrix] = None,
+        engine=None,
+        robustness_config: Dict = None,
+    ):
+        """
+        Args:
+            positioning: Frame with competitor_id, x_specialization, y_user_type
+            store: Feature scores to perturb (needs engine)
+            engine: Fitted PositioningEngine that maps score noise to
+                coordinate shifts through its linear basis
+        """
+        self.config = robustness_config or POSITIONING_ROBUSTNESS
+        self.ids = positioning["competitor_id"].tolist()
+        self.base = positioning[["x_specialization", "y_user_type"]].to_numpy(
+            np.float64
+        )
+        self.feature_scores = None
+        self.feature_basis = None
+
+        if store is not None and engine is not None and engine.basis is not None:
+            features = [f for f in store.features if f in engine.columns]
+            columns = [engine.columns.index(f) for f in features]
+            rows = [store.competitor_index.get(c) for c in self.ids]
+
+            scores = np.full((len(self.ids), len(features)), np.nan)
+            known = [i for i, r in enumerate(rows) if r is not None]
+            feature_idx = [store.feature_index[f] for f in features]
+            scores[known] = store.values[[rows[i] for i in known]][:, feature_idx]
+            self.feature_scores = scores
+            # Coordinate shift per unit score change: basis / column std
+            self.feature_basis = engine.basis[columns] / engine.std[columns, None]
+
+    def draw_coordinates(
+        self, n_draws: int, coord_noise: float, feature_noise: float, rng
+    ) -> np.ndarray:
+        """
+        Perturbed coordinates, shape (n_draws, n_products, 2)
+        """
+        coords = np.broadcast_to(self.base, (n_draws,) + self.base.shape).copy()
+
+        if feature_noise and self.feature_scores is not None:
+            scores = self.feature_scores
+            noisy = np.clip(
+                scores + rng.normal(0, feature_noise, (n_draws,) + scores.shape),
+                0,
+                10,
+            )
+            change = np.nan_to_num(noisy - scores)
+            coords += change @ self.feature_basis
+
+        if coord_noise:
+            coords += rng.normal(0, coord_noise, coords.shape)
+
+        # Stay inside the half-open grid (a point at 10.0 falls off the plane)
+        return np.clip(coords, 0.0, np.nextafter(10.0, 0.0))
+
+    @staticmethod
+    def cells(coords: np.ndarray, bins: int = 2) -> np.ndarray:
+        """
+        Flat grid cell (row * bins + col) of each point; -1 outside the plane
+        """
+        cell = np.floor(coords / (10.0 / bins)).astype(np.int64)
+        inside = ((cell >= 0) & (cell < bins)).all(axis=-1)
+        return np.where(inside, cell[..., 1] * bins + cell[..., 0], -1)
+
+    @classmethod
+    def cell_counts(cls, coords: np.ndarray, bins: int = 2, mask=None) -> np.ndarray:
+        """
+        Products per grid cell for every draw, shape (n_draws, bins * bins)
+
+        Args:
+            mask: Products to count (default: all)
+        """
+        n_draws = coords.shape[0]
+        flat = cls.cells(coords, bins)
+        inside = flat >= 0
+        if mask is not None:
+            inside &= np.asarray(mask)[None, :]
+
+        offsets = np.arange(n_draws)[:, None] * bins * bins
+        counts = np.bincount((flat + offsets)[inside], minlength=n_draws * bins * bins)
+        return counts.reshape(n_draws, bins * bins)
+
+    def simulate(
+        self,
+        n_draws: int = None,
+        coord_noise: float = None,
+        feature_noise: float = None,
+        recommended: str = None,
+        exclude_ours: bool = True,
+        resolution: Optional[int] = None,
+        seed: int = None,
+    ) -> Dict:
+        """
+        Quadrant crowding across perturbed draws
+
+        Args:
+            recommended: Quadrant whose "least crowded" status is tested
+            exclude_ours: Count competitors only (our product moves too, but
+                does not crowd its own quadrant)
+            resolution: Also report per-cell empty probability on a finer grid
+        """
+        cfg = self.config
+        n_draws = n_draws or cfg["n_draws"]
+        coord_noise = cfg["coord_noise"] if coord_noise is None else coord_noise
+        feature_noise = cfg["feature_noise"] if feature_noise is None else feature_noise
+        recommended = recommended or cfg["recommended_quadrant"]
+        rng = np.random.default_rng(cfg["seed"] if seed is None else seed)
+
+        coords = self.draw_coordinates(n_draws, coord_noise, feature_noise, rng)
+        mask = None
+        if exclude_ours:
+            mask = np.array([c != "our_product" for c in self.ids])
+
+        counts = self.cell_counts(coords, 2, mask)
+        least = counts.min(axis=1, keepdims=True)
+        is_least = counts == least
+        unique_least = is_least & (is_least.sum(axis=1, keepdims=True) == 1)
+        ranks = 1 + (counts[:, :, None] > counts[:, None, :]).sum(axis=2)
+
+        target = QUADRANTS.index(recommended)
+        quadrants = pd.DataFrame(
+            {
+                "quadrant": QUADRANTS,
+                "base_count": self.cell_counts(self.base[None], 2, mask)[0],
+                "mean_count": counts.mean(axis=0),
+                "p05_count": np.percentile(counts, 5, axis=0),
+                "p95_count": np.percentile(counts, 95, axis=0),
+                "p_least_crowded": is_least.mean(axis=0),
+                "p_strictly_least": unique_least.mean(axis=0),
+                "mean_rank": ranks.mean(axis=0),
+            }
+        )
+
+        result = {
+            "draws": n_draws,
+            "coord_noise": coord_noise,
+            "feature_noise": feature_noise if self.feature_scores is not None else 0.0,
+            "recommended": recommended,
+            "p_recommended_least": float(is_least[:, target].mean()),
+            "p_recommended_strictly_least": float(unique_least[:, target].mean()),
+            "quadrants": quadrants,
+        }
+
+        if exclude_ours and "our_product" in self.ids:
+            our_cell = self.cells(coords[:, self.ids.index("our_product")], 2)
+            result["p_ours_in_recommended"] = float((our_cell == target).mean())
+
+        if resolution:
+            grid = self.cell_counts(coords, resolution, mask)
+            result["grid_empty_probability"] = (
+                (grid == 0).mean(axis=0).reshape(resolution, resolution)
+            )
+
+        return result
+
+
+if __name__ == "__main__":
+    from data_collector import CompetitiveDataCollector
+    from competitive_analyzer import CompetitiveAnalyzer
+
+    print("=" * 80)
+    print(" POSITIONING ROBUSTNESS")
+    print("=" * 80)
+    print()
+
+    collector = CompetitiveDataCollector()
+    analyzer = CompetitiveAnalyzer(
+        collector.generate_competitive_overview(), collector.generate_feature_matrix()
+    )
+    positioning = analyzer.calculate_positioning_coordinates()
+
+    robustness = PositioningRobustness(
+        positioning, analyzer.feature_store, analyzer.positioning_engine
+    )
+    result = robustness.simulate()
+    print(result["quadrants"].round(3).to_string())
+    print(f"\nP(recommended least crowded): {result['p_recommended_least']:.1%}")
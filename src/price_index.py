@@ -0,0 +1,229 @@
+"""
+Competitor Price Index
+Monthly-equivalent, per-seat competitor prices with billing metadata
+"""
+
+import pandas as pd
+import numpy as np
+from typing import Dict, List, Optional
+from config import *
+
+PERIOD_MONTHS = {"month": 1, "year": 12}
+
+
+def normalize_prices(prices: pd.DataFrame, amortization_months: float = None):
+    """
+    Add a monthly-equivalent per-seat price column (vectorized)
+
+    Args:
+        prices: Columns list_price, billing_period and optionally seats
+        amortization_months: Months a one-time price is spread over
+    """
+    amortization_months = (
+        amortization_months or PRICE_INDEX["one_time_amortization_months"]
+    )
+    months = prices["billing_period"].map(
+        {**PERIOD_MONTHS, "one_time": amortization_months}
+    )
+    if months.isna().any():
+        unknown = sorted(prices.loc[months.isna(), "billing_period"].unique())
+        raise ValueError(f"Unknown billing periods: {unknown}")
+
+    seats = prices["seats"] if "seats" in prices else 1
+    prices["price_monthly"] = prices["list_price"] / months / seats
+    return prices
+
+
+class PriceIndex:
+    """
+    Indexed table of competitor prices, normalized once at load time
+    """
+
+    COLUMNS = [
+        "competitor_id",
+        "competitor_name",
+        "tier",
+        "list_price",
+        "billing_period",
+        "commitment_months",
+        "seats",
+        "price_monthly",
+        "is_free",
+        "is_custom",
+        "has_free_tier",
+        "positioning",
+    ]
+
+    def __init__(self, competitors: Dict = None, price_config: Dict = None):
+        self.config = price_config or PRICE_INDEX
+        self.table = self._load(competitors or COMPETITORS)
+        self.history = None
+        self._refresh_lookup()
+
+    def _load(self, competitors: Dict) -> pd.DataFrame:
+        """
+        Flatten COMPETITORS pricing into one row per tier
+
+        "free": True becomes a $0 tier, "Custom" prices are kept with
+        is_custom set and no numeric price.
+        """
+        billing = self.config["billing"]
+        rows = []
+
+        for key, comp in competitors.items():
+            pricing = comp["pricing"]
+            has_free_tier = bool(pricing.get("free", False))
+
+            for tier_name, price in pricing.items():
+                if tier_name == "free":
+                    if not has_free_tier:
+                        continue
+                    price = 0
+                meta = billing.get(key, {}).get(tier_name, {})
+                period = meta.get("period", "month")
+                is_custom = not isinstance(price, (int, float))
+                rows.append(
+                    {
+                        "competitor_id": key,
+                        "competitor_name": comp["name"],
+                        "tier": tier_name,
+                        "list_price": np.nan if is_custom else float(price),
+                        "billing_period": period,
+                        "commitment_months": meta.get(
+                            "commitment_months", PERIOD_MONTHS.get(period, 0)
+                        ),
+                        "seats": meta.get("seats", 1),
+                        "is_free": tier_name == "free",
+                        "is_custom": is_custom,
+                        "has_free_tier": has_free_tier,
+                        "positioning": comp["positioning"],
+                    }
+                )
+
+        table = normalize_prices(
+            pd.DataFrame(rows), self.config["one_time_amortization_months"]
+        )
+        return table[self.COLUMNS].set_index(["competitor_id", "tier"], drop=False)
+
+    def _refresh_lookup(self):
+        """
+        Cache lowest paid price per competitor for O(1) lookups
+        """
+        self._lowest = (
+            self.lowest_paid().set_index("competitor_id")["price_monthly"].to_dict()
+        )
+
+    def paid_tiers(self) -> pd.DataFrame:
+        """
+        Tiers with a numeric price above zero
+        """
+        return self.table[self.table["price_monthly"] > 0].reset_index(drop=True)
+
+    def lowest_paid(self) -> pd.DataFrame:
+        """
+        Cheapest paid tier per competitor (monthly-equivalent)
+        """
+        paid = self.paid_tiers()
+        cheapest = paid.loc[
+            paid.groupby("competitor_id", sort=False)["price_monthly"].idxmin()
+        ]
+        return cheapest.reset_index(drop=True)
+
+    def lowest_price(self, competitor_id: str) -> float:
+        """
+        Lowest paid monthly-equivalent price (NaN if none)
+        """
+        return self._lowest.get(competitor_id, np.nan)
+
+    def competitor_pricing(self) -> pd.DataFrame:
+        """
+        Priced tiers in the PricingStrategy.competitor_pricing layout
+        """
+        priced = self.table[~self.table["is_custom"]].reset_index(drop=True)
+        return priced[
+            [
+                "competitor_id",
+                "competitor_name",
+                "tier",
+                "price_monthly",
+                "has_free_tier",
+                "positioning",
+                "list_price",
+                "billing_period",
+            ]
+        ]
+
+    def add_prices(self, prices: pd.DataFrame) -> pd.DataFrame:
+        """
+        Record dated price points and update current prices
+
+        Args:
+            prices: Columns competitor_id, tier, list_price, effective_date;
+                optional billing_period, commitment_months, seats,
+                competitor_name
+        """
+        prices = prices.copy()
+        prices["effective_date"] = pd.to_datetime(prices["effective_date"])
+
+        current = self.table.reset_index(drop=True)
+        known = current.set_index(["competitor_id", "tier"])
+        keys = pd.MultiIndex.from_frame(prices[["competitor_id", "tier"]])
+
+        # Carry billing metadata from the current catalog when not given
+        for column, default in [
+            ("billing_period", "month"),
+            ("commitment_months", 1),
+            ("seats", 1),
+            ("competitor_name", None),
+            ("has_free_tier", False),
+            ("positioning", None),
+        ]:
+            if column not in prices:
+                prices[column] = known[column].reindex(keys).to_numpy()
+            missing = prices[column].isna()
+            if default is not None and missing.any():
+                prices.loc[missing, column] = default
+
+        prices["is_free"] = prices["tier"] == "free"
+        prices["is_custom"] = prices["list_price"].isna()
+        prices = normalize_prices(prices, self.config["one_time_amortization_months"])
+
+        history = prices[self.COLUMNS + ["effective_date"]]
+        self.history = (
+            history
+            if self.history is None
+            else pd.concat([self.history, history], ignore_index=True)
+        )
+        self.history = self.history.sort_values("effective_date", kind="stable")
+
+        latest = self.history.drop_duplicates(["competitor_id", "tier"], keep="last")
+        merged = pd.concat([current, latest[self.COLUMNS]], ignore_index=True)
+        merged = merged.drop_duplicates(["competitor_id", "tier"], keep="last")
+        self.table = merged.set_index(["competitor_id", "tier"], drop=False)
+        self._refresh_lookup()
+
+        return self.table
+
+    def prices_as_of(self, date) -> pd.DataFrame:
+        """
+        Monthly-equivalent prices in effect on a date (from recorded history)
+        """
+        if self.history is None:
+            return self.table.reset_index(drop=True)
+
+        effective = self.history[self.history["effective_date"] <= pd.Timestamp(date)]
+        return effective.drop_duplicates(
+            ["competitor_id", "tier"], keep="last"
+        ).reset_index(drop=True)
+
+
+if __name__ == "__main__":
+    print("=" * 80)
+    print(" COMPETITOR PRICE INDEX")
+    print("=" * 80)
+    print()
+
+    index = PriceIndex()
+    print(index.table.reset_index(drop=True).to_string())
+    print()
+    print(index.lowest_paid()[["competitor_name", "tier", "price_monthly"]].to_string())
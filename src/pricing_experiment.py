@@ -0,0 +1,267 @@
+"""
+Pricing Experiment Simulator
+Bayesian A/B price tests with sequential stopping, simulated in parallel
+"""
+
+import re
+import pandas as pd
+import numpy as np
+from typing import Dict, List, Optional, Sequence
+from config import *
+from demand_model import DemandCurveModel
+
+
+def channel_weekly_traffic(channel_strategy: Dict, weeks: int = 12) -> np.ndarray:
+    """
+    Spread each channel's expected users evenly over its timeline weeks
+
+    Args:
+        channel_strategy: Output of GTMPlanner.define_channel_strategy()
+        weeks: Plan horizon (the GTM plan covers 12 weeks)
+    """
+    traffic = np.zeros(weeks)
+    for channel in channel_strategy["channels"].values():
+        bounds = [int(w) for w in re.findall(r"\d+", channel.get("timeline", ""))]
+        start, end = (bounds[0], bounds[-1]) if bounds else (1, weeks)
+        start, end = max(start, 1), min(end, weeks)
+        if end < start:
+            continue
+        traffic[start - 1 : end] += channel["expected_users"] / (end - start + 1)
+    return traffic
+
+
+class PricingExperimentSimulator:
+    """
+    Runs thousands of virtual price tests at once using Beta-Binomial
+    posteriors on conversion and revenue per visitor
+    """
+
+    def __init__(
+        self,
+        arm_prices: Sequence[float] = (12, 15, 18),
+        true_conversion: Optional[Sequence[float]] = None,
+        tier: str = "pro",
+        prior: tuple = (1.0, 1.0),
+        seed: int = 42,
+    ):
+        """
+        Args:
+            arm_prices: Monthly price tested in each arm
+            true_conversion: Conversion per arm (default: DemandCurveModel
+                curve for the tier, weighted across segments)
+            prior: Beta(alpha, beta) prior on each arm's conversion
+        """
+        self.arm_prices = np.asarray(arm_prices, dtype=np.float64)
+        self.prior = prior
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
+
+        if true_conversion is None:
+            model = DemandCurveModel()
+            cube = model.evaluate(self.arm_prices)
+            t = model.tiers.index(tier)
+            true_conversion = (
+                cube["paying_users"][:, :, t].sum(axis=1)
+                / model.active_users[:, t].sum()
+            )
+        self.true_conversion = np.asarray(true_conversion, dtype=np.float64)
+        self.results = None
+
+    def _true_rates(self, n_experiments: int, rate_uncertainty: float) -> np.ndarray:
+        """
+        True conversion per experiment and arm; with rate_uncertainty the
+        truth is drawn around the assumed rates so the best arm varies
+        """
+        base = np.broadcast_to(
+            self.true_conversion, (n_experiments, len(self.arm_prices))
+        )
+        if not rate_uncertainty:
+            return base.copy()
+        strength = 1.0 / rate_uncertainty**2
+        return self.rng.beta(base * strength, (1 - base) * strength)
+
+    def simulate(
+        self,
+        traffic: Sequence[float],
+        n_experiments: int = 2000,
+        stopping_rule: str = "probability_best",
+        threshold: float = 0.95,
+        min_periods: int = 2,
+        posterior_draws: int = 400,
+        rate_uncertainty: float = 0.15,
+    ) -> Dict:
+        """
+        Simulate sequential price tests
+
+        Traffic is split evenly across arms each period. After min_periods
+        the test stops when the stopping rule fires; tests still running at
+        the end of the traffic horizon pick the arm with the best posterior
+        revenue per visitor.
+
+        Args:
+            traffic: Visitors entering the test per period (e.g. weekly)
+            stopping_rule: "probability_best" (stop when P(best) >= threshold)
+                or "expected_loss" (stop when expected loss in $/visitor
+                < threshold)
+            rate_uncertainty: Relative spread of true conversion around the
+                assumed curve (0 = assumptions are exact)
+        """
+        if stopping_rule not in ("probability_best", "expected_loss"):
+            raise ValueError(f"Unknown stopping rule: {stopping_rule}")
+
+        # Same seed per run, so rules are compared on identical experiments
+        self.rng = np.random.default_rng(self.seed)
+        traffic = np.asarray(traffic, dtype=np.float64)
+        n_arms = len(self.arm_prices)
+        prices = self.arm_prices
+        if traffic.ndim != 1 or not np.isfinite(traffic).all() or (traffic < 0).any():
+            raise ValueError("traffic must be a 1-D sequence of visitor counts >= 0")
+        if not (traffic // n_arms).any():
+            raise ValueError(
+                f"traffic never reaches one visitor per arm ({n_arms} arms) in any period"
+            )
+
+        true_rates = self._true_rates(n_experiments, rate_uncertainty)
+        true_rpv = true_rates * prices
+        best_arm = true_rpv.argmax(axis=1)
+        best_rpv = true_rpv.max(axis=1)
+
+        visitors = np.zeros((n_experiments, n_arms))
+        conversions = np.zeros((n_experiments, n_arms))
+        active = np.ones(n_experiments, dtype=bool)
+        decision = np.full(n_experiments, -1)
+        stop_period = np.full(n_experiments, len(traffic))
+        test_regret = np.zeros(n_experiments)
+        alpha0, beta0 = self.prior
+
+        for period, period_traffic in enumerate(traffic):
+            if not active.any():
+                break
+            per_arm = int(period_traffic // n_arms)
+            idx = np.flatnonzero(active)
+
+            new_conversions = self.rng.binomial(per_arm, true_rates[idx])
+            visitors[idx] += per_arm
+            conversions[idx] += new_conversions
+            test_regret[idx] += per_arm * (best_rpv[idx, None] - true_rpv[idx]).sum(
+                axis=1
+            )
+
+            is_last = period == len(traffic) - 1
+            if period + 1 < min_periods and not is_last:
+                continue
+
+            # Posterior revenue-per-visitor draws: (active, draws, arms)
+            draws = (
+                self.rng.beta(
+                    alpha0 + conversions[idx, None, :],
+                    beta0 + (visitors[idx] - conversions[idx])[:, None, :],
+                    size=(len(idx), posterior_draws, n_arms),
+                )
+                * prices
+            )
+            winners = draws.argmax(axis=2)
+            p_best = np.stack(
+                [(winners == k).mean(axis=1) for k in range(n_arms)], axis=1
+            )
+            loss = (draws.max(axis=2, keepdims=True) - draws).mean(axis=1)
+
+            if stopping_rule == "probability_best":
+                candidate = p_best.argmax(axis=1)
+                stop = p_best.max(axis=1) >= threshold
+            else:
+                candidate = loss.argmin(axis=1)
+                stop = loss.min(axis=1) < threshold
+
+            if is_last:
+                posterior_mean = (
+                    (alpha0 + conversions[idx])
+                    / (alpha0 + beta0 + visitors[idx])
+                    * prices
+                )
+                candidate = np.where(stop, candidate, posterior_mean.argmax(axis=1))
+                stop = np.ones(len(idx), dtype=bool)
+
+            stopped = idx[stop]
+            decision[stopped] = candidate[stop]
+            stop_period[stopped] = period + 1
+            active[stopped] = False
+
+        chosen_rpv = true_rpv[np.arange(n_experiments), decision]
+        self.results = pd.DataFrame(
+            {
+                "decision": prices[decision],
+                "best_price": prices[best_arm],
+                "correct": decision == best_arm,
+                "periods_to_decision": stop_period,
+                "visitors_to_decision": visitors.sum(axis=1),
+                "stopped_early": stop_period < len(traffic),
+                "test_regret": test_regret,
+                "decision_regret_per_visitor": best_rpv - chosen_rpv,
+            }
+        )
+
+        return self.summarize(self.results, stopping_rule, threshold)
+
+    @staticmethod
+    def summarize(results: pd.DataFrame, stopping_rule: str, threshold: float) -> Dict:
+        """
+        Aggregate simulated experiments into planning metrics
+        """
+        return {
+            "stopping_rule": stopping_rule,
+            "threshold": threshold,
+            "experiments": len(results),
+            "error_rate": 1 - results["correct"].mean(),
+            "stopped_early_rate": results["stopped_early"].mean(),
+            "mean_periods_to_decision": results["periods_to_decision"].mean(),
+            "median_periods_to_decision": results["periods_to_decision"].median(),
+            "mean_visitors_to_decision": results["visitors_to_decision"].mean(),
+            "mean_test_regret": results["test_regret"].mean(),
+            "mean_decision_regret_per_visitor": results[
+                "decision_regret_per_visitor"
+            ].mean(),
+            "decision_share": results["decision"]
+            .value_counts(normalize=True)
+            .to_dict(),
+        }
+
+    def compare_rules(
+        self, traffic: Sequence[float], rules: List[Dict], **kwargs
+    ) -> pd.DataFrame:
+        """
+        Simulate several stopping rules on the same traffic plan
+
+        Args:
+            rules: Dicts with stopping_rule and threshold (and optionally
+                min_periods)
+        """
+        rows = []
+        for rule in rules:
+            summary = self.simulate(traffic, **{**kwargs, **rule})
+            summary.pop("decision_share")
+            rows.append(summary)
+        return pd.DataFrame(rows)
+
+
+if __name__ == "__main__":
+    from gtm_planner import GTMPlanner
+
+    print("=" * 80)
+    print(" PRICING EXPERIMENT SIMULATOR")
+    print("=" * 80)
+    print()
+
+    planner = GTMPlanner()
+    traffic = channel_weekly_traffic(planner.define_channel_strategy())
+
+    simulator = PricingExperimentSimulator()
+    comparison = simulator.compare_rules(
+        traffic,
+        [
+            {"stopping_rule": "probability_best", "threshold": 0.90},
+            {"stopping_rule": "probability_best", "threshold": 0.95},
+            {"stopping_rule": "expected_loss", "threshold": 0.01},
+        ],
+    )
+    print(comparison.to_string())
@@ -0,0 +1,450 @@
+"""
+Pricing Research Analysis
+Van Westendorp price sensitivity and conjoint (multinomial logit) analysis
+over respondent-level survey data
+"""
+
+import pandas as pd
+import numpy as np
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Union
+from config import *
+
+VAN_WESTENDORP_QUESTIONS = ["too_cheap", "cheap", "expensive", "too_expensive"]
+
+
+def read_survey_chunks(
+    source: Union[str, Path, pd.DataFrame],
+    columns: Optional[List[str]] = None,
+    chunksize: int = 500_000,
+) -> Iterator[pd.DataFrame]:
+    """
+    Yield survey rows in bounded-size chunks from CSV, Parquet or a DataFrame
+    """
+    if isinstance(source, pd.DataFrame):
+        for start in range(0, len(source), chunksize):
+            chunk = source.iloc[start : start + chunksize]
+            yield chunk if columns is None else chunk[columns]
+        return
+
+    path = Path(source)
+    if path.suffix == ".parquet":
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(path)
+        for batch in parquet_file.iter_batches(batch_size=chunksize, columns=columns):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, usecols=columns, chunksize=chunksize)
+
+
+class PricingResearch:
+    """
+    Analyzes pricing survey data at respondent level
+    """
+
+    def __init__(self, pricing_tiers: Dict = None, chunksize: int = 500_000):
+        self.pricing_tiers = pricing_tiers or PRICING_TIERS
+        self.chunksize = chunksize
+        self.van_westendorp_results = None
+        self.conjoint_results = None
+
+    # ===== VAN WESTENDORP =====
+
+    def van_westendorp(
+        self,
+        source,
+        price_grid: Optional[Sequence[float]] = None,
+        segment_col: Optional[str] = None,
+    ) -> Dict:
+        """
+        Van Westendorp price-sensitivity curves, streamed chunk by chunk
+
+        Responses are binned onto a fixed price grid, so memory stays bounded
+        by the grid size regardless of the number of respondents.
+
+        Args:
+            source: CSV/Parquet path or DataFrame with one row per respondent
+                and columns too_cheap, cheap, expensive, too_expensive
+            price_grid: Evaluation prices (default $0-$60 in $0.25 steps)
+            segment_col: Optional column to compute curves per segment
+        """
+        print("🔬 Computing Van Westendorp price sensitivity...")
+
+        grid = (
+            np.arange(0, 60.25, 0.25)
+            if price_grid is None
+            else np.asarray(price_grid, dtype=np.float64)
+        )
+        columns = VAN_WESTENDORP_QUESTIONS + ([segment_col] if segment_col else [])
+
+        histograms = {}
+        for chunk in read_survey_chunks(source, columns, self.chunksize):
+            groups = chunk.groupby(segment_col) if segment_col else [("all", chunk)]
+            for segment, rows in groups:
+                hist = histograms.setdefault(
+                    segment, np.zeros((len(VAN_WESTENDORP_QUESTIONS), len(grid) + 1))
+                )
+                for q_idx, question in enumerate(VAN_WESTENDORP_QUESTIONS):
+                    answers = rows[question].to_numpy(dtype=np.float64)
+                    answers = answers[~np.isnan(answers)]
+                    bins = np.searchsorted(grid, answers, side="left")
+                    hist[q_idx] += np.bincount(bins, minlength=len(grid) + 1)
+
+        results = {}
+        for segment, hist in histograms.items():
+            results[segment] = self._van_westendorp_points(grid, hist)
+
+        self.van_westendorp_results = results
+
+        overall = results.get("all", next(iter(results.values())))
+        print(f"✅ Van Westendorp complete ({overall['respondents']:,} respondents)")
+        print(
+            f"   Acceptable range: ${overall['points']['pmc']:.2f} - ${overall['points']['pme']:.2f}"
+        )
+        print(f"   Optimal price point: ${overall['points']['opp']:.2f}")
+
+        return results
+
+    def _van_westendorp_points(self, grid: np.ndarray, hist: np.ndarray) -> Dict:
+        """
+        Turn binned answers into cumulative curves and intersection points
+        """
+        totals = hist.sum(axis=1, keepdims=True)
+        totals[totals == 0] = 1
+        at_or_below = np.cumsum(hist, axis=1)[:, : len(grid)] / totals
+
+        # "Cheap" questions: share who'd call price p cheap = answer >= p
+        too_cheap = 1 - np.concatenate([[0], at_or_below[0, :-1]])
+        cheap = 1 - np.concatenate([[0], at_or_below[1, :-1]])
+        # "Expensive" questions: share who'd call price p expensive = answer <= p
+        expensive = at_or_below[2]
+        too_expensive = at_or_below[3]
+
+        curves = pd.DataFrame(
+            {
+                "price": grid,
+                "too_cheap": too_cheap,
+                "cheap": cheap,
+                "expensive": expensive,
+                "too_expensive": too_expensive,
+                "not_cheap": 1 - cheap,
+                "not_expensive": 1 - expensive,
+            }
+        )
+
+        points = {
+            "pmc": self._intersection(grid, too_cheap, 1 - cheap),
+            "opp": self._intersection(grid, too_cheap, too_expensive),
+            "ipp": self._intersection(grid, cheap, expensive),
+            "pme": self._intersection(grid, 1 - expensive, too_expensive),
+        }
+
+        return {
+            "curves": curves,
+            "points": points,
+            "respondents": int(hist[0].sum()),
+        }
+
+    @staticmethod
+    def _intersection(grid: np.ndarray, falling, rising) -> float:
+        """
+        Price where a falling curve first meets a rising one (linear interpolation)
+        """
+        diff = np.asarray(falling) - np.asarray(rising)
+        crossing = np.flatnonzero((diff[:-1] > 0) & (diff[1:] <= 0))
+        if len(crossing) == 0:
+            return float("nan")
+        i = crossing[0]
+        weight = diff[i] / (diff[i] - diff[i + 1])
+        return float(grid[i] + weight * (grid[i + 1] - grid[i]))
+
+    # ===== CONJOINT (MULTINOMIAL LOGIT) =====
+
+    def tier_features(self) -> List[str]:
+        """
+        Distinct product features across PRICING_TIERS (conjoint attributes)
+        """
+        features = []
+        for tier in self.tier_profiles().values():
+            for feature in tier:
+                if feature not in features:
+                    features.append(feature)
+        return features
+
+    def tier_profiles(self) -> Dict[str, List[str]]:
+        """
+        Feature list per tier, expanding "Everything in <Tier>" references
+        """
+        profiles = {}
+        for tier_id, tier in self.pricing_tiers.items():
+            features = []
+            for feature in tier["features"]:
+                if feature.startswith("Everything in "):
+                    parent = feature.replace("Everything in ", "").lower()
+                    features.extend(profiles.get(parent, []))
+                else:
+                    features.append(feature)
+            profiles[tier_id] = features
+        return profiles
+
+    def tier_design_matrix(self) -> pd.DataFrame:
+        """
+        Binary feature design for each tier at its list price
+        """
+        features = self.tier_features()
+        profiles = self.tier_profiles()
+        design = pd.DataFrame(0.0, index=list(profiles.keys()), columns=features)
+        for tier_id, tier_features in profiles.items():
+            design.loc[tier_id, tier_features] = 1.0
+        design["price"] = [
+            self.pricing_tiers[t].get("price_monthly", 0) for t in design.index
+        ]
+        return design
+
+    def load_choice_data(self, source, attributes: Sequence[str]) -> Dict:
+        """
+        Load long-format choice tasks into contiguous arrays, chunk by chunk
+
+        Args:
+            source: CSV/Parquet path or DataFrame with columns task_id, chosen
+                (0/1) and one column per attribute; rows of a task must be
+                contiguous
+            attributes: Attribute columns (features, "price", optional "none")
+        """
+        columns = ["task_id", "chosen"] + list(attributes)
+        X_parts, y_parts, task_parts = [], [], []
+        for chunk in read_survey_chunks(source, columns, self.chunksize):
+            X_parts.append(chunk[list(attributes)].to_numpy(dtype=np.float64))
+            y_parts.append(chunk["chosen"].to_numpy(dtype=np.float64))
+            task_parts.append(chunk["task_id"].to_numpy())
+
+        task_ids = np.concatenate(task_parts)
+        starts = np.flatnonzero(np.r_[True, task_ids[1:] != task_ids[:-1]])
+
+        return {
+            "X": np.concatenate(X_parts),
+            "y": np.concatenate(y_parts),
+            "task_starts": starts,
+            "attributes": list(attributes),
+        }
+
+    @staticmethod
+    def _choice_probabilities(utility: np.ndarray, starts: np.ndarray) -> tuple:
+        """
+        Per-task softmax via reduceat; returns probabilities and log-normalisers
+        """
+        lengths = np.diff(np.r_[starts, len(utility)])
+        task_max = np.maximum.reduceat(utility, starts)
+        expu = np.exp(utility - np.repeat(task_max, lengths))
+        denom = np.add.reduceat(expu, starts)
+        probs = expu / np.repeat(denom, lengths)
+        return probs, task_max + np.log(denom)
+
+    def log_likelihood(self, beta, choice_data: Dict) -> float:
+        """
+        Vectorized MNL log-likelihood for a coefficient vector
+        """
+        X, y, starts = choice_data["X"], choice_data["y"], choice_data["task_starts"]
+        utility = X @ np.asarray(beta, dtype=np.float64)
+        _, log_norm = self._choice_probabilities(utility, starts)
+        return float(y @ utility - log_norm.sum())
+
+    def fit_conjoint(
+        self,
+        choice_data: Dict,
+        max_iter: int = 50,
+        tolerance: float = 1e-8,
+        ridge: float = 1e-6,
+    ) -> Dict:
+        """
+        Fit a multinomial-logit conjoint model by Newton-Raphson
+
+        Gradient and Hessian are formed with whole-array operations (no
+        per-task Python loop), so each iteration is a few passes over X.
+
+        Args:
+            choice_data: Output of load_choice_data()
+            ridge: Small L2 penalty for numerical stability
+        """
+        print("🧩 Fitting conjoint (multinomial logit) model...")
+
+        X, y, starts = choice_data["X"], choice_data["y"], choice_data["task_starts"]
+        lengths = np.diff(np.r_[starts, len(y)])
+        n_params = X.shape[1]
+        beta = np.zeros(n_params)
+        log_lik = self.log_likelihood(beta, choice_data)
+        converged = False
+
+        for iteration in range(1, max_iter + 1):
+            probs, _ = self._choice_probabilities(X @ beta, starts)
+
+            gradient = X.T @ (y - probs) - ridge * beta
+            weighted = X * probs[:, None]
+            task_means = np.add.reduceat(weighted, starts, axis=0)
+            hessian = (
+                weighted.T @ X - task_means.T @ task_means + ridge * np.eye(n_params)
+            )
+
+            step = np.linalg.solve(hessian, gradient)
+
+            # Backtracking keeps the likelihood monotone on badly scaled data
+            scale = 1.0
+            improved = False
+            while scale > 1e-4:
+                candidate = beta + scale * step
+                candidate_ll = self.log_likelihood(candidate, choice_data)
+                if candidate_ll >= log_lik - 1e-12:
+                    improved = True
+                    break
+                scale /= 2
+            if not improved:
+                break  # No step size helps: keep the last beta, not converged
+            beta, previous_ll, log_lik = candidate, log_lik, candidate_ll
+
+            if abs(log_lik - previous_ll) < tolerance * max(1.0, abs(log_lik)):
+                converged = True
+                break
+
+        std_err = np.sqrt(np.clip(np.diag(np.linalg.inv(hessian)), 0, None))
+        coefficients = pd.Series(beta, index=choice_data["attributes"])
+
+        wtp = None
+        if "price" in coefficients.index and coefficients["price"] < 0:
+            wtp = (
+                -coefficients.drop(["price", "none"], errors="ignore")
+                / coefficients["price"]
+            )
+
+        null_ll = -np.log(lengths).sum()
+        self.conjoint_results = {
+            "coefficients": coefficients,
+            "std_errors": pd.Series(std_err, index=choice_data["attributes"]),
+            "willingness_to_pay": wtp,
+            "log_likelihood": log_lik,
+            "mcfadden_r2": 1 - log_lik / null_ll if null_ll != 0 else float("nan"),
+            "iterations": iteration,
+            "converged": converged,
+            "tasks": len(starts),
+        }
+
+        print(f"✅ Conjoint fitted on {len(starts):,} choice tasks")
+        if not converged:
+            print(f"   ⚠️ Not converged after {iteration} iterations")
+        print(f"   McFadden R²: {self.conjoint_results['mcfadden_r2']:.3f}")
+        if wtp is not None:
+            top = wtp.sort_values(ascending=False).head(3)
+            for feature, value in top.items():
+                print(f"   WTP {feature}: ${value:.2f}/month")
+
+        return self.conjoint_results
+
+    def predict_take_rates(
+        self, prices: Sequence[float], tiers: Optional[Sequence[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Predicted probability of choosing each tier over "no purchase"
+        at each price, from the fitted conjoint model
+
+        Requires a fitted model with "price" and "none" attributes.
+        """
+        if self.conjoint_results is None:
+            raise ValueError("Fit the conjoint model first")
+
+        coefficients = self.conjoint_results["coefficients"]
+        design = self.tier_design_matrix()
+        tiers = [t for t in (tiers or design.index) if design.loc[t, "price"] > 0]
+
+        features = [c for c in coefficients.index if c not in ("price", "none")]
+        base_utility = (
+            design.loc[tiers, features].to_numpy() @ coefficients[features].to_numpy()
+        )
+        prices = np.asarray(prices, dtype=np.float64)
+
+        # (tiers, prices) utility vs the outside option
+        utility = base_utility[:, None] + coefficients["price"] * prices[None, :]
+        none_utility = coefficients.get("none", 0.0)
+        take = 1 / (1 + np.exp(none_utility - utility))
+
+        return pd.DataFrame(
+            {
+                "tier": np.repeat(tiers, len(prices)),
+                "price": np.tile(prices, len(tiers)),
+                "take_rate": take.ravel(),
+            }
+        )
+
+    # ===== SYNTHETIC SURVEYS =====
+
+    def simulate_van_westendorp(
+        self, n_respondents: int, center: float = 15.0, seed: int = 42
+    ) -> pd.DataFrame:
+        """
+        Synthetic Van Westendorp responses (log-normal price thresholds)
+        """
+        rng = np.random.default_rng(seed)
+        anchor = center * np.exp(rng.normal(0, 0.35, n_respondents))
+        ratios = np.cumsum(rng.uniform(0.15, 0.45, size=(n_respondents, 4)), axis=1)
+
+        answers = anchor[:, None] * np.exp(
+            ratios - ratios[:, 1:3].mean(axis=1)[:, None]
+        )
+        frame = pd.DataFrame(np.round(answers, 2), columns=VAN_WESTENDORP_QUESTIONS)
+        frame.insert(0, "respondent_id", np.arange(n_respondents))
+        return frame
+
+    def simulate_choice_tasks(
+        self,
+        n_tasks: int,
+        true_coefficients: Dict[str, float],
+        alternatives: int = 3,
+        price_range: tuple = (5, 40),
+        seed: int = 42,
+    ) -> pd.DataFrame:
+        """
+        Synthetic conjoint choice tasks with a "no purchase" option
+
+        Each task shows `alternatives` random feature bundles at random prices
+        plus the outside option; choices follow the given MNL coefficients.
+        """
+        rng = np.random.default_rng(seed)
+        features = self.tier_features()
+        n_rows = n_tasks * (alternatives + 1)
+
+        X = np.zeros((n_tasks, alternatives + 1, len(features) + 2))
+        X[:, :alternatives, : len(features)] = rng.integers(
+            0, 2, size=(n_tasks, alternatives, len(features))
+        )
+        X[:, :alternatives, len(features)] = rng.uniform(
+            *price_range, size=(n_tasks, alternatives)
+        ).round(2)
+        X[:, alternatives, len(features) + 1] = 1.0  # "none" option
+
+        attributes = features + ["price", "none"]
+        beta = np.array([true_coefficients.get(a, 0.0) for a in attributes])
+        utility = X @ beta + rng.gumbel(size=(n_tasks, alternatives + 1))
+        chosen = np.zeros((n_tasks, alternatives + 1))
+        chosen[np.arange(n_tasks), utility.argmax(axis=1)] = 1
+
+        frame = pd.DataFrame(X.reshape(n_rows, -1), columns=attributes)
+        frame.insert(0, "task_id", np.repeat(np.arange(n_tasks), alternatives + 1))
+        frame.insert(1, "chosen", chosen.ravel().astype(int))
+        return frame
+
+
+if __name__ == "__main__":
+    print("=" * 80)
+    print(" PRICING RESEARCH")
+    print("=" * 80)
+    print()
+
+    research = PricingResearch()
+
+    vw_survey = research.simulate_van_westendorp(200_000)
+    research.van_westendorp(vw_survey)
+
+    truth = {feature: 1.0 for feature in research.tier_features()}
+    truth.update({"price": -0.15, "none": 2.0})
+    tasks = research.simulate_choice_tasks(20_000, truth)
+    attributes = [c for c in tasks.columns if c not in ("task_id", "chosen")]
+    research.fit_conjoint(research.load_choice_data(tasks, attributes))
@@ -7,6 +7,10 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple
 from config import *
+from demand_model import DemandCurveModel
+from regional_pricing import RegionalPricingEngine
+from price_index import PriceIndex
+from pricing_experiment import PricingExperimentSimulator, channel_weekly_traffic
 
 
 class PricingStrategy:
@@ -18,7 +22,13 @@ class PricingStrategy:
         self.pricing_tiers = PRICING_TIERS
         self.unit_economics = UNIT_ECONOMICS
         self.competitor_pricing = None
+        self.price_index = None
         self.value_metric_analysis = None
+        self.demand_model = DemandCurveModel()
+        self.price_optimization = None
+        self.survey_research = None
+        self.regional_pricing = None
+        self.experiment_plan = None
 
     def analyze_competitor_pricing(self, competitors_df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -26,26 +36,9 @@ class PricingStrategy:
         """
         print("💰 Analyzing competitor pricing...")
 
-        pricing_data = []
-
-        for key, comp in COMPETITORS.items():
-            # Extract pricing tiers
-            pricing = comp["pricing"]
-
-            for tier_name, price in pricing.items():
-                if isinstance(price, (int, float)):
-                    pricing_data.append(
-                        {
-                            "competitor_id": key,
-                            "competitor_name": comp["name"],
-                            "tier": tier_name,
-                            "price_monthly": price,
-                            "has_free_tier": pricing.get("free", False),
-                            "positioning": comp["positioning"],
-                        }
-                    )
-
-        self.competitor_pricing = pd.DataFrame(pricing_data)
+        # Monthly-equivalent, per-seat prices (one-time and annual normalized)
+        self.price_index = PriceIndex()
+        self.competitor_pricing = self.price_index.competitor_pricing()
 
         # Calculate statistics
         print(f"✅ Analyzed pricing for {len(COMPETITORS)} competitors")
@@ -136,6 +129,107 @@ class PricingStrategy:
 
         return self.value_metric_analysis
 
+    def _unit_economics_defaults(self) -> Dict:
+        """
+        Default value for every unit-economics assumption
+        """
+        return {
+            "price": self.pricing_tiers["pro"]["price_monthly"],
+            "arpu": self.unit_economics["ltv"]["arpu"],
+            "cac": self.unit_economics["cac"]["blended"],
+            "api_cost": 3.50,
+            "infra_cost": 0.50,
+            "retention": 0.95,
+            "dev_cost": 25000,
+            "marketing_cost": 30000,
+            "admin_cost": 15000,
+        }
+
+    def _assumption_columns(self, assumptions) -> Dict[str, np.ndarray]:
+        """
+        Normalise assumption rows into float64 columns, filling defaults
+
+        Args:
+            assumptions: DataFrame, structured array, dict of arrays or
+                list of dicts (one per assumption set)
+        """
+        if isinstance(assumptions, np.ndarray) and assumptions.dtype.names:
+            columns = {name: assumptions[name] for name in assumptions.dtype.names}
+        elif isinstance(assumptions, list):
+            columns = pd.DataFrame(assumptions)
+        else:
+            columns = assumptions
+
+        defaults = self._unit_economics_defaults()
+        n_rows = max((np.size(columns[k]) for k in defaults if k in columns), default=1)
+        if isinstance(assumptions, list):
+            n_rows = len(assumptions)
+
+        result = {}
+        for key, default in defaults.items():
+            values = np.full(n_rows, default, dtype=np.float64)
+            if key in columns:
+                given = np.broadcast_to(
+                    np.asarray(columns[key], dtype=np.float64), (n_rows,)
+                )
+                values = np.where(np.isnan(given), default, given)
+            result[key] = values
+        return result
+
+    @staticmethod
+    def _unit_economics_metrics(a: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """
+        Derived unit-economics metrics for columns of assumptions
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            total_cogs = a["api_cost"] + a["infra_cost"]
+            gross_margin = 1 - total_cogs / a["price"]
+            gross_profit_per_user = a["arpu"] * gross_margin
+            avg_lifetime_months = 1 / (1 - a["retention"])
+            ltv = a["arpu"] * avg_lifetime_months * gross_margin
+            monthly_fixed_costs = a["dev_cost"] + a["marketing_cost"] + a["admin_cost"]
+            users_needed = monthly_fixed_costs / gross_profit_per_user
+
+            return {
+                **a,
+                "total_cogs": total_cogs,
+                "gross_margin": gross_margin,
+                "gross_profit_per_user": gross_profit_per_user,
+                "avg_lifetime_months": avg_lifetime_months,
+                "ltv": ltv,
+                "ltv_cac_ratio": ltv / a["cac"],
+                "payback_period_months": a["cac"] / gross_profit_per_user,
+                "magic_number": gross_profit_per_user * 12 / a["cac"],
+                "monthly_fixed_costs": monthly_fixed_costs,
+                "users_needed_for_breakeven": np.where(
+                    np.isfinite(users_needed) & (users_needed >= 0),
+                    np.floor(users_needed),
+                    np.nan,
+                ),
+                "mrr_needed": monthly_fixed_costs / gross_margin,
+            }
+
+    def validate_unit_economics_batch(self, assumptions) -> pd.DataFrame:
+        """
+        Validate many assumption sets at once (one row per set)
+
+        Missing columns (or NaN cells) fall back to the same defaults as
+        validate_unit_economics(). Break-even users is NaN when gross profit
+        per user is not positive.
+
+        Args:
+            assumptions: DataFrame, structured array, dict of arrays or list of
+                dicts with any of price, arpu, cac, api_cost, infra_cost,
+                retention, dev_cost, marketing_cost, admin_cost
+        """
+        metrics = self._unit_economics_metrics(self._assumption_columns(assumptions))
+        result = pd.DataFrame(metrics, copy=False)
+
+        if isinstance(assumptions, pd.DataFrame):
+            result.index = assumptions.index
+
+        return result
+
     def validate_unit_economics(self, assumptions: Dict = None) -> Dict:
         """
         Validate unit economics and calculate key metrics
@@ -145,65 +239,56 @@ class PricingStrategy:
         """
         print("🧮 Validating unit economics...")
 
-        if assumptions is None:
-            assumptions = {}
+        a = {**self._unit_economics_defaults(), **(assumptions or {})}
+        metrics = self._unit_economics_metrics(self._assumption_columns(a))
+        m = {key: float(values[0]) for key, values in metrics.items()}
 
         # Cost structure
         costs = {
             "cogs": {
-                "openai_api_per_user": assumptions.get(
-                    "api_cost", 3.50
-                ),  # $3.50/user/month (GPT-4)
-                "infrastructure_per_user": assumptions.get(
-                    "infra_cost", 0.50
-                ),  # AWS, storage
-                "total_per_user": 4.00,
+                "openai_api_per_user": a["api_cost"],  # $3.50/user/month (GPT-4)
+                "infrastructure_per_user": a["infra_cost"],  # AWS, storage
+                "total_per_user": m["total_cogs"],
             },
-            "gross_margin": 1 - (4.00 / PRICING_TIERS["pro"]["price_monthly"]),
+            "gross_margin": m["gross_margin"],
             "operating_costs": {
-                "product_development": assumptions.get("dev_cost", 25000),  # Monthly
-                "sales_marketing": assumptions.get("marketing_cost", 30000),
-                "general_admin": assumptions.get("admin_cost", 15000),
-                "total_monthly": 70000,
+                "product_development": a["dev_cost"],  # Monthly
+                "sales_marketing": a["marketing_cost"],
+                "general_admin": a["admin_cost"],
+                "total_monthly": a["dev_cost"] + a["marketing_cost"] + a["admin_cost"],
             },
         }
 
         # Customer economics
         customer_economics = {
-            "arpu": UNIT_ECONOMICS["ltv"]["arpu"],
-            "gross_margin_pct": costs["gross_margin"],
-            "gross_profit_per_user": UNIT_ECONOMICS["ltv"]["arpu"]
-            * costs["gross_margin"],
-            "retention_rate_monthly": assumptions.get("retention", 0.95),  # 5% churn
-            "avg_lifetime_months": 1 / (1 - 0.95),  # ~20 months
-            "ltv": UNIT_ECONOMICS["ltv"]["arpu"]
-            * (1 / (1 - 0.95))
-            * costs["gross_margin"],
+            "arpu": m["arpu"],
+            "gross_margin_pct": m["gross_margin"],
+            "gross_profit_per_user": m["gross_profit_per_user"],
+            "retention_rate_monthly": m["retention"],  # 5% churn
+            "avg_lifetime_months": m["avg_lifetime_months"],  # ~20 months
+            "ltv": m["ltv"],
         }
 
         # CAC analysis
         cac_analysis = {
-            "blended_cac": UNIT_ECONOMICS["cac"]["blended"],
-            "ltv": customer_economics["ltv"],
-            "ltv_cac_ratio": customer_economics["ltv"]
-            / UNIT_ECONOMICS["cac"]["blended"],
-            "payback_period_months": UNIT_ECONOMICS["cac"]["blended"]
-            / customer_economics["gross_profit_per_user"],
-            "magic_number": customer_economics["gross_profit_per_user"]
-            * 12
-            / UNIT_ECONOMICS["cac"]["blended"],
+            "blended_cac": m["cac"],
+            "ltv": m["ltv"],
+            "ltv_cac_ratio": m["ltv_cac_ratio"],
+            "payback_period_months": m["payback_period_months"],
+            "magic_number": m["magic_number"],
         }
 
         # Break-even analysis
         breakeven = {
             "monthly_fixed_costs": costs["operating_costs"]["total_monthly"],
-            "gross_profit_per_user": customer_economics["gross_profit_per_user"],
-            "users_needed_for_breakeven": int(
-                costs["operating_costs"]["total_monthly"]
-                / customer_economics["gross_profit_per_user"]
+            "gross_profit_per_user": m["gross_profit_per_user"],
+            # None when gross profit per user is not positive (no break-even)
+            "users_needed_for_breakeven": (
+                None
+                if np.isnan(m["users_needed_for_breakeven"])
+                else int(m["users_needed_for_breakeven"])
             ),
-            "mrr_needed": costs["operating_costs"]["total_monthly"]
-            / costs["gross_margin"],
+            "mrr_needed": m["mrr_needed"],
         }
 
         validation = {
@@ -252,12 +337,167 @@ class PricingStrategy:
         print(
             f"   Gross Margin: {costs['gross_margin']*100:.1f}% ({validation['health_check']['gross_margin']['status']})"
         )
+        users_needed = breakeven["users_needed_for_breakeven"]
         print(
-            f"   Break-even: {breakeven['users_needed_for_breakeven']:,} paying users"
+            f"   Break-even: {users_needed:,} paying users"
+            if users_needed is not None
+            else "   Break-even: not reachable (no gross profit per user)"
         )
 
         return validation
 
+    def optimize_price_points(
+        self,
+        min_gross_margin: float = 0.70,
+        min_ltv_cac: float = 3.0,
+        objective: str = "revenue",
+        prices=None,
+    ) -> Dict:
+        """
+        Find revenue-optimal prices on a dense grid under unit-economics constraints
+
+        Args:
+            min_gross_margin: Minimum gross margin at the chosen price
+            min_ltv_cac: Minimum LTV/CAC at the chosen price
+            objective: "revenue" or "gross_profit"
+            prices: Optional custom price grid (USD/month)
+        """
+        print("📈 Optimizing price points...")
+
+        constraints = {
+            "min_gross_margin": min_gross_margin,
+            "min_ltv_cac": min_ltv_cac,
+            "objective": objective,
+        }
+        self.price_optimization = {
+            "by_segment": self.demand_model.optimize(prices, **constraints),
+            "list_prices": self.demand_model.optimize_uniform(prices, **constraints),
+            "constraints": constraints,
+        }
+
+        list_prices = self.price_optimization["list_prices"]
+        print(f"✅ Price optimization complete")
+        for _, row in list_prices.iterrows():
+            price = (
+                f"${row['optimal_price']:.2f}/month"
+                if row["feasible"]
+                else "no feasible price"
+            )
+            print(
+                f"   {row['tier'].title()}: {price} (currently ${row['reference_price']:.0f})"
+            )
+
+        return self.price_optimization
+
+    def apply_pricing_research(self, research, segments: List[str] = None) -> Dict:
+        """
+        Feed survey research (Van Westendorp, conjoint) into the pricing model
+
+        Conjoint take rates against the "no purchase" option set the demand
+        model's elasticities, so a later optimize_price_points() uses
+        survey-derived price sensitivity.
+
+        Args:
+            research: PricingResearch with van_westendorp() and/or fit_conjoint() run
+            segments: Demand-model segments the survey represents (default all)
+        """
+        print("🔬 Applying pricing research to strategy...")
+
+        self.survey_research = {"van_westendorp": None, "conjoint": None}
+
+        if research.van_westendorp_results:
+            vw = research.van_westendorp_results
+            self.survey_research["van_westendorp"] = vw.get(
+                "all", next(iter(vw.values()))
+            )
+
+        conjoint = research.conjoint_results
+        if conjoint is not None and "none" in conjoint["coefficients"].index:
+            take_rates = research.predict_take_rates(self.demand_model.price_grid())
+            take_rates = take_rates[take_rates["tier"].isin(self.demand_model.tiers)]
+            survey = pd.concat(
+                [
+                    take_rates.assign(segment=segment)
+                    for segment in (segments or self.demand_model.segments)
+                ],
+                ignore_index=True,
+            )
+            # Stated choices overstate real conversion: keep levels, fit shape
+            fitted = self.demand_model.fit_from_survey(survey, update_conversion=False)
+            self.survey_research["conjoint"] = {
+                "willingness_to_pay": conjoint["willingness_to_pay"],
+                "fitted_elasticities": fitted,
+            }
+
+        print(f"✅ Pricing research applied")
+        return self.survey_research
+
+    def localize_prices(self, countries=None) -> Dict:
+        """
+        Compute PPP-localized prices for every country and paid tier
+
+        Args:
+            countries: Country table (DataFrame or CSV path); defaults to
+                REGIONAL_PRICING or RAW_DATA_DIR/country_pricing_inputs.csv
+        """
+        print("🌍 Localizing prices by purchasing power...")
+
+        engine = RegionalPricingEngine(countries)
+        engine.build()
+        self.regional_pricing = engine
+
+        summary = engine.summary()
+        print(f"✅ Regional pricing computed for {summary['countries']} countries")
+        print(f"   Expected MRR: ${summary['expected_revenue']:,.0f}")
+        print(
+            f"   Uplift vs uniform USD pricing: {summary['uplift_vs_uniform']*100:+.1f}%"
+        )
+
+        return summary
+
+    def plan_pricing_test(
+        self,
+        channel_strategy: Dict,
+        arm_prices: List[float] = None,
+        rules: List[Dict] = None,
+        n_experiments: int = 2000,
+    ) -> pd.DataFrame:
+        """
+        Size the proposed Pro-tier price test before spending real traffic
+
+        Args:
+            channel_strategy: Output of GTMPlanner.define_channel_strategy(),
+                used as weekly test traffic
+            arm_prices: Prices to test (default $12 / $15 / $18)
+            rules: Stopping rules to compare (stopping_rule, threshold)
+        """
+        print("🧪 Simulating pricing test plans...")
+
+        arm_prices = arm_prices or [12, 15, 18]
+        rules = rules or [
+            {"stopping_rule": "probability_best", "threshold": 0.90},
+            {"stopping_rule": "probability_best", "threshold": 0.95},
+            {"stopping_rule": "expected_loss", "threshold": 0.01},
+        ]
+
+        traffic = channel_weekly_traffic(channel_strategy)
+        simulator = PricingExperimentSimulator(arm_prices)
+        comparison = simulator.compare_rules(
+            traffic, rules, n_experiments=n_experiments
+        )
+
+        self.experiment_plan = {
+            "arm_prices": arm_prices,
+            "weekly_traffic": traffic,
+            "true_conversion": simulator.true_conversion,
+            "comparison": comparison,
+        }
+
+        print(
+            f"✅ Simulated {len(rules)} stopping rules x {n_experiments:,} experiments"
+        )
+        return comparison
+
     def generate_pricing_recommendation(self) -> str:
         """
         Generate pricing strategy recommendation
@@ -328,9 +568,77 @@ class PricingStrategy:
         report += f"\n"
         report += f"Break-even Analysis:\n"
         report += f"   Monthly Fixed Costs: ${unit_econ['breakeven']['monthly_fixed_costs']:,}\n"
-        report += f"   Paying Users Needed: {unit_econ['breakeven']['users_needed_for_breakeven']:,}\n"
+        users_needed = unit_econ["breakeven"]["users_needed_for_breakeven"]
+        report += (
+            f"   Paying Users Needed: {users_needed:,}\n"
+            if users_needed is not None
+            else "   Paying Users Needed: not reachable\n"
+        )
         report += f"   MRR Required: ${unit_econ['breakeven']['mrr_needed']:,.0f}\n"
 
+        if self.survey_research is not None:
+            report += "\n\n"
+            report += "🔬 SURVEY-BASED PRICING RESEARCH\n"
+            report += "-" * 80 + "\n"
+            vw = self.survey_research["van_westendorp"]
+            if vw is not None:
+                points = vw["points"]
+                report += f"Van Westendorp ({vw['respondents']:,} respondents):\n"
+                report += f"   Acceptable price range: ${points['pmc']:.2f} - ${points['pme']:.2f}\n"
+                report += f"   Optimal price point: ${points['opp']:.2f}\n"
+                report += f"   Indifference price point: ${points['ipp']:.2f}\n"
+            conjoint = self.survey_research["conjoint"]
+            if conjoint is not None and conjoint["willingness_to_pay"] is not None:
+                report += "Conjoint willingness to pay (top features):\n"
+                top = conjoint["willingness_to_pay"].sort_values(ascending=False)
+                for feature, value in top.head(5).items():
+                    report += f"   • {feature}: ${value:.2f}/month\n"
+
+        if self.price_optimization is not None:
+            constraints = self.price_optimization["constraints"]
+            report += "\n\n"
+            report += "📈 PRICE OPTIMIZATION (Demand Model)\n"
+            report += "-" * 80 + "\n"
+            report += f"Constraints: gross margin >= {constraints['min_gross_margin']*100:.0f}%, LTV/CAC >= {constraints['min_ltv_cac']:.1f}x\n"
+            report += "Optimal list prices:\n"
+            for _, row in self.price_optimization["list_prices"].iterrows():
+                if not row["feasible"]:
+                    report += f"   • {row['tier'].title()}: no feasible price (${row['reference_price']:.0f} today)\n"
+                    continue
+                report += f"   • {row['tier'].title()}: ${row['optimal_price']:.2f}/month vs ${row['reference_price']:.0f} today ({row['paying_users']:,.0f} paying, ${row['revenue']:,.0f} MRR)\n"
+            report += "Optimal price by segment:\n"
+            for _, row in self.price_optimization["by_segment"].iterrows():
+                price = (
+                    f"${row['optimal_price']:.2f}"
+                    if row["feasible"]
+                    else "no feasible price"
+                )
+                report += f"   • {row['segment'].title()} / {row['tier'].title()}: {price} (elasticity {row['elasticity']:.2f})\n"
+
+        if self.regional_pricing is not None:
+            summary = self.regional_pricing.summary()
+            report += "\n\n"
+            report += "🌍 REGIONAL PRICING (PPP)\n"
+            report += "-" * 80 + "\n"
+            report += f"Countries priced: {summary['countries']}\n"
+            report += f"Expected MRR: ${summary['expected_revenue']:,.0f} (uniform USD pricing: ${summary['uniform_revenue']:,.0f}, {summary['uplift_vs_uniform']*100:+.1f}%)\n"
+            report += f"Cross-border cannibalization: ${summary['cannibalized_revenue']:,.0f}/month\n"
+            report += "Pro tier by expected revenue:\n"
+            pro = self.regional_pricing.table
+            pro = pro[pro["tier"] == "pro"].nlargest(8, "expected_revenue")
+            for _, row in pro.iterrows():
+                report += f"   • {row['country']}: {row['currency']} {row['local_price']:,.0f}/month (${row['price_usd']:.2f} net, {row['discount']*100:.0f}% off list)\n"
+
+        if self.experiment_plan is not None:
+            plan = self.experiment_plan
+            report += "\n\n"
+            report += "🧪 PRICING TEST PLAN (Simulated)\n"
+            report += "-" * 80 + "\n"
+            arms = ", ".join(f"${p:.0f}" for p in plan["arm_prices"])
+            report += f"Arms: {arms} | Test traffic: {plan['weekly_traffic'].sum():,.0f} visitors over {len(plan['weekly_traffic'])} weeks\n"
+            for _, row in plan["comparison"].iterrows():
+                report += f"   • {row['stopping_rule']} @ {row['threshold']}: decide in {row['mean_periods_to_decision']:.1f} weeks, error rate {row['error_rate']*100:.1f}%, test regret ${row['mean_test_regret']:,.0f}\n"
+
         report += "\n\n"
         report += "✅ STRATEGIC RECOMMENDATIONS\n"
         report += "-" * 80 + "\n"
@@ -357,10 +665,12 @@ class PricingStrategy:
         report += "   • Improves cash flow and reduces churn\n"
         report += "   • Target 40% of paid users on annual plans\n"
         report += "\n"
+        india = (self.regional_pricing or RegionalPricingEngine()).lookup("IN", "pro")
         report += "5. REGIONAL PRICING STRATEGY (INDIA FOCUS)\n"
-        report += "   • Problem: Standard $15/mo is high friction for Indian market (~₹1,250)\n"
+        report += f"   • Problem: Standard ${PRICING_TIERS['pro']['price_monthly']}/mo is high friction for Indian market\n"
         report += "   • Strategy: Implement Purchasing Power Parity (PPP) pricing\n"
-        report += "   • Offer: Pro Plan at ₹499/month (approx $6) for users in India\n"
+        if india is not None:
+            report += f"   • Offer: Pro Plan at {india['currency']} {india['local_price']:,.0f}/month (${india['price_usd']:.2f} net, {india['discount']*100:.0f}% off list) for users in India\n"
         report += "   • Rationale: Lower barrier to entry for large volume of Indian PhD scholars\n"
         report += "   • Impact: Increases adoption in the beachhead market while maintaining global ARPU\n"
 
@@ -0,0 +1,265 @@
+"""
+Regional Pricing Engine
+Purchasing-power-parity (PPP) localized prices for every country and tier
+"""
+
+import pandas as pd
+import numpy as np
+from pathlib import Path
+from typing import Dict, List, Optional
+from config import *
+
+COUNTRY_COLUMNS = [
+    "country_code",
+    "country",
+    "currency",
+    "fx_rate",
+    "ppp_ratio",
+    "researchers",
+    "tax_rate",
+]
+
+
+def load_country_table(source=None) -> pd.DataFrame:
+    """
+    Load country inputs (PPP ratio, FX rate, researcher population, tax)
+
+    Args:
+        source: DataFrame or CSV path; defaults to
+            RAW_DATA_DIR / "country_pricing_inputs.csv" when present, else the
+            countries in REGIONAL_PRICING
+    """
+    if source is None:
+        default_path = RAW_DATA_DIR / "country_pricing_inputs.csv"
+        if default_path.exists():
+            source = default_path
+        else:
+            source = (
+                pd.DataFrame.from_dict(REGIONAL_PRICING["countries"], orient="index")
+                .rename_axis("country_code")
+                .reset_index()
+            )
+
+    countries = source if isinstance(source, pd.DataFrame) else pd.read_csv(source)
+
+    missing = [c for c in COUNTRY_COLUMNS if c not in countries.columns]
+    if missing:
+        raise ValueError(f"Country table is missing columns: {missing}")
+
+    countries = countries[COUNTRY_COLUMNS].copy()
+    countries["country_code"] = countries["country_code"].str.upper()
+    return countries.drop_duplicates("country_code").reset_index(drop=True)
+
+
+class RegionalPricingEngine:
+    """
+    Computes localized prices, expected revenue and cross-border
+    cannibalization for all countries x paid tiers in one array pass
+    """
+
+    def __init__(
+        self,
+        countries=None,
+        pricing_tiers: Dict = None,
+        regional_config: Dict = None,
+    ):
+        self.config = regional_config or REGIONAL_PRICING
+        pricing_tiers = pricing_tiers or PRICING_TIERS
+
+        self.countries = load_country_table(countries)
+        self.tiers = [
+            t for t, data in pricing_tiers.items() if data.get("price_monthly", 0) > 0
+        ]
+        self.base_prices = np.array(
+            [pricing_tiers[t]["price_monthly"] for t in self.tiers], dtype=np.float64
+        )
+        self.base_conversion = np.array(
+            [
+                DEMAND_MODEL["tiers"].get(t, {}).get("reference_conversion", 0.0)
+                for t in self.tiers
+            ],
+            dtype=np.float64,
+        )
+
+        self.table = None
+        self._index = {}
+
+    @staticmethod
+    def round_local_price(amounts) -> np.ndarray:
+        """
+        Round to two significant figures; amounts of 100+ end in 9 (e.g. 619)
+        """
+        amounts = np.asarray(amounts, dtype=np.float64)
+        step = 10.0 ** (np.floor(np.log10(np.maximum(amounts, 1e-9))) - 1)
+        rounded = np.maximum(np.round(amounts / step), 1) * step
+        return np.where(rounded >= 100, rounded - 1, rounded)
+
+    def build(self) -> pd.DataFrame:
+        """
+        Compute the country x tier price table
+
+        Prices follow ppp_ratio ** pass_through (floored at min_factor) and are
+        shown tax-inclusive in local currency. Conversion follows the demand
+        model's exponential curve on price relative to local purchasing power.
+        Cannibalization assumes up to leakage_rate of buyers route to the
+        cheapest region, scaled by how much they would save.
+        """
+        cfg = self.config
+        countries = self.countries
+
+        fx = countries["fx_rate"].to_numpy(np.float64)[:, None]
+        ppp = countries["ppp_ratio"].to_numpy(np.float64)[:, None]
+        tax = countries["tax_rate"].to_numpy(np.float64)[:, None]
+        researchers = countries["researchers"].to_numpy(np.float64)[:, None]
+        base = self.base_prices[None, :]
+
+        # (countries, tiers) localized prices
+        factor = np.maximum(ppp ** cfg["pass_through"], cfg["min_factor"])
+        local_price = self.round_local_price(base * factor * fx * (1 + tax))
+        price_usd = local_price / (1 + tax) / fx
+
+        def conversion_at(price):
+            relative = price / (base * ppp)
+            return np.minimum(
+                1.0, self.base_conversion * np.exp(-cfg["elasticity"] * (relative - 1))
+            )
+
+        conversion = conversion_at(price_usd)
+        paying_users = researchers * conversion
+        revenue = paying_users * price_usd
+
+        cheapest = price_usd.min(axis=0, keepdims=True)
+        leakage = cfg["leakage_rate"] * (1 - cheapest / price_usd)
+        cannibalized = paying_users * leakage * (price_usd - cheapest)
+
+        uniform_revenue = researchers * conversion_at(base) * base
+
+        n_countries, n_tiers = price_usd.shape
+        table = pd.DataFrame(
+            {
+                "country_code": np.repeat(
+                    countries["country_code"].to_numpy(), n_tiers
+                ),
+                "country": np.repeat(countries["country"].to_numpy(), n_tiers),
+                "currency": np.repeat(countries["currency"].to_numpy(), n_tiers),
+                "tier": np.tile(self.tiers, n_countries),
+                "local_price": local_price.ravel(),
+                "price_usd": price_usd.ravel(),
+                "discount": (1 - price_usd / base).ravel(),
+                "conversion": conversion.ravel(),
+                "paying_users": paying_users.ravel(),
+                "revenue": revenue.ravel(),
+                "cannibalized_revenue": cannibalized.ravel(),
+                "expected_revenue": (revenue - cannibalized).ravel(),
+                "uniform_revenue": np.broadcast_to(
+                    uniform_revenue, revenue.shape
+                ).ravel(),
+            }
+        )
+
+        self._set_table(table)
+        return table
+
+    def _set_table(self, table: pd.DataFrame):
+        """
+        Store the table and rebuild the per-country lookup index
+        """
+        self.table = table
+        self._index = {}
+        for row in table.to_dict("records"):
+            entry = self._index.setdefault(
+                row["country_code"],
+                {
+                    "country": row["country"],
+                    "currency": row["currency"],
+                    "tiers": {},
+                },
+            )
+            entry["tiers"][row["tier"]] = row
+
+    def lookup(self, country_code: str, tier: str = None) -> Optional[Dict]:
+        """
+        O(1) lookup of a country's localized prices (None if unknown)
+        """
+        if self.table is None:
+            self.build()
+
+        entry = self._index.get(country_code.upper())
+        if entry is None or tier is None:
+            return entry
+        return entry["tiers"].get(tier)
+
+    def summary(self) -> Dict:
+        """
+        Portfolio totals vs uniform USD pricing (monthly USD)
+        """
+        if self.table is None:
+            self.build()
+
+        table = self.table
+        expected = table["expected_revenue"].sum()
+        uniform = table["uniform_revenue"].sum()
+
+        return {
+            "countries": table["country_code"].nunique(),
+            "tiers": self.tiers,
+            "paying_users": table["paying_users"].sum(),
+            "gross_revenue": table["revenue"].sum(),
+            "cannibalized_revenue": table["cannibalized_revenue"].sum(),
+            "expected_revenue": expected,
+            "uniform_revenue": uniform,
+            "uplift_vs_uniform": expected / uniform - 1 if uniform > 0 else np.nan,
+        }
+
+    def save(self, path: Path = None) -> Path:
+        """
+        Persist the precomputed table for the app and reports
+        """
+        if self.table is None:
+            self.build()
+
+        path = Path(path or PROCESSED_DATA_DIR / "regional_pricing.csv")
+        self.table.to_csv(path, index=False)
+        return path
+
+    @classmethod
+    def from_cache(cls, path: Path = None) -> "RegionalPricingEngine":
+        """
+        Load a table written by save() without recomputing it
+        """
+        path = Path(path or PROCESSED_DATA_DIR / "regional_pricing.csv")
+        table = pd.read_csv(path, keep_default_na=False, na_values=[""])
+
+        codes = table.drop_duplicates("country_code")
+        engine = cls.__new__(cls)
+        engine.config = REGIONAL_PRICING
+        engine.countries = codes[["country_code", "country", "currency"]].reset_index(
+            drop=True
+        )
+        engine.tiers = list(dict.fromkeys(table["tier"]))
+        engine.base_prices = np.array(
+            [PRICING_TIERS[t]["price_monthly"] for t in engine.tiers], dtype=np.float64
+        )
+        engine.base_conversion = None
+        engine._set_table(table)
+        return engine
+
+
+if __name__ == "__main__":
+    print("=" * 80)
+    print(" REGIONAL PRICING ENGINE")
+    print("=" * 80)
+    print()
+
+    engine = RegionalPricingEngine()
+    table = engine.build()
+    print(table.to_string())
+
+    summary = engine.summary()
+    print(f"\nExpected MRR: ${summary['expected_revenue']:,.0f}")
+    print(f"Uplift vs uniform USD pricing: {summary['uplift_vs_uniform']*100:+.1f}%")
+
+    india = engine.lookup("IN", "pro")
+    print(f"India Pro: {india['currency']} {india['local_price']:,.0f}/month")
+
+    print(f"\n💾 Saved to: {engine.save()}")
@@ -0,0 +1,313 @@
+"""
+Competitor Similarity
+Blocked similarity matrices and nearest-neighbor queries over products
+"""
+
+import pandas as pd
+import numpy as np
+from typing import Dict, List, Optional, Sequence, Union
+from config import *
+from feature_matrix import FeatureMatrix
+
+METRICS = ("cosine", "euclidean")
+
+
+def build_vectors(
+    store: FeatureMatrix,
+    positioning: Optional[pd.DataFrame] = None,
+    price_index=None,
+    weights: Dict[str, float] = None,
+    our_price: float = None,
+    overview: Optional[pd.DataFrame] = None,
+    overview_columns: Sequence[str] = ("estimated_users", "total_funding_usd"),
+) -> pd.DataFrame:
+    """
+    Standardized product vectors: features, positioning, price and overview
+
+    Each column is z-scored (missing = mean). A group's columns are scaled
+    by weight / sqrt(n_columns), so groups count by weight rather than by
+    how many columns they have.
+
+    Args:
+        positioning: Frame with competitor_id, x_specialization, y_user_type
+        price_index: PriceIndex for the lowest paid monthly price
+        weights: Group weights {"features", "positioning", "price", "overview"}
+        our_price: Price for our_product (default: Pro monthly price)
+        overview: Competitive overview; adds log10(1 + value) of
+            overview_columns (scale metrics such as users and funding)
+    """
+    weights = {
+        "features": 1.0,
+        "positioning": 1.0,
+        "price": 1.0,
+        "overview": 1.0,
+        **(weights or {}),
+    }
+    index = pd.Index(store.competitors, name="competitor_id")
+    groups = {
+        "features": pd.DataFrame(
+            store.values.astype(np.float64), index=index, columns=store.features
+        )
+    }
+    if positioning is not None:
+        groups["positioning"] = positioning.set_index("competitor_id")[
+            ["x_specialization", "y_user_type"]
+        ].reindex(index)
+    if price_index is not None:
+        our_price = our_price or PRICING_TIERS["pro"]["price_monthly"]
+        groups["price"] = pd.DataFrame(
+            {
+                "price_monthly": [
+                    our_price if c == "our_product" else price_index.lowest_price(c)
+                    for c in index
+                ]
+            },
+            index=index,
+        )
+    if overview is not None:
+        columns = [c for c in overview_columns if c in overview]
+        groups["overview"] = np.log10(
+            1
+            + overview.set_index("competitor_id")[columns]
+            .apply(pd.to_numeric, errors="coerce")
+            .reindex(index)
+        )
+
+    scaled = []
+    for name, group in groups.items():
+        std = group.std(ddof=0).replace(0, 1.0).fillna(1.0)
+        z = ((group - group.mean()) / std).fillna(0.0)
+        scaled.append(z * weights[name] / np.sqrt(group.shape[1]))
+    return pd.concat(scaled, axis=1)
+
+
+class SimilarityIndex:
+    """
+    Exact blocked similarity for small landscapes, random-projection LSH
+    with exact re-ranking once the product count passes a threshold
+    """
+
+    def __init__(
+        self,
+        vectors: pd.DataFrame,
+        block_size: int = 2048,
+        approximate_threshold: int = 20_000,
+        n_planes: int = 12,
+        n_tables: int = 8,
+        seed: int = 42,
+    ):
+        """
+        Args:
+            vectors: One row per product (index = id), e.g. build_vectors()
+            approximate_threshold: Product count above which query() uses
+                the LSH index instead of a full scan
+            n_planes: Hyperplanes (hash bits) per table
+            n_tables: Independent hash tables (more = better recall)
+        """
+        self.ids = list(vectors.index)
+        self.position = {c: i for i, c in enumerate(self.ids)}
+        self.values = np.ascontiguousarray(vectors.to_numpy(np.float64))
+        self.columns = list(vectors.columns)
+        self.block_size = block_size
+        self.approximate_threshold = approximate_threshold
+        self.n_planes = n_planes
+        self.n_tables = n_tables
+        self.seed = seed
+
+        norms = np.linalg.norm(self.values, axis=1, keepdims=True)
+        self.unit = self.values / np.where(norms > 0, norms, 1.0)
+        self.sq_norms = (self.values**2).sum(axis=1)
+        self._matrices = {}
+        self._tables = None
+
+    def _scores(self, queries: np.ndarray, metric: str) -> np.ndarray:
+        """
+        Query x product scores: cosine similarity or Euclidean distance
+        """
+        if metric == "cosine":
+            norms = np.linalg.norm(queries, axis=1, keepdims=True)
+            return (queries / np.where(norms > 0, norms, 1.0)) @ self.unit.T
+        if metric == "euclidean":
+            sq = (queries**2).sum(axis=1)[:, None] + self.sq_norms[None, :]
+            return np.sqrt(np.maximum(sq - 2 * queries @ self.values.T, 0.0))
+        raise ValueError(f"Unknown metric: {metric} (use one of {METRICS})")
+
+    def matrix(self, metric: str = "cosine") -> pd.DataFrame:
+        """
+        Full product x product matrix, computed in row blocks and cached
+
+        Cosine returns similarity (1 = identical direction); Euclidean
+        returns distance (0 = identical).
+        """
+        if metric not in self._matrices:
+            n = len(self.ids)
+            result = np.empty((n, n))
+            for start in range(0, n, self.block_size):
+                stop = start + self.block_size
+                result[start:stop] = self._scores(self.values[start:stop], metric)
+            self._matrices[metric] = pd.DataFrame(
+                result, index=self.ids, columns=self.ids
+            )
+        return self._matrices[metric]
+
+    def _build_tables(self):
+        """
+        Sign-of-projection hash codes per table, sorted for range lookups
+        """
+        rng = np.random.default_rng(self.seed)
+        planes = rng.normal(size=(self.n_tables, self.values.shape[1], self.n_planes))
+        bits = 1 << np.arange(self.n_planes)
+        codes = ((np.einsum("nd,tdp->tnp", self.values, planes) > 0) * bits).sum(axis=2)
+        order = np.argsort(codes, axis=1, kind="stable")
+        self._tables = {
+            "planes": planes,
+            "bits": bits,
+            "order": order,
+            "codes": np.take_along_axis(codes, order, axis=1),
+        }
+
+    def _candidates(self, query: np.ndarray, min_candidates: int) -> np.ndarray:
+        """
+        Products sharing a bucket with the query in any table; probes
+        buckets one bit away when too few are found
+        """
+        if self._tables is None:
+            self._build_tables()
+        t = self._tables
+        codes = ((np.einsum("d,tdp->tp", query, t["planes"]) > 0) * t["bits"]).sum(
+            axis=1
+        )
+
+        found = []
+        for probes in (codes[:, None], codes[:, None] ^ t["bits"][None, :]):
+            for table, table_probes in enumerate(probes):
+                sorted_codes = t["codes"][table]
+                lo = np.searchsorted(sorted_codes, table_probes, side="left")
+                hi = np.searchsorted(sorted_codes, table_probes, side="right")
+                for a, b in zip(lo, hi):
+                    found.append(t["order"][table, a:b])
+            candidates = np.unique(np.concatenate(found))
+            if len(candidates) >= min_candidates:
+                break
+        return candidates
+
+    def query(
+        self,
+        target: Union[str, np.ndarray],
+        k: int = 5,
+        metric: str = "cosine",
+        approximate: Optional[bool] = None,
+    ) -> pd.DataFrame:
+        """
+        Top-k nearest products to a product id or raw vector
+
+        Args:
+            target: Product id in the index, or a vector aligned with columns
+            approximate: Force (True) or skip (False) the LSH index; default
+                uses it above approximate_threshold products
+        """
+        exclude = None
+        if isinstance(target, str):
+            exclude = self.position[target]
+            query = self.values[exclude]
+        else:
+            query = np.asarray(target, dtype=np.float64)
+
+        if approximate is None:
+            approximate = len(self.ids) > self.approximate_threshold
+        if approximate:
+            candidates = self._candidates(query, min_candidates=4 * (k + 1))
+        else:
+            candidates = np.arange(len(self.ids))
+        if exclude is not None:
+            candidates = candidates[candidates != exclude]
+
+        # Exact re-ranking, restricted to the candidates
+        if metric == "cosine":
+            norm = np.linalg.norm(query)
+            scores = self.unit[candidates] @ (query / norm if norm > 0 else query)
+            key = -scores
+        elif metric == "euclidean":
+            sq = self.sq_norms[candidates] - 2 * self.values[candidates] @ query
+            scores = np.sqrt(np.maximum(sq + query @ query, 0.0))
+            key = scores
+        else:
+            raise ValueError(f"Unknown metric: {metric} (use one of {METRICS})")
+
+        k = min(k, len(candidates))
+        top = np.argpartition(key, k - 1)[:k] if k else np.array([], dtype=int)
+        top = top[np.argsort(key[top], kind="stable")]
+
+        return pd.DataFrame(
+            {
+                "competitor_id": [self.ids[i] for i in candidates[top]],
+                "rank": np.arange(1, len(top) + 1),
+                "similarity" if metric == "cosine" else "distance": scores[top],
+            }
+        )
+
+    def nearest_neighbors(self, k: int = 3, metric: str = "cosine") -> pd.DataFrame:
+        """
+        Top-k neighbors of every product (exact, blocked), long format
+        """
+        n = len(self.ids)
+        k = min(k, n - 1)
+        rows = []
+        for start in range(0, n, self.block_size):
+            block = self._scores(self.values[start : start + self.block_size], metric)
+            key = -block if metric == "cosine" else block.copy()
+            key[np.arange(len(block)), np.arange(start, start + len(block))] = np.inf
+            top = np.argpartition(key, k - 1, axis=1)[:, :k]
+            top = np.take_along_axis(
+                top, np.argsort(np.take_along_axis(key, top, axis=1), axis=1), axis=1
+            )
+            rows.append(
+                pd.DataFrame(
+                    {
+                        "competitor_id": np.repeat(
+                            np.asarray(self.ids, dtype=object)[
+                                start : start + len(block)
+                            ],
+                            k,
+                        ),
+                        "neighbor_id": np.asarray(self.ids, dtype=object)[top.ravel()],
+                        "rank": np.tile(np.arange(1, k + 1), len(block)),
+                        "score": np.take_along_axis(block, top, axis=1).ravel(),
+                    }
+                )
+            )
+        return pd.concat(rows, ignore_index=True)
+
+
+if __name__ == "__main__":
+    import time
+    from data_collector import CompetitiveDataCollector
+    from price_index import PriceIndex
+
+    print("=" * 80)
+    print(" COMPETITOR SIMILARITY")
+    print("=" * 80)
+    print()
+
+    collector = CompetitiveDataCollector()
+    collector.generate_feature_matrix()
+    index = SimilarityIndex(
+        build_vectors(collector.feature_store, price_index=PriceIndex())
+    )
+    print(index.matrix("cosine").round(2).to_string())
+    print()
+    print(index.query("our_product", k=3).to_string())
+
+    # Scale check: approximate queries over 200k synthetic products
+    rng = np.random.default_rng(42)
+    centers = rng.normal(size=(50, 17))
+    synthetic = pd.DataFrame(
+        centers[rng.integers(0, 50, 200_000)] + rng.normal(0, 0.3, (200_000, 17))
+    )
+    synthetic.index = synthetic.index.astype(str)
+    large = SimilarityIndex(synthetic)
+    large.query("0", k=10)
+    start = time.perf_counter()
+    for i in range(100):
+        large.query(str(i), k=10)
+    print(f"\n200k products: {(time.perf_counter() - start) * 10:.1f} ms per query")
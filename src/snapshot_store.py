@@ -0,0 +1,359 @@
+"""
+Landscape Snapshot Store
+Dated competitive-analysis snapshots stored as Parquet deltas
+"""
+
+import json
+import pandas as pd
+import numpy as np
+from pathlib import Path
+from typing import Dict, List, Optional
+from config import *
+
+# Table -> key columns; every other column is a tracked value
+TABLE_KEYS = {
+    "overview": ["competitor_id"],
+    "positioning": ["competitor_id"],
+    "features": ["competitor_id", "feature"],
+    "feature_gaps": ["feature"],
+    "swot": ["competitor_id", "category", "factor"],
+}
+
+
+def table_delta(before: Optional[pd.DataFrame], after: pd.DataFrame, keys: List[str]):
+    """
+    Rows added, updated or removed between two versions of a table
+
+    Returns the changed rows with an "op" column of "add", "update" or
+    "remove". Removals carry their last values, so column dtypes survive
+    the round trip through Parquet.
+    """
+    if before is None or before.empty:
+        return after.assign(op="add")
+
+    values = [c for c in after.columns if c not in keys]
+    merged = before.merge(
+        after, on=keys, how="outer", suffixes=("_old", ""), indicator=True
+    )
+
+    changed = np.zeros(len(merged), dtype=bool)
+    for column in values:
+        old = merged.get(f"{column}_old")
+        if old is None:
+            changed |= merged["_merge"].eq("both").to_numpy()
+            continue
+        new = merged[column]
+        differs = (old != new) & ~(old.isna() & new.isna())
+        changed |= differs.to_numpy(dtype=bool)
+
+    removed = merged["_merge"].eq("left_only")
+    for column in values:
+        old = merged.get(f"{column}_old")
+        if old is not None and removed.any():
+            merged[column] = (
+                merged[column].where(~removed, old).astype(after[column].dtype)
+            )
+
+    op = np.select(
+        [
+            merged["_merge"].eq("right_only"),
+            merged["_merge"].eq("left_only"),
+            merged["_merge"].eq("both") & changed,
+        ],
+        ["add", "remove", "update"],
+        "",
+    )
+    delta = merged.loc[op != "", keys + values].copy()
+    delta["op"] = op[op != ""]
+    return delta.reset_index(drop=True)
+
+
+class LandscapeSnapshotStore:
+    """
+    Append-only history of analyzer outputs
+
+    Each recorded run writes only its changes (one Parquet file per table)
+    and an entry in manifest.json. Per table, all deltas are kept as one
+    change log in memory, so any state or diff is a lookup of each key's
+    latest row rather than a replay of files.
+    """
+
+    def __init__(self, root: Path = None):
+        self.root = Path(root or PROCESSED_DATA_DIR / "snapshots")
+        self.manifest_path = self.root / "manifest.json"
+        self.manifest = (
+            json.loads(self.manifest_path.read_text())
+            if self.manifest_path.exists()
+            else {"snapshots": []}
+        )
+        self._logs = {}
+        self._latest = {}
+
+    @property
+    def snapshots(self) -> pd.DataFrame:
+        """
+        One row per recorded snapshot
+        """
+        return pd.DataFrame(
+            self.manifest["snapshots"], columns=["snapshot_id", "date", "changes"]
+        )
+
+    def _log(self, table: str) -> Optional[Dict]:
+        """
+        All deltas of a table in snapshot order (loaded once, then cached)
+        with integer key ids and sorted dates for prefix lookups
+        """
+        if table not in self._logs:
+            frames = [
+                pd.read_parquet(self.root / entry["files"][table]).assign(
+                    snapshot_date=pd.Timestamp(entry["date"])
+                )
+                for entry in self.manifest["snapshots"]
+                if table in entry["files"]
+            ]
+            if not frames:
+                return None
+            log = pd.concat(frames, ignore_index=True)
+            self._logs[table] = {
+                "frame": log,
+                "key_ids": log.groupby(TABLE_KEYS[table], sort=False, dropna=False)
+                .ngroup()
+                .to_numpy(),
+                "dates": log["snapshot_date"].to_numpy(),
+            }
+        return self._logs[table]
+
+    @staticmethod
+    def _last_rows(log: Dict, as_of=None, key_ids: np.ndarray = None) -> np.ndarray:
+        """
+        Log positions holding each key's latest row as of a date
+
+        Snapshots are recorded in date order, so "as of" is a prefix of the
+        log and no full scan or replay is needed.
+        """
+        end = (
+            len(log["dates"])
+            if as_of is None
+            else np.searchsorted(
+                log["dates"], np.datetime64(pd.Timestamp(as_of)), side="right"
+            )
+        )
+        positions = np.arange(end)
+        if key_ids is not None:
+            positions = positions[np.isin(log["key_ids"][:end], key_ids)]
+        reversed_positions = positions[::-1]
+        _, first = np.unique(log["key_ids"][reversed_positions], return_index=True)
+        return np.sort(reversed_positions[first])
+
+    def _rows(self, table: str, positions: np.ndarray) -> pd.DataFrame:
+        """
+        Non-removed rows at log positions, in first-recorded key order
+        """
+        key_ids = self._logs[table]["key_ids"][positions]
+        positions = positions[np.argsort(key_ids, kind="stable")]
+        rows = self._logs[table]["frame"].iloc[positions]
+        rows = rows[rows["op"] != "remove"]
+        return rows.drop(columns=["op", "snapshot_date"]).reset_index(drop=True)
+
+    def state(self, table: str, as_of=None) -> Optional[pd.DataFrame]:
+        """
+        Table contents as of a date (default: latest snapshot)
+        """
+        if as_of is None and table in self._latest:
+            return self._latest[table]
+        log = self._log(table)
+        if log is None:
+            return None
+        return self._rows(table, self._last_rows(log, as_of))
+
+    def record(self, snapshot_date=None, **tables: pd.DataFrame) -> Dict:
+        """
+        Store one analysis run as deltas against the latest snapshot
+
+        Args:
+            snapshot_date: Date of the run (default: today)
+            **tables: Any of TABLE_KEYS (overview, positioning, features,
+                feature_gaps, swot); features in long format
+        """
+        unknown = sorted(set(tables) - set(TABLE_KEYS))
+        if unknown:
+            raise ValueError(f"Unknown snapshot tables: {unknown}")
+
+        snapshot_date = pd.Timestamp(snapshot_date or pd.Timestamp.today()).normalize()
+        if self.manifest["snapshots"]:
+            last = pd.Timestamp(self.manifest["snapshots"][-1]["date"])
+            if snapshot_date < last:
+                raise ValueError(
+                    f"Snapshots must be recorded in date order (last: {last.date()})"
+                )
+
+        snapshot_id = f"{snapshot_date:%Y%m%d}_{len(self.manifest['snapshots']):04d}"
+        directory = self.root / snapshot_id
+        directory.mkdir(parents=True, exist_ok=True)
+
+        files, changes = {}, {}
+        for table, frame in tables.items():
+            if frame is None:
+                continue
+            frame = frame.reset_index(drop=True)
+            delta = table_delta(self.state(table), frame, TABLE_KEYS[table])
+            path = directory / f"{table}.parquet"
+            delta.to_parquet(path, index=False)
+            files[table] = path.relative_to(self.root).as_posix()
+            changes[table] = int(len(delta))
+            # Latest state is the frame itself; the log reloads on demand
+            self._latest[table] = frame.copy()
+            self._logs.pop(table, None)
+
+        entry = {
+            "snapshot_id": snapshot_id,
+            "date": snapshot_date.strftime("%Y-%m-%d"),
+            "changes": changes,
+            "files": files,
+        }
+        self.manifest["snapshots"].append(entry)
+        self.manifest_path.write_text(json.dumps(self.manifest, indent=2))
+        return entry
+
+    def changed_rows(self, table: str, since, until=None) -> pd.DataFrame:
+        """
+        Raw delta rows recorded after `since` up to `until`
+        """
+        log = self._log(table)
+        if log is None:
+            return pd.DataFrame()
+        dates = log["dates"]
+        lo = np.searchsorted(dates, np.datetime64(pd.Timestamp(since)), side="right")
+        hi = (
+            len(dates)
+            if until is None
+            else np.searchsorted(dates, np.datetime64(pd.Timestamp(until)), "right")
+        )
+        return log["frame"].iloc[lo:hi].reset_index(drop=True)
+
+    def _window(self, table: str, since, until) -> Optional[tuple]:
+        """
+        Before/after rows for only the keys touched between two dates
+        """
+        log = self._log(table)
+        if log is None:
+            return None
+        dates = log["dates"]
+        lo = np.searchsorted(dates, np.datetime64(pd.Timestamp(since)), side="right")
+        hi = (
+            len(dates)
+            if until is None
+            else np.searchsorted(dates, np.datetime64(pd.Timestamp(until)), "right")
+        )
+        touched = np.unique(log["key_ids"][lo:hi])
+        before = self._rows(table, self._last_rows(log, since, touched))
+        after = self._rows(table, self._last_rows(log, until, touched))
+        return before, after
+
+    def diff(self, since, until=None) -> Dict:
+        """
+        What changed between two dates
+
+        Only keys with deltas in the window are compared, so the cost
+        follows the number of changes rather than the landscape size.
+        Returns new and removed competitors, moved positions (with distance)
+        and feature score changes.
+        """
+        result = {}
+
+        window = self._window("positioning", since, until)
+        if window is not None:
+            before, after = window
+            ids_before = set(before["competitor_id"])
+            ids_after = set(after["competitor_id"])
+            result["new_competitors"] = sorted(ids_after - ids_before)
+            result["removed_competitors"] = sorted(ids_before - ids_after)
+
+            moved = before.merge(
+                after, on="competitor_id", suffixes=("_before", "_after")
+            )
+            moved["distance"] = np.hypot(
+                moved["x_specialization_after"] - moved["x_specialization_before"],
+                moved["y_user_type_after"] - moved["y_user_type_before"],
+            )
+            result["moved"] = (
+                moved.loc[
+                    moved["distance"] > 0,
+                    [
+                        "competitor_id",
+                        "x_specialization_before",
+                        "y_user_type_before",
+                        "x_specialization_after",
+                        "y_user_type_after",
+                        "distance",
+                    ],
+                ]
+                .sort_values("distance", ascending=False, kind="stable")
+                .reset_index(drop=True)
+            )
+
+        window = self._window("features", since, until)
+        if window is not None:
+            before, after = window
+            scores = before.merge(
+                after,
+                on=TABLE_KEYS["features"],
+                how="outer",
+                suffixes=("_before", "_after"),
+            )
+            scores["change"] = scores["score_after"] - scores["score_before"]
+            changed = (scores["change"] != 0) & ~(
+                scores["score_before"].isna() & scores["score_after"].isna()
+            )
+            result["feature_changes"] = (
+                scores[changed]
+                .sort_values(["competitor_id", "feature"], kind="stable")
+                .reset_index(drop=True)
+            )
+
+        return result
+
+
+if __name__ == "__main__":
+    import tempfile
+    import time
+
+    print("=" * 80)
+    print(" LANDSCAPE SNAPSHOT STORE")
+    print("=" * 80)
+    print()
+
+    # Five years of monthly snapshots over 2,000 products x 15 features
+    rng = np.random.default_rng(42)
+    ids = [f"product_{i}" for i in range(2000)]
+    features = pd.MultiIndex.from_product(
+        [ids, FEATURE_DIMENSIONS], names=["competitor_id", "feature"]
+    ).to_frame(index=False)
+    features["score"] = rng.integers(0, 11, len(features))
+    positioning = pd.DataFrame(
+        {
+            "competitor_id": ids,
+            "x_specialization": rng.uniform(0, 10, 2000),
+            "y_user_type": rng.uniform(0, 10, 2000),
+        }
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = LandscapeSnapshotStore(tmp)
+        for month in pd.date_range("2021-01-01", periods=60, freq="MS"):
+            touched = rng.choice(len(features), 300, replace=False)
+            features.loc[touched, "score"] = rng.integers(0, 11, 300)
+            moved = rng.choice(2000, 20, replace=False)
+            positioning.loc[moved, "x_specialization"] = rng.uniform(0, 10, 20)
+            store.record(month, positioning=positioning, features=features)
+
+        reopened = LandscapeSnapshotStore(tmp)
+        reopened.diff("2025-09-01")
+        start = time.perf_counter()
+        changes = reopened.diff("2025-09-01", "2025-12-01")
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"Snapshots: {len(reopened.snapshots)}")
+        print(
+            f"Moved: {len(changes['moved'])}, score changes: {len(changes['feature_changes'])}"
+        )
+        print(f"Quarter diff: {elapsed:.1f} ms")
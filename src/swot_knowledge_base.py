@@ -0,0 +1,211 @@
+"""
+SWOT Knowledge Base
+Structured SWOT factors (YAML or Parquet) with sorted lookup indexes
+"""
+
+import pandas as pd
+import numpy as np
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Union
+from config import *
+
+CATEGORIES = ["Strengths", "Weaknesses", "Opportunities", "Threats"]
+IMPACTS = ["High", "Medium", "Low"]
+COLUMNS = ["competitor_id", "name", "category", "factor", "impact", "implications"]
+INDEXED = ["category", "competitor_id", "impact", "tags"]
+
+# Parsed tables shared across instances, keyed by (path, modification time)
+_TABLE_CACHE = {}
+
+
+def load_swot_table(path: Path) -> pd.DataFrame:
+    """
+    One row per factor from a YAML or Parquet knowledge base
+
+    YAML files list competitors, each with name and factors; Parquet files
+    hold the flat table (COLUMNS plus a list-valued tags column).
+    """
+    path = Path(path)
+    if path.suffix == ".parquet":
+        table = pd.read_parquet(path)
+    else:
+        import yaml
+
+        with open(path) as f:
+            source = yaml.safe_load(f) or {}
+        rows = [
+            {
+                "competitor_id": entry["competitor_id"],
+                "name": entry["name"],
+                **factor,
+            }
+            for entry in source.get("competitors", [])
+            for factor in entry.get("factors", [])
+        ]
+        table = pd.DataFrame(rows, columns=COLUMNS + ["tags"])
+
+    missing = [c for c in COLUMNS if c not in table.columns]
+    if missing:
+        raise ValueError(f"SWOT knowledge base is missing columns: {missing}")
+    for column, allowed in (("category", CATEGORIES), ("impact", IMPACTS)):
+        unknown = sorted(set(table[column]) - set(allowed))
+        if unknown:
+            raise ValueError(f"Unknown SWOT {column} values: {unknown}")
+
+    if "tags" not in table:
+        table["tags"] = None
+    table["tags"] = [
+        tuple(t) if t is not None and not isinstance(t, float) else ()
+        for t in table["tags"]
+    ]
+    return table.reset_index(drop=True)
+
+
+class SwotKnowledgeBase:
+    """
+    Lazily loaded SWOT factors with category, competitor, impact and tag
+    indexes
+
+    Each index is a sorted key list with the matching row positions, so a
+    lookup is two bisects and a slice. Filters on several fields intersect
+    the position sets and return rows in knowledge-base order.
+    """
+
+    def __init__(self, path: Union[str, Path] = None):
+        """
+        Args:
+            path: YAML or Parquet file (default: SWOT_KNOWLEDGE_BASE)
+        """
+        self.path = Path(path or SWOT_KNOWLEDGE_BASE)
+        self._table = None
+        self._indexes = None
+        self.source_key = None
+
+    @property
+    def table(self) -> pd.DataFrame:
+        """
+        Full factor table (parsed on first use, shared while the file is
+        unchanged)
+        """
+        key = (str(self.path.resolve()), self.path.stat().st_mtime_ns)
+        if self.source_key != key:
+            if key not in _TABLE_CACHE:
+                _TABLE_CACHE[key] = load_swot_table(self.path)
+            self._table = _TABLE_CACHE[key]
+            self._indexes = None
+            self.source_key = key
+        return self._table
+
+    def _build_index(self, keys: Sequence, positions: np.ndarray) -> Dict:
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        return {
+            "keys": [keys[i] for i in order],
+            "positions": positions[order],
+        }
+
+    @property
+    def indexes(self) -> Dict[str, Dict]:
+        """
+        Sorted (keys, positions) per indexed field
+        """
+        table = self.table
+        if self._indexes is None:
+            rows = np.arange(len(table))
+            self._indexes = {
+                field: self._build_index(table[field].tolist(), rows)
+                for field in ("category", "competitor_id", "impact")
+            }
+            tag_rows = [
+                (tag, i) for i, tags in enumerate(table["tags"]) for tag in tags
+            ]
+            self._indexes["tags"] = self._build_index(
+                [tag for tag, _ in tag_rows],
+                np.array([i for _, i in tag_rows], dtype=np.int64),
+            )
+        return self._indexes
+
+    def lookup(self, field: str, values: Union[str, Sequence[str]]) -> np.ndarray:
+        """
+        Sorted row positions whose field matches any of the values
+
+        Args:
+            field: One of category, competitor_id, impact, tags
+        """
+        if field not in INDEXED:
+            raise ValueError(f"Unknown SWOT index: {field} (use one of {INDEXED})")
+        index = self.indexes[field]
+        values = [values] if isinstance(values, str) else values
+        found = [
+            index["positions"][
+                bisect_left(index["keys"], v) : bisect_right(index["keys"], v)
+            ]
+            for v in values
+        ]
+        return np.unique(np.concatenate(found)) if found else np.empty(0, np.int64)
+
+    def filter(
+        self,
+        category: Union[str, Sequence[str]] = None,
+        competitor_id: Union[str, Sequence[str]] = None,
+        impact: Union[str, Sequence[str]] = None,
+        tags: Union[str, Sequence[str]] = None,
+    ) -> pd.DataFrame:
+        """
+        Factors matching every given field (any of the values within a field)
+
+        Args:
+            tags: Factors carrying any of these tags
+        """
+        positions = None
+        criteria = {
+            "category": category,
+            "competitor_id": competitor_id,
+            "impact": impact,
+            "tags": tags,
+        }
+        for field, values in criteria.items():
+            if values is None:
+                continue
+            found = self.lookup(field, values)
+            positions = (
+                found
+                if positions is None
+                else np.intersect1d(positions, found, assume_unique=True)
+            )
+
+        table = self.table
+        if positions is None:
+            return table.copy()
+        return table.iloc[positions].reset_index(drop=True)
+
+    def competitors(self) -> List[str]:
+        """
+        Competitor ids in knowledge-base order
+        """
+        return self.table["competitor_id"].drop_duplicates().tolist()
+
+    def to_parquet(self, path: Union[str, Path]) -> Path:
+        """
+        Write the flat table (e.g. to load large knowledge bases faster)
+        """
+        path = Path(path)
+        table = self.table.assign(tags=[list(t) for t in self.table["tags"]])
+        table.to_parquet(path, index=False)
+        return path
+
+
+if __name__ == "__main__":
+    print("=" * 80)
+    print(" SWOT KNOWLEDGE BASE")
+    print("=" * 80)
+    print()
+
+    knowledge_base = SwotKnowledgeBase()
+    print(
+        f"{len(knowledge_base.table)} factors, {len(knowledge_base.competitors())} products"
+    )
+    print()
+    print(knowledge_base.filter(category="Threats", impact="High").to_string())
+    print()
+    print(knowledge_base.filter(tags=["privacy", "switching_costs"]).to_string())
@@ -12,6 +12,8 @@ import plotly.express as px
 from plotly.subplots import make_subplots
 from typing import Dict, List
 from config import *
+from price_index import PriceIndex
+from feature_matrix import FeatureMatrix
 
 # Set style
 sns.set_style("whitegrid")
@@ -139,16 +141,18 @@ class GTMVisualizer:
 
         return fig
 
-    def plot_feature_comparison(self, features_matrix: pd.DataFrame) -> go.Figure:
+    def plot_feature_comparison(self, features_matrix) -> go.Figure:
         """
         Create radar chart comparing features
+
+        Args:
+            features_matrix: FeatureMatrix, or the long-format feature frame
         """
         print("🔧 Creating feature comparison chart...")
 
-        # Pivot to get scores by competitor
-        feature_pivot = features_matrix.pivot(
-            index="feature", columns="competitor_id", values="score"
-        )
+        store = features_matrix
+        if not isinstance(store, FeatureMatrix):
+            store = FeatureMatrix.from_long(features_matrix)
 
         # Select top competitors to compare
         competitors_to_compare = ["our_product", "notion_ai", "mem_ai", "obsidian"]
@@ -163,11 +167,11 @@ class GTMVisualizer:
         }
 
         for comp_id in competitors_to_compare:
-            if comp_id in feature_pivot.columns:
+            if comp_id in store:
                 fig.add_trace(
                     go.Scatterpolar(
-                        r=feature_pivot[comp_id],
-                        theta=feature_pivot.index,
+                        r=store.as_source_dtype(store.row(comp_id)),
+                        theta=store.features,
                         fill="toself",
                         name=comp_id.replace("_", " ").title(),
                         line_color=colors_map.get(comp_id, self.colors["primary"]),
@@ -418,19 +422,30 @@ class GTMVisualizer:
 
         return fig
 
-    def plot_pricing_comparison(self, pricing_data: pd.DataFrame) -> go.Figure:
+    def plot_pricing_comparison(self, pricing_data) -> go.Figure:
         """
         Create bar chart comparing pricing
+
+        Args:
+            pricing_data: PriceIndex, or a frame with competitor_name and
+                monthly-equivalent price_monthly
         """
         print("💵 Creating pricing comparison chart...")
 
-        # Filter to paid tiers only
-        paid_tiers = pricing_data[pricing_data["price_monthly"] > 0].copy()
-
-        # Group by competitor, get lowest price
-        competitor_prices = (
-            paid_tiers.groupby("competitor_name")["price_monthly"].min().reset_index()
-        )
+        if isinstance(pricing_data, PriceIndex):
+            competitor_prices = pricing_data.lowest_paid()[
+                ["competitor_name", "price_monthly"]
+            ]
+        else:
+            # Filter to paid tiers only
+            paid_tiers = pricing_data[pricing_data["price_monthly"] > 0].copy()
+
+            # Group by competitor, get lowest price
+            competitor_prices = (
+                paid_tiers.groupby("competitor_name")["price_monthly"]
+                .min()
+                .reset_index()
+            )
         competitor_prices = competitor_prices.sort_values("price_monthly")
 
         # Highlight our product
@@ -447,7 +462,7 @@ class GTMVisualizer:
                     orientation="h",
                     marker_color=colors,
                     text=competitor_prices["price_monthly"].apply(
-                        lambda x: f"${x:.0f}/mo"
+                        lambda x: f"${x:.2f}/mo"
                     ),
                     textposition="outside",
                 )
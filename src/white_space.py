@@ -0,0 +1,311 @@
+"""
+White Space Engine
+Grid-based detection of empty regions on the positioning plane
+"""
+
+import pandas as pd
+import numpy as np
+from typing import Dict, List, Optional, Sequence
+from config import *
+
+
+class WhiteSpaceEngine:
+    """
+    Bins the positioning plane at any resolution and finds empty regions
+
+    Cells are half-open ([low, high) on both axes), matching the quadrant
+    filters in CompetitiveAnalyzer.identify_white_space: a product exactly
+    on the upper boundary of the plane falls in no cell.
+    """
+
+    def __init__(self, x_range: tuple = (0.0, 10.0), y_range: tuple = (0.0, 10.0)):
+        self.x_range = x_range
+        self.y_range = y_range
+
+    @staticmethod
+    def _points(positioning: pd.DataFrame) -> tuple:
+        return (
+            positioning["x_specialization"].to_numpy(np.float64),
+            positioning["y_user_type"].to_numpy(np.float64),
+        )
+
+    def edges(self, bins) -> tuple:
+        """
+        Cell edges along x and y for an int or (x_bins, y_bins) resolution
+        """
+        x_bins, y_bins = (bins, bins) if np.isscalar(bins) else bins
+        return (
+            np.linspace(*self.x_range, x_bins + 1),
+            np.linspace(*self.y_range, y_bins + 1),
+        )
+
+    def cell_index(self, x: np.ndarray, y: np.ndarray, bins) -> tuple:
+        """
+        (row, col) cell of each point; -1 for points outside the plane
+        """
+        x_edges, y_edges = self.edges(bins)
+        col = np.searchsorted(x_edges, x, side="right") - 1
+        row = np.searchsorted(y_edges, y, side="right") - 1
+        outside = (
+            (col < 0)
+            | (col >= len(x_edges) - 1)
+            | (row < 0)
+            | (row >= len(y_edges) - 1)
+        )
+        return np.where(outside, -1, row), np.where(outside, -1, col)
+
+    def histogram(self, positioning: pd.DataFrame, bins=10) -> np.ndarray:
+        """
+        Product counts per cell, shape (y_bins, x_bins)
+        """
+        x_edges, y_edges = self.edges(bins)
+        shape = (len(y_edges) - 1, len(x_edges) - 1)
+        row, col = self.cell_index(*self._points(positioning), bins)
+        inside = row >= 0
+        flat = row[inside] * shape[1] + col[inside]
+        return np.bincount(flat, minlength=shape[0] * shape[1]).reshape(shape)
+
+    def quadrant_counts(
+        self, positioning: pd.DataFrame, name_column: str = "name"
+    ) -> Dict:
+        """
+        Four-quadrant special case (2 x 2 grid) with member names
+
+        Keys follow identify_white_space: <generalist|specialist>_<individual|team>
+        """
+        row, col = self.cell_index(*self._points(positioning), 2)
+        names = positioning[name_column].to_numpy()
+        quadrants = {}
+        for c, x_label in enumerate(["generalist", "specialist"]):
+            for r, y_label in enumerate(["individual", "team"]):
+                members = (row == r) & (col == c)
+                quadrants[f"{x_label}_{y_label}"] = {
+                    "competitor_count": int(members.sum()),
+                    "competitors": names[members].tolist(),
+                }
+        return quadrants
+
+    def largest_empty_rectangles(
+        self, positioning: pd.DataFrame, bins=20, top_k: int = 3
+    ) -> pd.DataFrame:
+        """
+        Largest axis-aligned rectangles of empty cells (non-overlapping)
+
+        Maximal-rectangle search over the occupancy grid: one histogram-stack
+        pass per row, O(cells).
+        """
+        empty = self.histogram(positioning, bins) == 0
+        x_edges, y_edges = self.edges(bins)
+        n_rows, n_cols = empty.shape
+
+        heights = np.zeros(n_cols, dtype=np.int64)
+        candidates = {}
+        for r in range(n_rows):
+            heights = np.where(empty[r], heights + 1, 0)
+            stack = []
+            for c in range(n_cols + 1):
+                h = heights[c] if c < n_cols else 0
+                start = c
+                while stack and stack[-1][1] >= h:
+                    start, height = stack.pop()
+                    if height:
+                        key = (r - height + 1, r, start, c - 1)
+                        candidates[key] = height * (c - start)
+                stack.append((start, h))
+
+        rows = []
+        taken = np.zeros_like(empty)
+        for (r0, r1, c0, c1), cells in sorted(
+            candidates.items(), key=lambda item: (-item[1], item[0])
+        ):
+            if len(rows) == top_k:
+                break
+            if taken[r0 : r1 + 1, c0 : c1 + 1].any():
+                continue
+            taken[r0 : r1 + 1, c0 : c1 + 1] = True
+            rows.append(
+                {
+                    "x_min": x_edges[c0],
+                    "x_max": x_edges[c1 + 1],
+                    "y_min": y_edges[r0],
+                    "y_max": y_edges[r1 + 1],
+                    "cells": cells,
+                    "area": (x_edges[c1 + 1] - x_edges[c0])
+                    * (y_edges[r1 + 1] - y_edges[r0]),
+                }
+            )
+        return pd.DataFrame(rows)
+
+    def clearance_grid(
+        self, positioning: pd.DataFrame, bins=100, include_bounds: bool = True
+    ) -> np.ndarray:
+        """
+        Approximate distance from each cell center to the nearest product
+
+        Separable Euclidean distance transform of the occupancy grid (products
+        snapped to cell centers), so cost is independent of product count.
+
+        Args:
+            include_bounds: Also cap by the distance to the plane's edge, so
+                circles stay inside the axes
+        """
+        counts = self.histogram(positioning, bins)
+        x_edges, y_edges = self.edges(bins)
+        n_rows, n_cols = counts.shape
+        dx, dy = np.diff(x_edges)[0], np.diff(y_edges)[0]
+
+        # Row pass: distance (in columns) to the nearest occupied cell
+        idx = np.broadcast_to(np.arange(n_cols, dtype=np.float64), counts.shape)
+        occupied = counts > 0
+        left = np.maximum.accumulate(np.where(occupied, idx, -np.inf), axis=1)
+        right = np.minimum.accumulate(np.where(occupied, idx, np.inf)[:, ::-1], axis=1)[
+            :, ::-1
+        ]
+        g = np.minimum(idx - left, right - idx) * dx
+
+        # Column pass: combine rows, one vectorized step per output row
+        row_offsets = np.arange(n_rows)[:, None] * dy
+        sq = g**2
+        dist = np.empty(counts.shape)
+        for r in range(n_rows):
+            dist[r] = np.sqrt(((row_offsets - r * dy) ** 2 + sq).min(axis=0))
+
+        if include_bounds:
+            centers_x = (x_edges[:-1] + x_edges[1:]) / 2
+            centers_y = (y_edges[:-1] + y_edges[1:]) / 2
+            bound = np.minimum.outer(
+                np.minimum(centers_y - self.y_range[0], self.y_range[1] - centers_y),
+                np.minimum(centers_x - self.x_range[0], self.x_range[1] - centers_x),
+            )
+            dist = np.minimum(dist, bound)
+        return dist
+
+    def rank_candidates(
+        self,
+        positioning: pd.DataFrame,
+        bins=100,
+        top_k: int = 5,
+        min_separation: float = 1.0,
+        neighbors: int = 3,
+        include_bounds: bool = True,
+    ) -> pd.DataFrame:
+        """
+        Candidate positions ranked by distance to the nearest competitors
+
+        Peaks of the clearance grid are picked greedily (each pick suppresses
+        cells within min_separation), then scored exactly against every
+        product. The first row is the center of the largest empty circle.
+
+        Args:
+            neighbors: Number of nearest products averaged in mean_distance
+        """
+        x, y = self._points(positioning)
+        names = positioning.get("name", positioning.index.to_series()).to_numpy()
+        dist = self.clearance_grid(positioning, bins, include_bounds)
+        x_edges, y_edges = self.edges(bins)
+        centers_x = (x_edges[:-1] + x_edges[1:]) / 2
+        centers_y = (y_edges[:-1] + y_edges[1:]) / 2
+        grid_x, grid_y = np.meshgrid(centers_x, centers_y)
+
+        score = dist.copy()
+        picks = []
+        for _ in range(top_k):
+            r, c = np.unravel_index(np.argmax(score), score.shape)
+            if not np.isfinite(score[r, c]):
+                break
+            picks.append((grid_x[r, c], grid_y[r, c]))
+            near = np.hypot(grid_x - grid_x[r, c], grid_y - grid_y[r, c])
+            score[near < min_separation] = -np.inf
+        if not picks:
+            return pd.DataFrame()
+
+        cand = np.array(picks)
+        pair = np.hypot(cand[:, :1] - x[None, :], cand[:, 1:] - y[None, :])
+        k = min(neighbors, len(x))
+        nearest_k = np.sort(np.partition(pair, k - 1, axis=1)[:, :k], axis=1)
+        nearest = pair.argmin(axis=1)
+
+        clearance = nearest_k[:, 0]
+        if include_bounds:
+            clearance = np.minimum(
+                clearance,
+                np.minimum.reduce(
+                    [
+                        cand[:, 0] - self.x_range[0],
+                        self.x_range[1] - cand[:, 0],
+                        cand[:, 1] - self.y_range[0],
+                        self.y_range[1] - cand[:, 1],
+                    ]
+                ),
+            )
+
+        ranked = pd.DataFrame(
+            {
+                "x": cand[:, 0],
+                "y": cand[:, 1],
+                "clearance": clearance,
+                "nearest_distance": nearest_k[:, 0],
+                "nearest_competitor": names[nearest],
+                "mean_distance": nearest_k.mean(axis=1),
+            }
+        )
+        return ranked.sort_values(
+            ["clearance", "mean_distance"], ascending=False, kind="stable"
+        ).reset_index(drop=True)
+
+    def largest_empty_circle(
+        self, positioning: pd.DataFrame, bins=100, include_bounds: bool = True
+    ) -> Dict:
+        """
+        Center and radius of the largest circle containing no product
+        (center located at cell-center resolution, radius exact)
+        """
+        best = self.rank_candidates(
+            positioning, bins, top_k=1, include_bounds=include_bounds
+        )
+        if best.empty:
+            return {}
+        row = best.iloc[0]
+        return {"x": row["x"], "y": row["y"], "radius": row["clearance"]}
+
+    def analyze(
+        self, positioning: pd.DataFrame, resolution: int = 20, top_k: int = 3
+    ) -> Dict:
+        """
+        Grid density, empty rectangles, largest circle and ranked candidates
+        """
+        return {
+            "resolution": resolution,
+            "density": self.histogram(positioning, resolution),
+            "empty_rectangles": self.largest_empty_rectangles(
+                positioning, resolution, top_k
+            ),
+            "largest_empty_circle": self.largest_empty_circle(
+                positioning, max(resolution, 100)
+            ),
+            "candidates": self.rank_candidates(
+                positioning, max(resolution, 100), top_k
+            ),
+        }
+
+
+if __name__ == "__main__":
+    print("=" * 80)
+    print(" WHITE SPACE ENGINE")
+    print("=" * 80)
+    print()
+
+    rng = np.random.default_rng(42)
+    products = pd.DataFrame(
+        {
+            "name": [f"product_{i}" for i in range(100_000)],
+            "x_specialization": np.clip(rng.normal(3.5, 1.8, 100_000), 0, 10),
+            "y_user_type": np.clip(rng.normal(3.0, 2.0, 100_000), 0, 10),
+        }
+    )
+
+    engine = WhiteSpaceEngine()
+    result = engine.analyze(products, resolution=40)
+    print(result["empty_rectangles"].to_string())
+    print()
+    print(result["candidates"].to_string())
@@ -0,0 +1,31 @@
+import pytest
+import numpy as np
+import pandas as pd
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from billing_plans import BillingPlanModeler
+
+@pytest.fixture
+def modeler():
+    return BillingPlanModeler()
+
+def test_monthly_plan_has_no_deferred_revenue(modeler):
+    """Monthly billing collects cash as it is earned"""
+    configs = pd.DataFrame({'annual_discount': [0.2], 'mix_monthly': [1.0], 'mix_annual': [0.0], 'mix_promo': [0.0]})
+    sim = modeler.simulate(np.full(12, 100), configs)
+
+    assert np.allclose(sim['deferred_revenue'], 0)
+    assert np.allclose(sim['cash'], sim['revenue'])
+
+def test_annual_prepay_defers_revenue(modeler):
+    """Annual prepay collects a year up front and releases it monthly"""
+    grid = modeler.plan_grid(annual_discounts=[0.2], annual_shares=[0.0, 1.0])
+    sim = modeler.simulate([100], grid, months=12)
+
+    assert sim['cash'][1, 0] == pytest.approx(100 * 144)
+    assert sim['deferred_revenue'][1, -1] == pytest.approx(0)
+    assert sim['deferred_revenue'][1, 0] == pytest.approx(100 * 144 * 11 / 12)
@@ -0,0 +1,41 @@
+import pytest
+import numpy as np
+import pandas as pd
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from clustering import MiniBatchKMeans, StrategicGroups, silhouette_score
+
+@pytest.fixture
+def blobs():
+    rng = np.random.default_rng(5)
+    centers = np.array([[0, 0, 0], [6, 0, 0], [0, 6, 6]], dtype=float)
+    labels = rng.integers(0, 3, 3000)
+    return centers, centers[labels] + rng.normal(0, 0.5, (3000, 3)), labels
+
+def test_streamed_centers_recover_blobs(blobs):
+    """A single streamed pass in small batches finds the true centers"""
+    centers, x, _ = blobs
+    model = MiniBatchKMeans(3, batch_size=256).fit_stream(np.array_split(x, 6))
+
+    found = model.centers[np.argsort(model.centers.sum(axis=1))]
+    expected = centers[np.argsort(centers.sum(axis=1))]
+    assert np.allclose(found, expected, atol=0.2)
+
+def test_silhouette_selects_k_and_tracks_drift(blobs):
+    """Silhouette picks three groups; shifted data moves the centroids"""
+    _, x, labels = blobs
+    vectors = pd.DataFrame(x, columns=['a', 'b', 'c'])
+    groups = StrategicGroups(k_range=(2, 3, 4, 5))
+    assigned = groups.fit(vectors)
+
+    assert groups.model.n_clusters == 3
+    assert assigned['group'].nunique() == 3
+    assert silhouette_score(x, labels) > 0.7
+
+    groups.track('2025-Q1')
+    groups.track('2025-Q2', vectors + 1.0)
+    assert (groups.centroid_drift()['shift'] > 0).all()
@@ -0,0 +1,58 @@
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from competitive_analyzer import CompetitiveAnalyzer
+from data_collector import CompetitiveDataCollector
+
+@pytest.fixture
+def analyzer():
+    collector = CompetitiveDataCollector()
+    competitors_df = collector.generate_competitive_overview()
+    features = collector.generate_feature_matrix()
+    return CompetitiveAnalyzer(competitors_df, features)
+
+def test_summary_reuses_memoized_artifacts(analyzer):
+    """Artifacts computed once are returned as-is by later calls"""
+    white_space = analyzer.identify_white_space()
+    gaps = analyzer.calculate_feature_gaps()
+    analyzer.generate_competitive_summary()
+
+    assert analyzer.identify_white_space() is white_space
+    assert analyzer.calculate_feature_gaps() is gaps
+    assert analyzer.memo_status()['valid'].all()
+
+def test_input_change_invalidates_dependents(analyzer):
+    """Editing scores in place or replacing positioning triggers recomputation"""
+    gaps = analyzer.calculate_feature_gaps()
+    white_space = analyzer.identify_white_space()
+
+    analyzer.features_matrix.loc[0, 'score'] -= 1
+    assert analyzer.calculate_feature_gaps() is not gaps
+
+    white_space = analyzer.identify_white_space()
+    positioning = analyzer.positioning_data.copy()
+    positioning['x_specialization'] = 9.0
+    analyzer.positioning_data = positioning
+
+    moved = analyzer.identify_white_space()
+    assert moved is not white_space
+    assert moved['competitive_density']['specialist'] == len(positioning)
+
+def test_inputs_hashed_once_per_call(analyzer, monkeypatch):
+    """A warm summary call fingerprints each input once, not per memo check"""
+    import competitive_analyzer
+
+    analyzer.generate_competitive_summary()
+    calls = []
+    fingerprint = competitive_analyzer.input_fingerprint
+    monkeypatch.setattr(
+        competitive_analyzer, 'input_fingerprint',
+        lambda data: calls.append(data) or fingerprint(data),
+    )
+
+    analyzer.generate_competitive_summary()
+    assert len(calls) == 2
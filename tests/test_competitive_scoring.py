@@ -0,0 +1,31 @@
+import pytest
+import numpy as np
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from competitive_scoring import CompetitiveScorer
+from feature_matrix import FeatureMatrix
+
+@pytest.fixture
+def scorer():
+    values = np.array([[9, 2], [5, 5], [2, 9]], dtype=np.float32)
+    return CompetitiveScorer(FeatureMatrix(values, ['a', 'b', 'c'], ['synthesis', 'collaboration']))
+
+def test_batched_ranks_follow_weights(scorer):
+    """Each weighting is ranked independently; ties share the better rank"""
+    ranks = scorer.rank([{'synthesis': 3}, {'collaboration': 3}, {}])
+
+    assert ranks.iloc[0].tolist() == [1, 2, 3]
+    assert ranks.iloc[1].tolist() == [3, 2, 1]
+    assert ranks.iloc[2].tolist() == [1, 3, 1]
+
+def test_rank_stability_shares(scorer):
+    """Stability table covers every competitor and shares are probabilities"""
+    stability = scorer.rank_stability(scorer.sample_weights(500, seed=1))
+
+    assert set(stability['competitor_id']) == {'a', 'b', 'c'}
+    assert stability['p_first'].sum() >= 1
+    assert (stability['best_rank'] <= stability['worst_rank']).all()
@@ -0,0 +1,122 @@
+import pytest
+import numpy as np
+import pandas as pd
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from config import COMPETITORS
+from data_collector import CompetitiveDataCollector
+
+@pytest.fixture
+def collector():
+    return CompetitiveDataCollector()
+
+def test_traffic_schema_and_growth(collector):
+    """One row per competitor-month; visits compound monthly from users x 10"""
+    traffic = collector.generate_traffic_estimates()
+
+    assert list(traffic.columns) == [
+        'competitor_id', 'competitor_name', 'month', 'estimated_visits',
+        'bounce_rate', 'pages_per_visit', 'avg_visit_duration_sec',
+    ]
+    assert len(traffic) == 12 * len(COMPETITORS)
+    notion = traffic[traffic['competitor_id'] == 'notion_ai']
+    assert notion['estimated_visits'].iloc[0] == COMPETITORS['notion_ai']['users_estimate'] * 10
+    assert notion['month'].iloc[-1] == pd.Timestamp('2025-12-01')
+    assert traffic['bounce_rate'].between(0.35, 0.55).all()
+
+def test_reviews_scale_with_synthetic_competitors(collector):
+    """Extra competitors are variants of the real ones; sentiment follows rating"""
+    reviews = collector.generate_user_reviews(reviews_per_competitor=50, n_competitors=len(COMPETITORS) + 2)
+
+    assert len(reviews) == 50 * (len(COMPETITORS) + 2)
+    assert reviews['competitor_id'].nunique() == len(COMPETITORS) + 2
+    assert reviews['competitor_id'].iloc[-1].endswith('_1')
+    assert (reviews['rating'] * 2 % 1 == 0).all()
+    assert (reviews.loc[reviews['rating'] >= 4.5, 'sentiment'] == 'positive').all()
+    assert (reviews.loc[reviews['rating'] < 3.5, 'sentiment'] == 'negative').all()
+
+def test_streams_do_not_depend_on_call_order_or_roster():
+    """Each generator x competitor stream is fixed by the seed alone"""
+    first = CompetitiveDataCollector(seed=7)
+    reviews = first.generate_user_reviews()
+    traffic = first.generate_traffic_estimates()
+
+    second = CompetitiveDataCollector(seed=7)
+    more_traffic = second.generate_traffic_estimates(n_competitors=len(COMPETITORS) + 3)
+    more_reviews = second.generate_user_reviews(n_competitors=len(COMPETITORS) + 3)
+
+    pd.testing.assert_frame_equal(traffic, more_traffic.iloc[:len(traffic)])
+    columns = ['competitor_id', 'rating', 'review_text', 'verified_purchase', 'helpful_count']
+    pd.testing.assert_frame_equal(reviews[columns], more_reviews[columns].iloc[:len(reviews)])
+    assert not CompetitiveDataCollector(seed=8).generate_traffic_estimates().equals(traffic)
+
+def test_distinct_competitors_get_distinct_streams(collector):
+    """Roster ids never share draws, including ids whose old narrow keys collided"""
+    columns = ['rating', 'review_text', 'verified_purchase', 'helpful_count']
+    n_competitors = len(COMPETITORS) * 2_000
+    reviews = collector.generate_user_reviews(reviews_per_competitor=20, n_competitors=n_competitors)
+    per_competitor = np.hstack([
+        reviews['rating'].to_numpy().reshape(n_competitors, 20),
+        reviews['helpful_count'].to_numpy().reshape(n_competitors, 20),
+    ])
+    assert len(np.unique(per_competitor, axis=0)) == n_competitors
+
+    roster = collector._competitor_roster(len(COMPETITORS) * 40_000).set_index('competitor_id', drop=False)
+    pair = collector._reviews_frame(roster.loc[['notion_ai_6712', 'napkin_ai_37032']], 20, np.datetime64('2025-01-01'))
+    first, second = (frame[columns].to_numpy() for _, frame in pair.groupby('competitor_id'))
+    assert not np.array_equal(first, second)
+
+def test_draws_follow_competitor_id_not_roster_order(collector, monkeypatch):
+    """Reordering COMPETITORS leaves every competitor's data unchanged"""
+    import data_collector
+
+    before = collector.generate_traffic_estimates(n_competitors=len(COMPETITORS) * 3)
+    monkeypatch.setattr(data_collector, 'COMPETITORS', dict(reversed(list(COMPETITORS.items()))))
+    after = CompetitiveDataCollector().generate_traffic_estimates(n_competitors=len(COMPETITORS) * 3)
+
+    key = ['competitor_id', 'month']
+    pd.testing.assert_frame_equal(
+        before.sort_values(key).reset_index(drop=True),
+        after.sort_values(key).reset_index(drop=True),
+    )
+
+def test_reviews_generate_at_scale(collector):
+    """The scale parameter yields one block of reviews per competitor"""
+    reviews = collector.generate_user_reviews(reviews_per_competitor=20, n_competitors=50_000)
+
+    assert len(reviews) == 1_000_000
+    assert reviews['competitor_id'].nunique() == 50_000
+    assert (reviews['competitor_id'].value_counts() == 20).all()
+
+def test_batches_draw_only_the_values_they_need(collector, monkeypatch):
+    """Each batch draws its own rows plus at most one partial stream block per base competitor"""
+    from data_collector import STREAM_VALUES
+
+    drawn = [0]
+    make_rng = collector.rng
+
+    class CountingRng:
+        def __init__(self, rng):
+            self.rng = rng
+
+        def __getattr__(self, name):
+            method = getattr(self.rng, name)
+
+            def counted(*args):
+                drawn[0] += int(np.prod(args[-1]))
+                return method(*args)
+            return counted
+
+    monkeypatch.setattr(collector, 'rng', lambda generator, key: CountingRng(make_rng(generator, key)))
+
+    n_columns = 5
+    batches = 0
+    for batch in collector.iter_review_batches(200, n_competitors=1_000, batch_rows=40_000):
+        assert drawn[0] <= n_columns * (len(batch) + len(COMPETITORS) * STREAM_VALUES)
+        drawn[0] = 0
+        batches += 1
+    assert batches == 5
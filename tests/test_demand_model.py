@@ -0,0 +1,49 @@
+import pytest
+import numpy as np
+import pandas as pd
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from demand_model import DemandCurveModel
+
+@pytest.fixture
+def model():
+    return DemandCurveModel()
+
+def test_optimize_respects_margin_floor(model):
+    """Optimal prices never violate the gross margin constraint"""
+    result = model.optimize(min_gross_margin=0.70)
+
+    assert len(result) == len(model.segments) * len(model.tiers)
+    assert (result['gross_margin'] >= 0.70).all()
+    assert result['feasible'].all()
+
+def test_fit_from_survey_recovers_elasticity(model):
+    """Log-linear survey fit recovers the generating elasticity"""
+    prices = np.linspace(8, 25, 18)
+    take_rates = 0.08 * np.exp(-1.5 * (prices / 15 - 1))
+    survey = pd.DataFrame({
+        'segment': 'academics', 'tier': 'pro', 'price': prices, 'take_rate': take_rates
+    })
+
+    fitted = model.fit_from_survey(survey)
+
+    assert fitted['elasticity'].iloc[0] == pytest.approx(1.5)
+    assert model.reference_conversion[0, 0] == pytest.approx(0.08)
+
+def test_infeasible_constraints_leave_no_price(model):
+    """With an unreachable margin floor, no grid point is reported as optimal"""
+    for result in (model.optimize(min_gross_margin=1.5), model.optimize_uniform(min_gross_margin=1.5)):
+        assert not result['feasible'].any()
+        assert result[['optimal_price', 'paying_users', 'revenue', 'gross_margin', 'ltv_cac']].isna().all().all()
+
+    from pricing_strategy import PricingStrategy
+
+    strategy = PricingStrategy()
+    strategy.optimize_price_points(min_gross_margin=1.5)
+    report = strategy.generate_pricing_recommendation()
+    assert 'no feasible price' in report
+    assert '$5.00/month' not in report
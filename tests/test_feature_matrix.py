@@ -0,0 +1,53 @@
+import pytest
+import pandas as pd
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from feature_matrix import FeatureMatrix
+from data_collector import CompetitiveDataCollector
+
+@pytest.fixture
+def features():
+    return CompetitiveDataCollector().generate_feature_matrix()
+
+def test_pivot_matches_pandas(features):
+    """Dense store reproduces DataFrame.pivot exactly, including int dtype"""
+    store = FeatureMatrix.from_long(features)
+    expected = features.pivot(index='feature', columns='competitor_id', values='score')
+
+    pd.testing.assert_frame_equal(store.pivot(), expected)
+    assert store.score('our_product', 'Citation Management') == 10
+
+def test_npz_round_trip(features, tmp_path):
+    """Saved matrices load back with labels and source dtype intact"""
+    store = FeatureMatrix.from_long(features)
+    loaded = FeatureMatrix.load(store.save(tmp_path / 'features.npz'))
+
+    assert loaded.competitors == store.competitors
+    assert loaded.source_dtype == store.source_dtype
+    assert (loaded.row('notion_ai') == store.row('notion_ai')).all()
+
+def test_invalidate_refreshes_pivot(features):
+    """In-place edits show up in the pivot once the store is invalidated"""
+    store = FeatureMatrix.from_long(features)
+    store.pivot()
+    store.values[store.competitor_index['our_product'], 0] = 0
+
+    store.invalidate()
+    assert store.pivot().loc[store.features[0], 'our_product'] == 0
+
+def test_load_or_build_prefers_saved_store(features, tmp_path):
+    """The saved .npz is used when present; the long CSV is the fallback"""
+    store = FeatureMatrix.from_long(features)
+    features.to_csv(tmp_path / 'features.csv', index=False)
+
+    built = FeatureMatrix.load_or_build(tmp_path / 'features.npz', tmp_path / 'features.csv')
+    pd.testing.assert_frame_equal(built.pivot(), store.pivot())
+
+    store.values[0, 0] = 0
+    store.save(tmp_path / 'features.npz')
+    loaded = FeatureMatrix.load_or_build(tmp_path / 'features.npz', tmp_path / 'features.csv')
+    assert loaded.values[0, 0] == 0
@@ -36,4 +36,20 @@ def test_break_even_calculation(model):
     assert isinstance(breakeven, dict)
     # FIX: Check for keys that actually exist in your return dictionary
     assert 'month' in breakeven
-    assert 'mrr_at_breakeven' in breakeven
\ No newline at end of file
+    assert 'mrr_at_breakeven' in breakeven
+def test_billing_report_shows_best_mix(model):
+    """With several mixes, the report and monthly view follow the one collecting the most cash"""
+    configs = pd.DataFrame({
+        'annual_discount': [0.20, 0.20],
+        'mix_monthly': [1.0, 0.0],
+        'mix_annual': [0.0, 1.0],
+        'mix_promo': [0.0, 0.0],
+    })
+    comparison = model.project_billing_cash_flow(configs)
+    best = comparison['total_cash'].idxmax()
+
+    assert model.billing_projection['best'] == best
+    assert model.billing_projection['monthly']['cash_receipts'].sum() == pytest.approx(comparison.loc[best, 'total_cash'])
+    report = model.generate_financial_report()
+    assert 'Best of 2 plan mixes' in report
+    assert f"Cash Collected: ${comparison.loc[best, 'total_cash']:,.0f}" in report
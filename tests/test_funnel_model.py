@@ -0,0 +1,51 @@
+import pytest
+import numpy as np
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from funnel_model import FunnelEvaluator
+from gtm_planner import GTMPlanner
+
+@pytest.fixture
+def evaluator():
+    return FunnelEvaluator()
+
+def test_integer_exact_matches_sequential_truncation(evaluator):
+    """Integer-exact mode reproduces the sequential int() funnel"""
+    rates = [0.05, 0.20, 0.40, 0.10]
+    potential = np.array([3_120_000, 1_234_567, 999])
+    result = evaluator.evaluate(potential, rates, integer_exact=True)
+
+    for row, start in zip(result['counts'], potential):
+        expected = [int(start)]
+        for rate in rates:
+            expected.append(int(expected[-1] * rate))
+        assert row.tolist() == expected
+
+def test_batch_shapes(evaluator):
+    """Thousands of funnels evaluate in one call"""
+    rates = np.random.default_rng(0).uniform(0.01, 0.5, size=(5000, 4))
+    result = evaluator.evaluate(1_000_000, rates)
+
+    assert result['counts'].shape == (5000, 5)
+    assert np.allclose(result['conversions'], rates)
+
+def test_reconcile_with_channels(evaluator):
+    """Back-solved reach reproduces each channel's expected sign-ups"""
+    channels = GTMPlanner().define_channel_strategy()
+    frame = evaluator.reconcile_with_channels(channels, [0.05, 0.20, 0.40, 0.10])
+
+    assert len(frame) == len(channels['channels'])
+    assert np.allclose(frame['signups'], frame['expected_users'])
+
+def test_reconcile_with_custom_stage_names():
+    """Cost columns follow the evaluator's own stage names"""
+    evaluator = FunnelEvaluator(['reached', 'trial', 'engaged', 'paid'])
+    channels = GTMPlanner().define_channel_strategy()
+    frame = evaluator.reconcile_with_channels(channels, [0.05, 0.20, 0.40, 0.10])
+
+    assert np.allclose(frame['trial'], frame['expected_users'])
+    assert {'cost_per_engaged', 'cost_per_paid'} <= set(frame.columns)
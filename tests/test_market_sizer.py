@@ -1,4 +1,5 @@
 import pytest
+import pandas as pd
 import sys
 from pathlib import Path
 
@@ -32,4 +33,89 @@ def test_som_calculation(sizer):
     assert 'final' in som
     assert som['final'] > 0
     # FIX: Compare against 'final' key in TAM data
-    assert som['final'] < sizer.tam_data['final']
\ No newline at end of file
+    assert som['final'] < sizer.tam_data['final']
+
+def test_reconcile_estimates(sizer):
+    """Reconciled estimates land between the competing figures"""
+    reconciliation = sizer.reconcile_estimates()
+
+    tam = reconciliation['tam']
+    assert tam['bottomup_total'] < tam['reconciled_total'] < tam['topdown_total']
+
+    som = reconciliation['som']
+    assert som['funnel_estimate'] < som['reconciled_som'] < som['alternative_estimate']
+    # Funnel rates are probabilities and must stay capped at 100%
+    rates = {k: v for k, v in som['assumptions'].items() if k != 'potential_users'}
+    assert max(rates.values()) <= 1.0 + 1e-9
+
+
+def test_posterior_updates_refresh_som(sizer):
+    """Observed launch data moves the posterior SOM incrementally"""
+    sizer.initialize_posteriors()
+    prior_som = sizer.posterior_estimates['som']
+    assert abs(prior_som - sizer.calculate_som()['final']) < 1
+
+    for _ in range(4):
+        sizer.observe_week(signups=500, activated=300)
+
+    assert sizer.posteriors['activation_rate'].mean > 0.40
+    assert sizer.posterior_estimates['som'] > prior_som
+
+
+def test_signups_alone_move_som(sizer):
+    """A sign-ups-only week moves SOM with the observed volume"""
+    sizer.initialize_posteriors()
+    prior_som = sizer.posterior_estimates['som']
+    weekly = sizer.posterior_estimates['weekly_signups']
+
+    sizer.observe_week(signups=int(weekly * 3))
+    high_som = sizer.posterior_estimates['som']
+    assert high_som > prior_som
+
+    for _ in range(4):
+        sizer.observe_week(signups=0)
+    assert sizer.posterior_estimates['som'] < prior_som
+
+
+def test_awareness_moves_signup_prior(sizer):
+    """Top-of-funnel penetration data moves the expected sign-ups and SOM"""
+    sizer.initialize_posteriors()
+    prior_som = sizer.posterior_estimates['som']
+    prior_weekly = sizer.posterior_estimates['weekly_signups']
+
+    sizer.observe_penetration('awareness_rate', successes=300, trials=1000)
+    assert sizer.posterior_estimates['weekly_signups'] > prior_weekly
+    assert sizer.posterior_estimates['som'] > prior_som
+
+
+def test_paying_without_activated_raises(sizer):
+    """Conversion needs the activated users it is measured against"""
+    sizer.initialize_posteriors()
+    with pytest.raises(ValueError):
+        sizer.observe_week(signups=500, paying=20)
+
+
+def test_reconciliation_moves_uncertain_assumptions_most(sizer):
+    """Variance weights rank movements instead of tying every assumption"""
+    reconciliation = sizer.reconcile_estimates()
+
+    for key in ('tam', 'som'):
+        moves = reconciliation[key]['movements']['abs_pct_change']
+        assert moves.nunique() == len(moves)
+
+    tam_moves = reconciliation['tam']['movements']
+    assert tam_moves.iloc[0]['assumption'] == 'other_knowledge_workers'
+    assert tam_moves.iloc[-1]['assumption'] == 'academics'
+    assert reconciliation['som']['movements'].iloc[-1]['assumption'] == 'potential_users'
+
+
+def test_invalid_week_leaves_posteriors_untouched(sizer):
+    """A week that fails validation changes no posterior"""
+    sizer.initialize_posteriors()
+    before = sizer.posterior_summary()
+
+    for week in (dict(activated=150), dict(activated=50, paying=60), dict(aware=80)):
+        with pytest.raises(ValueError):
+            sizer.observe_week(100, **week)
+
+    pd.testing.assert_frame_equal(sizer.posterior_summary(), before)
@@ -0,0 +1,42 @@
+import pytest
+import numpy as np
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from positioning_engine import PositioningEngine
+from data_collector import CompetitiveDataCollector
+from config import POSITIONING_ANCHORS
+
+@pytest.fixture
+def engine_inputs():
+    collector = CompetitiveDataCollector()
+    competitors_df = collector.generate_competitive_overview()
+    collector.generate_feature_matrix()
+    engine = PositioningEngine()
+    inputs = engine.build_inputs(collector.feature_store, competitors_df)
+    return engine.fit(inputs), inputs
+
+def test_projection_reproduces_anchors(engine_inputs):
+    """Fitted projection lands anchored products near their analyst coordinates"""
+    engine, inputs = engine_inputs
+    coords = engine.project(inputs)
+
+    for comp_id, anchor in POSITIONING_ANCHORS.items():
+        assert coords.loc[comp_id, 'x_specialization'] == pytest.approx(anchor['x'], abs=0.5)
+        assert coords.loc[comp_id, 'y_user_type'] == pytest.approx(anchor['y'], abs=0.5)
+    assert engine.fit_report['loo_rmse'] < 1.0
+
+def test_add_projects_without_refit(engine_inputs):
+    """New products are placed with the fixed basis, inside the axes"""
+    engine, inputs = engine_inputs
+    basis = engine.basis.copy()
+
+    row = inputs.loc['our_product'].to_dict()
+    added = engine.add('new_tool', row)
+
+    assert np.array_equal(engine.basis, basis)
+    assert added['x_specialization'] == pytest.approx(engine.project(inputs).loc['our_product', 'x_specialization'])
+    assert 0 <= added['y_user_type'] <= 10
@@ -0,0 +1,60 @@
+import pytest
+import numpy as np
+import pandas as pd
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from positioning_robustness import PositioningRobustness
+from white_space import WhiteSpaceEngine
+
+@pytest.fixture
+def positioning():
+    return pd.DataFrame({
+        'competitor_id': ['a', 'b', 'c', 'd', 'our_product'],
+        'name': ['A', 'B', 'C', 'D', 'Ours'],
+        'x_specialization': [1.0, 2.0, 3.0, 8.0, 7.0],
+        'y_user_type': [1.0, 2.0, 7.0, 8.0, 2.0],
+    })
+
+def test_cell_counts_match_white_space_grid():
+    """Vectorized per-draw counts agree with the white-space histogram"""
+    rng = np.random.default_rng(0)
+    coords = np.round(rng.uniform(0, 10, (3, 200, 2)) * 2) / 2
+    counts = PositioningRobustness.cell_counts(coords, bins=4)
+
+    for draw in range(3):
+        frame = pd.DataFrame({'x_specialization': coords[draw, :, 0], 'y_user_type': coords[draw, :, 1]})
+        expected = WhiteSpaceEngine().histogram(frame, 4).ravel()
+        assert (counts[draw] == expected).all()
+
+def test_simulation_without_noise_is_deterministic(positioning):
+    """Zero noise reproduces the base counts; our product never crowds its own quadrant"""
+    result = PositioningRobustness(positioning).simulate(
+        n_draws=50, coord_noise=0.0, feature_noise=0.0, recommended='specialist_individual'
+    )
+    quadrants = result['quadrants'].set_index('quadrant')
+
+    assert quadrants['base_count'].tolist() == [2, 0, 1, 1]
+    assert result['p_recommended_strictly_least'] == 1.0
+    assert result['p_ours_in_recommended'] == 1.0
+
+def test_noise_spreads_counts(positioning):
+    """With noise, probabilities are proper and the draws are reproducible"""
+    robustness = PositioningRobustness(positioning)
+    first = robustness.simulate(n_draws=2000, coord_noise=2.0, feature_noise=0.0, seed=1)
+    second = robustness.simulate(n_draws=2000, coord_noise=2.0, feature_noise=0.0, seed=1)
+
+    assert 0.0 < first['p_recommended_least'] < 1.0
+    assert first['p_recommended_least'] == second['p_recommended_least']
+    assert (first['quadrants']['p_least_crowded'] >= first['quadrants']['p_strictly_least']).all()
+
+def test_clipped_draws_stay_on_plane(positioning):
+    """Large noise pins points to the edges but never off the grid"""
+    robustness = PositioningRobustness(positioning)
+    coords = robustness.draw_coordinates(500, coord_noise=20.0, feature_noise=0.0, rng=np.random.default_rng(0))
+
+    assert coords.max() < 10.0
+    assert (PositioningRobustness.cells(coords) >= 0).all()
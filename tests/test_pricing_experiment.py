@@ -0,0 +1,34 @@
+import pytest
+import numpy as np
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from pricing_experiment import PricingExperimentSimulator, channel_weekly_traffic
+from gtm_planner import GTMPlanner
+
+def test_channel_traffic_covers_expected_users():
+    """Weekly traffic spreads every channel's expected users over the plan"""
+    strategy = GTMPlanner().define_channel_strategy()
+    traffic = channel_weekly_traffic(strategy)
+
+    assert len(traffic) == 12
+    assert traffic.sum() == pytest.approx(strategy['summary']['total_expected_users'])
+
+def test_clear_winner_found_quickly():
+    """With a large true gap and ample traffic, tests stop early and correctly"""
+    simulator = PricingExperimentSimulator([10, 20], true_conversion=[0.05, 0.10])
+    summary = simulator.simulate([4000] * 6, n_experiments=200, rate_uncertainty=0)
+
+    assert summary['error_rate'] == 0
+    assert summary['stopped_early_rate'] == 1
+    assert summary['mean_periods_to_decision'] == 2
+
+@pytest.mark.parametrize('traffic', [[], [1, 0, 1], [100, -5]])
+def test_unusable_traffic_raises(traffic):
+    """No decision is reported when the arms never receive visitors"""
+    simulator = PricingExperimentSimulator([10, 20], true_conversion=[0.05, 0.10])
+    with pytest.raises(ValueError):
+        simulator.simulate(traffic, n_experiments=10)
@@ -0,0 +1,53 @@
+import pytest
+import numpy as np
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from pricing_research import PricingResearch
+
+@pytest.fixture
+def research():
+    return PricingResearch(chunksize=10_000)
+
+def test_van_westendorp_chunked_matches_single_pass(research, tmp_path):
+    """Streaming a CSV in chunks gives the same curves as one DataFrame"""
+    survey = research.simulate_van_westendorp(25_000)
+    survey.to_csv(tmp_path / 'vw.csv', index=False)
+
+    streamed = research.van_westendorp(tmp_path / 'vw.csv')['all']
+    in_memory = PricingResearch(chunksize=10**9).van_westendorp(survey)['all']
+
+    assert streamed['respondents'] == 25_000
+    assert streamed['points'] == pytest.approx(in_memory['points'])
+    points = streamed['points']
+    assert points['pmc'] < points['opp'] < points['pme']
+
+def test_conjoint_recovers_coefficients(research):
+    """MNL fit recovers the price coefficient used to simulate choices"""
+    truth = {feature: 0.5 for feature in research.tier_features()}
+    truth.update({'price': -0.1, 'none': 1.0})
+    tasks = research.simulate_choice_tasks(20_000, truth)
+    attributes = [c for c in tasks.columns if c not in ('task_id', 'chosen')]
+
+    result = research.fit_conjoint(research.load_choice_data(tasks, attributes))
+
+    assert result['coefficients']['price'] == pytest.approx(-0.1, rel=0.1)
+    assert result['willingness_to_pay'].mean() == pytest.approx(5.0, rel=0.15)
+
+def test_conjoint_keeps_beta_when_no_step_improves(research, monkeypatch):
+    """A failed line search stops at the last accepted point and reports non-convergence"""
+    truth = {feature: 0.5 for feature in research.tier_features()}
+    truth.update({'price': -0.1, 'none': 1.0})
+    tasks = research.simulate_choice_tasks(2_000, truth)
+    attributes = [c for c in tasks.columns if c not in ('task_id', 'chosen')]
+    choice_data = research.load_choice_data(tasks, attributes)
+
+    monkeypatch.setattr(research, 'log_likelihood', lambda beta, data: 0.0 if not beta.any() else -np.inf)
+    result = research.fit_conjoint(choice_data)
+
+    assert not result['converged']
+    assert (result['coefficients'] == 0).all()
+    assert result['log_likelihood'] == 0.0
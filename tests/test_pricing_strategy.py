@@ -0,0 +1,53 @@
+import pytest
+import numpy as np
+import pandas as pd
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from pricing_strategy import PricingStrategy
+
+@pytest.fixture
+def strategy():
+    return PricingStrategy()
+
+def test_validate_unit_economics_honors_overrides(strategy):
+    """Cost and retention overrides flow into every derived metric"""
+    result = strategy.validate_unit_economics({'api_cost': 2.0, 'retention': 0.90, 'dev_cost': 10000})
+
+    assert result['costs']['cogs']['total_per_user'] == pytest.approx(2.50)
+    assert result['costs']['operating_costs']['total_monthly'] == 55000
+    assert result['customer_economics']['avg_lifetime_months'] == pytest.approx(10)
+    assert result['customer_economics']['ltv'] == pytest.approx(15 * 10 * (1 - 2.5 / 15))
+
+def test_batch_matches_single_validation(strategy):
+    """Each batch row equals the single-assumption validation"""
+    rows = pd.DataFrame({'api_cost': [3.5, 2.0, np.nan], 'retention': [0.95, 0.90, 0.97], 'cac': [35, 50, 20]})
+    batch = strategy.validate_unit_economics_batch(rows)
+
+    for idx, row in rows.iterrows():
+        single = strategy.validate_unit_economics(row.dropna().to_dict())
+        assert batch.loc[idx, 'ltv_cac_ratio'] == pytest.approx(single['cac_analysis']['ltv_cac_ratio'])
+        assert batch.loc[idx, 'users_needed_for_breakeven'] == single['breakeven']['users_needed_for_breakeven']
+
+def test_negative_margin_has_no_breakeven(strategy, monkeypatch):
+    """Unit cost above price: break-even is None and the report says so"""
+    result = strategy.validate_unit_economics({'api_cost': 20})
+    assert result['breakeven']['users_needed_for_breakeven'] is None
+    assert result['costs']['gross_margin'] < 0
+
+    defaults = strategy._unit_economics_defaults()
+    monkeypatch.setattr(strategy, '_unit_economics_defaults', lambda: {**defaults, 'api_cost': 20})
+    assert 'Paying Users Needed: not reachable' in strategy.generate_pricing_recommendation()
+
+def test_india_offer_matches_regional_engine(strategy):
+    """The India recommendation quotes the engine's localized price"""
+    from regional_pricing import RegionalPricingEngine
+
+    india = RegionalPricingEngine().lookup('IN', 'pro')
+    report = strategy.generate_pricing_recommendation()
+
+    assert f"{india['currency']} {india['local_price']:,.0f}/month" in report
+    assert '₹499' not in report
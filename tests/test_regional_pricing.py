@@ -0,0 +1,33 @@
+import pytest
+import numpy as np
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from regional_pricing import RegionalPricingEngine
+
+@pytest.fixture
+def engine():
+    engine = RegionalPricingEngine()
+    engine.build()
+    return engine
+
+def test_base_country_keeps_list_price(engine):
+    """US prices match PRICING_TIERS and every country x tier is priced"""
+    us = engine.lookup('us', 'pro')
+
+    assert us['local_price'] == 15
+    assert us['discount'] == pytest.approx(0)
+    assert len(engine.table) == len(engine.countries) * len(engine.tiers)
+    assert engine.lookup('XX') is None
+
+def test_ppp_discount_and_cannibalization(engine):
+    """Low-PPP markets get discounts and the cheapest region loses nothing to leakage"""
+    india = engine.lookup('IN', 'pro')
+    cheapest = engine.table.loc[engine.table.groupby('tier')['price_usd'].idxmin()]
+
+    assert india['price_usd'] < 10
+    assert (cheapest['cannibalized_revenue'] == 0).all()
+    assert engine.summary()['uplift_vs_uniform'] > 0
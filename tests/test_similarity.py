@@ -0,0 +1,38 @@
+import pytest
+import numpy as np
+import pandas as pd
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from similarity import SimilarityIndex
+
+@pytest.fixture
+def vectors():
+    rng = np.random.default_rng(3)
+    centers = rng.normal(size=(20, 8))
+    values = centers[rng.integers(0, 20, 3000)] + rng.normal(0, 0.2, (3000, 8))
+    return pd.DataFrame(values, index=[f'p{i}' for i in range(3000)])
+
+def test_query_matches_blocked_matrix(vectors):
+    """Exact top-k agrees with the cached full matrix for both metrics"""
+    index = SimilarityIndex(vectors, block_size=500)
+    cosine = index.matrix('cosine')['p7'].drop('p7')
+    euclidean = index.matrix('euclidean')['p7'].drop('p7')
+
+    assert list(index.query('p7', 5, 'cosine')['competitor_id']) == list(cosine.nlargest(5).index)
+    assert list(index.query('p7', 5, 'euclidean')['competitor_id']) == list(euclidean.nsmallest(5).index)
+    assert index.matrix('cosine') is index.matrix('cosine')
+
+def test_approximate_query_recall(vectors):
+    """Random-projection candidates recover most exact neighbors"""
+    index = SimilarityIndex(vectors, approximate_threshold=1000)
+    recall = []
+    for target in ['p1', 'p2', 'p3', 'p4', 'p5']:
+        approx = set(index.query(target, 10)['competitor_id'])
+        exact = set(index.query(target, 10, approximate=False)['competitor_id'])
+        recall.append(len(approx & exact) / 10)
+
+    assert np.mean(recall) >= 0.8
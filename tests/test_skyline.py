@@ -0,0 +1,33 @@
+import pytest
+import numpy as np
+import pandas as pd
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from skyline import CompetitiveSkyline, dominance_matrix
+
+@pytest.fixture
+def points():
+    rng = np.random.default_rng(7)
+    return pd.DataFrame(rng.integers(0, 6, (500, 4)).astype(float), columns=list('abcd'))
+
+def test_frontier_matches_brute_force(points):
+    """Block sort-filter skyline agrees with all-pairs dominance"""
+    skyline = CompetitiveSkyline(block_size=64).fit(points, minimize=['d'])
+    oriented = points.to_numpy() * np.array([1, 1, 1, -1])
+    brute = ~dominance_matrix(oriented, oriented).any(axis=0)
+
+    assert (skyline.on_skyline == brute).all()
+    counts = skyline.dominance_counts()
+    assert (counts.loc[counts['on_frontier'], 'dominated_by'] == 0).all()
+
+def test_insert_updates_frontier(points):
+    """A product better on every dimension replaces the whole frontier"""
+    skyline = CompetitiveSkyline().fit(points)
+
+    assert skyline.insert('new', {'a': 9, 'b': 9, 'c': 9, 'd': 9})
+    assert skyline.frontier() == ['new']
+    assert not skyline.insert('weak', {'a': 0, 'b': 0, 'c': 0, 'd': 0})
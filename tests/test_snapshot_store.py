@@ -0,0 +1,47 @@
+import pytest
+import pandas as pd
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from snapshot_store import LandscapeSnapshotStore
+
+@pytest.fixture
+def store(tmp_path):
+    store = LandscapeSnapshotStore(tmp_path / 'snapshots')
+    positioning = pd.DataFrame({
+        'competitor_id': ['a', 'b'],
+        'x_specialization': [2.0, 6.0],
+        'y_user_type': [3.0, 2.0],
+    })
+    features = pd.DataFrame({
+        'competitor_id': ['a', 'a', 'b', 'b'],
+        'feature': ['Search Quality', 'Mobile App'] * 2,
+        'score': [7, 5, 6, 8],
+    })
+    store.record('2025-01-01', positioning=positioning, features=features)
+
+    positioning.loc[0, 'x_specialization'] = 4.0
+    positioning.loc[2] = ['c', 8.0, 1.0]
+    features.loc[1, 'score'] = 9
+    store.record('2025-04-01', positioning=positioning, features=features)
+    return store
+
+def test_only_deltas_are_stored(store):
+    """The second run writes just the changed rows"""
+    changes = store.snapshots['changes'].tolist()
+
+    assert changes[0] == {'positioning': 2, 'features': 4}
+    assert changes[1] == {'positioning': 2, 'features': 1}
+
+def test_diff_and_state_from_reopened_store(store):
+    """Diffs and past states are rebuilt from the manifest on disk"""
+    reopened = LandscapeSnapshotStore(store.root)
+    changes = reopened.diff('2025-01-01', '2025-04-01')
+
+    assert changes['new_competitors'] == ['c']
+    assert changes['moved']['competitor_id'].tolist() == ['a']
+    assert changes['feature_changes'][['feature', 'change']].values.tolist() == [['Mobile App', 4]]
+    assert reopened.state('features', '2025-01-01')['score'].tolist() == [7, 5, 6, 8]
@@ -0,0 +1,53 @@
+import pytest
+import pandas as pd
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from swot_knowledge_base import SwotKnowledgeBase
+
+@pytest.fixture
+def knowledge_base(tmp_path):
+    path = tmp_path / 'swot.yaml'
+    path.write_text(
+        "competitors:\n"
+        "  - competitor_id: b\n"
+        "    name: B\n"
+        "    factors:\n"
+        "      - {category: Threats, factor: Price war, impact: High, implications: x, tags: [pricing]}\n"
+        "      - {category: Strengths, factor: Brand, impact: Medium, implications: y}\n"
+        "  - competitor_id: a\n"
+        "    name: A\n"
+        "    factors:\n"
+        "      - {category: Threats, factor: Privacy rules, impact: Medium, implications: z, tags: [privacy, pricing]}\n"
+    )
+    return SwotKnowledgeBase(path)
+
+def test_filters_keep_knowledge_base_order(knowledge_base):
+    """Index lookups return rows in file order and intersect across fields"""
+    threats = knowledge_base.filter(category='Threats')
+    assert threats['factor'].tolist() == ['Price war', 'Privacy rules']
+
+    assert knowledge_base.filter(tags='pricing')['competitor_id'].tolist() == ['b', 'a']
+    assert knowledge_base.filter(tags='pricing', impact='Medium')['factor'].tolist() == ['Privacy rules']
+    assert knowledge_base.filter(competitor_id=['a', 'b'], category='Opportunities').empty
+
+def test_parquet_round_trip(knowledge_base, tmp_path):
+    """The flat Parquet form loads to the same table"""
+    reloaded = SwotKnowledgeBase(knowledge_base.to_parquet(tmp_path / 'swot.parquet'))
+    pd.testing.assert_frame_equal(reloaded.table, knowledge_base.table)
+    assert reloaded.filter(tags='privacy')['factor'].tolist() == ['Privacy rules']
+
+def test_rejects_unknown_impact(tmp_path):
+    path = tmp_path / 'bad.yaml'
+    path.write_text(
+        "competitors:\n"
+        "  - competitor_id: a\n"
+        "    name: A\n"
+        "    factors:\n"
+        "      - {category: Threats, factor: f, impact: Severe, implications: i}\n"
+    )
+    with pytest.raises(ValueError, match='impact'):
+        SwotKnowledgeBase(path).table
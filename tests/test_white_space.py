@@ -0,0 +1,42 @@
+import pytest
+import numpy as np
+import pandas as pd
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from white_space import WhiteSpaceEngine
+
+@pytest.fixture
+def positioning():
+    return pd.DataFrame({
+        'name': ['A', 'B', 'C', 'D'],
+        'x_specialization': [1.0, 4.0, 5.0, 10.0],
+        'y_user_type': [1.0, 6.0, 2.0, 3.0],
+    })
+
+def test_quadrants_use_half_open_cells(positioning):
+    """Products on x=5 count as specialist; x=10 falls outside every quadrant"""
+    quadrants = WhiteSpaceEngine().quadrant_counts(positioning)
+
+    assert quadrants['generalist_individual']['competitors'] == ['A']
+    assert quadrants['generalist_team']['competitors'] == ['B']
+    assert quadrants['specialist_individual']['competitors'] == ['C']
+    assert quadrants['specialist_team']['competitor_count'] == 0
+
+def test_empty_regions_avoid_products(positioning):
+    """Rectangles contain no product and the best candidate is clear of all of them"""
+    engine = WhiteSpaceEngine()
+    rectangles = engine.largest_empty_rectangles(positioning, bins=10)
+    x, y = positioning['x_specialization'].values, positioning['y_user_type'].values
+
+    for _, r in rectangles.iterrows():
+        inside = (x >= r['x_min']) & (x < r['x_max']) & (y >= r['y_min']) & (y < r['y_max'])
+        assert not inside.any()
+
+    best = engine.rank_candidates(positioning, bins=50).iloc[0]
+    distances = np.hypot(x - best['x'], y - best['y'])
+    assert distances.min() == pytest.approx(best['nearest_distance'])
+    assert best['clearance'] > 2